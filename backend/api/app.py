@@ -9,7 +9,9 @@ from litestar.openapi import OpenAPIConfig
 from litestar.stores.redis import RedisStore
 
 from backend.api.routes import routes
-from backend.config import settings
+from backend.config import get_settings
+from backend.infrastructure.codeforces_client import close_http_client
+from backend.infrastructure.redis_client import close_redis_pool, get_redis_client
 
 
 def create_app() -> Litestar:
@@ -18,12 +20,15 @@ def create_app() -> Litestar:
     # Configure logging
     logging.basicConfig(level=logging.INFO, format="%(message)s")
 
-    # Configure stores (using RedisStore for production caching)
+    # Configure stores (using RedisStore for production caching); they share the
+    # application's Redis connection pool, which is closed on shutdown
     stores = {
-        "default": RedisStore.with_client(url=settings.redis_url),
-        "rate_limit": RedisStore.with_client(url=settings.redis_url),
+        "default": RedisStore(get_redis_client()),
+        "rate_limit": RedisStore(get_redis_client()),
     }
 
+    settings = get_settings()
+
     # Configure rate limiting
     rate_limit_config = RateLimitConfig(
         rate_limit=(settings.rate_limit_period, settings.rate_limit_requests),
@@ -53,4 +58,5 @@ def create_app() -> Litestar:
             description="API for Codeforces profile analysis",
             root_schema_site="elements",
         ),
+        on_shutdown=[close_http_client, close_redis_pool],
     )
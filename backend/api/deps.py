@@ -1,8 +1,5 @@
 """API dependencies."""
 
-from typing import Any, Dict
-
-from litestar import Request
 from litestar.di import Provide
 from redis.asyncio import Redis
 
@@ -14,61 +11,68 @@ from backend.domain.services.tags_service import TagsService
 from backend.infrastructure.task_queue import TaskQueue
 from backend.infrastructure.redis_client import get_redis_client
 
+# Services hold no per-request state, so a single instance is shared by all requests
+_codeforces_data_service = CodeforcesDataService()
+_abandoned_problems_service = AbandonedProblemsService()
+_tags_service = TagsService()
+_daily_activity_service = DailyActivityService()
+_difficulty_distribution_service = DifficultyDistributionService()
+
+# Task queue is created on first use; the Redis client it wraps is shared process-wide
+_task_queue: TaskQueue | None = None
+
 
 def get_codeforces_data_service() -> CodeforcesDataService:
     """Dependency provider for CodeforcesDataService."""
-    return CodeforcesDataService()
+    return _codeforces_data_service
 
 
 def get_abandoned_problems_service() -> AbandonedProblemsService:
     """Dependency provider for AbandonedProblemsService."""
-    return AbandonedProblemsService()
+    return _abandoned_problems_service
 
 
 def get_tags_service() -> TagsService:
     """Dependency provider for TagsService."""
-    return TagsService()
+    return _tags_service
 
 
 def get_daily_activity_service() -> DailyActivityService:
     """Dependency provider for DailyActivityService."""
-    return DailyActivityService()
+    return _daily_activity_service
 
 
 def get_difficulty_distribution_service() -> DifficultyDistributionService:
     """Dependency provider for DifficultyDistributionService."""
-    return DifficultyDistributionService()
+    return _difficulty_distribution_service
 
 
 async def get_redis() -> Redis:
     """Dependency provider for Redis client."""
-    return await get_redis_client()
+    return get_redis_client()
 
 
 async def get_task_queue() -> TaskQueue:
     """Dependency provider for TaskQueue."""
-    redis = await get_redis_client()
-    return TaskQueue(redis)
-
-
-def get_request_metadata(request: Request) -> Dict[str, Any]:
-    """Extract metadata from the request."""
-    return {
-        "user_agent": request.headers.get("user-agent"),
-        "ip": request.client.host if request.client else None,
-    }
+    global _task_queue
+    if _task_queue is None:
+        _task_queue = TaskQueue(await get_redis())
+    return _task_queue
 
 
 # Dependency providers for route handlers
-codeforces_data_service_dependency = Provide(get_codeforces_data_service, sync_to_thread=False)
-daily_activity_service_dependency = Provide(get_daily_activity_service, sync_to_thread=False)
+codeforces_data_service_dependency = Provide(
+    get_codeforces_data_service, use_cache=True, sync_to_thread=False
+)
+daily_activity_service_dependency = Provide(
+    get_daily_activity_service, use_cache=True, sync_to_thread=False
+)
 abandoned_problems_service_dependency = Provide(
-    get_abandoned_problems_service, sync_to_thread=False
+    get_abandoned_problems_service, use_cache=True, sync_to_thread=False
 )
 difficulty_distribution_service_dependency = Provide(
-    get_difficulty_distribution_service, sync_to_thread=False
+    get_difficulty_distribution_service, use_cache=True, sync_to_thread=False
 )
-tags_service_dependency = Provide(get_tags_service, sync_to_thread=False)
-request_metadata_dependency = Provide(get_request_metadata, sync_to_thread=False)
-redis_dependency = Provide(get_redis)
-task_queue_dependency = Provide(get_task_queue)
+tags_service_dependency = Provide(get_tags_service, use_cache=True, sync_to_thread=False)
+redis_dependency = Provide(get_redis, use_cache=True)
+task_queue_dependency = Provide(get_task_queue, use_cache=True)
@@ -1,19 +1,38 @@
-"""API routes package."""
-
-from backend.api.routes.abandoned_problems import AbandonedProblemsController
-from backend.api.routes.base import BaseMetricController
-from backend.api.routes.daily_activity import DailyActivityController
-from backend.api.routes.difficulty_distribution import DifficultyDistributionController
-from backend.api.routes.tags import TagsController
-from backend.api.routes.tasks import TaskController
-
-routes = [
-    AbandonedProblemsController,
-    DailyActivityController,
-    DifficultyDistributionController,
-    TagsController,
-    TaskController,
-]
+"""
+API routes package.
+
+Controllers are imported on first attribute access (PEP 562), so importing a single
+routes module such as backend.api.routes.base does not load every controller.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from backend.api.routes.abandoned_problems import AbandonedProblemsController
+    from backend.api.routes.base import BaseMetricController
+    from backend.api.routes.daily_activity import DailyActivityController
+    from backend.api.routes.difficulty_distribution import DifficultyDistributionController
+    from backend.api.routes.tags import TagsController
+    from backend.api.routes.tasks import TaskController
+
+_CONTROLLER_MODULES = {
+    "AbandonedProblemsController": "backend.api.routes.abandoned_problems",
+    "BaseMetricController": "backend.api.routes.base",
+    "DailyActivityController": "backend.api.routes.daily_activity",
+    "DifficultyDistributionController": "backend.api.routes.difficulty_distribution",
+    "TagsController": "backend.api.routes.tags",
+    "TaskController": "backend.api.routes.tasks",
+}
+
+# Controllers registered with the application, in registration order
+_ROUTE_CONTROLLERS = (
+    "AbandonedProblemsController",
+    "DailyActivityController",
+    "DifficultyDistributionController",
+    "TagsController",
+    "TaskController",
+)
 
 __all__ = [
     "AbandonedProblemsController",
@@ -24,3 +43,16 @@ __all__ = [
     "TaskController",
     "routes",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import controllers, and the routes list built from them, on first access."""
+    if name == "routes":
+        value: Any = [__getattr__(controller) for controller in _ROUTE_CONTROLLERS]
+    elif name in _CONTROLLER_MODULES:
+        value = getattr(import_module(_CONTROLLER_MODULES[name]), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value
+    return value
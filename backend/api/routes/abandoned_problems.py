@@ -1,33 +1,24 @@
 """Abandoned problems API routes."""
 
-import asyncio
-from datetime import datetime, timezone
+from functools import partial
 from typing import Union
 
 from litestar import get
-from litestar.params import Parameter
+from litestar.params import HeaderParameter, Parameter
 from litestar.response import Response
-from litestar.exceptions import HTTPException
 from redis.asyncio import Redis
 
-from backend.api.deps import (
-    abandoned_problems_service_dependency,
-    codeforces_data_service_dependency,
-    redis_dependency,
-    task_queue_dependency,
-)
+from backend.api.deps import abandoned_problems_service_dependency
 from backend.api.routes.base import BaseMetricController
+from backend.domain.models.abandoned_problems import AbandonedProblemsAnalysis
 from backend.domain.models.time_period import TimePeriod
 from backend.api.schemas.abandoned_problems import (
     AbandonedProblemByRatingsResponse,
     AbandonedProblemByTagsResponse,
-    RatingAbandonedSchema,
-    TagAbandonedSchema,
 )
 from backend.api.schemas.common import AsyncTaskResponse
 from backend.domain.services.abandoned_problems_service import AbandonedProblemsService
 from backend.services.codeforces_data_service import CodeforcesDataService
-from backend.infrastructure.codeforces_client import UserNotFoundError
 from backend.infrastructure.task_queue import TaskQueue
 
 
@@ -36,16 +27,12 @@ class AbandonedProblemsController(BaseMetricController):
 
     path = "/abandoned-problems"
     tags = ["Abandoned Problems"]
+    dependencies = {
+        **BaseMetricController.dependencies,
+        "abandoned_service": abandoned_problems_service_dependency,
+    }
 
-    @get(
-        path="/by-tags/{handle:str}",
-        dependencies={
-            "data_service": codeforces_data_service_dependency,
-            "abandoned_service": abandoned_problems_service_dependency,
-            "redis": redis_dependency,
-            "task_queue": task_queue_dependency,
-        },
-    )
+    @get(path="/by-tags/{handle:str}")
     async def get_abandoned_problems_by_tags(
         self,
         handle: str,
@@ -61,6 +48,11 @@ class AbandonedProblemsController(BaseMetricController):
             default=False,
             description="If true, force refresh even if stale data is available",
         ),
+        if_none_match: str | None = HeaderParameter(
+            name="If-None-Match",
+            default=None,
+            description="ETag of a previously returned response",
+        ),
     ) -> Union[Response[AbandonedProblemByTagsResponse], Response[AsyncTaskResponse]]:
         """
         Get problems that user attempted but never solved, grouped by tags.
@@ -72,124 +64,26 @@ class AbandonedProblemsController(BaseMetricController):
             handle: Codeforces handle
             period: Time period to filter submissions by
             prefer_fresh: Force refresh even if stale data exists
+            if_none_match: ETag of a cached copy; answered with 304 if still current
 
         Returns:
             Abandoned problems analysis grouped by tags
             OR 202 Accepted with task_id if data needs to be fetched
         """
-        # Get submissions with staleness check
-        submissions, age, is_stale = await self.get_submissions_with_staleness(redis, handle)
-
-        # Case 1: Fresh data (< 4 hours)
-        if submissions and not is_stale:
-            submissions = self._filter_by_date_range(
-                submissions, start_date=period.to_start_date(now=datetime.now(timezone.utc))
-            )
-            analysis = abandoned_service.analyze_abandoned_problems(handle, submissions)
-
-            tags = [
-                TagAbandonedSchema(
-                    tag=tag_stats.tag,
-                    problem_count=tag_stats.problem_count,
-                    total_failed_attempts=tag_stats.total_failed_attempts,
-                )
-                for tag_stats in analysis.tags_stats
-            ]
-
-            response = AbandonedProblemByTagsResponse(
-                tags=tags,
-                total_abandoned_problems=analysis.total_abandoned,
-                last_updated=self.get_current_timestamp(),
-            )
-
-            return Response(response, headers=self._cache_headers(14400 - age))
-
-        # Case 2: Stale data (4-24 hours) and !prefer_fresh
-        if submissions and is_stale and not prefer_fresh:
-            # Return stale data immediately
-            submissions = self._filter_by_date_range(
-                submissions, start_date=period.to_start_date(now=datetime.now(timezone.utc))
-            )
-            analysis = abandoned_service.analyze_abandoned_problems(handle, submissions)
-
-            tags = [
-                TagAbandonedSchema(
-                    tag=tag_stats.tag,
-                    problem_count=tag_stats.problem_count,
-                    total_failed_attempts=tag_stats.total_failed_attempts,
-                )
-                for tag_stats in analysis.tags_stats
-            ]
-
-            response = AbandonedProblemByTagsResponse(
-                tags=tags,
-                total_abandoned_problems=analysis.total_abandoned,
-                last_updated=self.get_current_timestamp(),
-            )
-
-            # Enqueue background refresh (non-blocking)
-            asyncio.create_task(task_queue.enqueue(handle))
-
-            return Response(
-                response,
-                headers={
-                    **self._cache_headers(0),
-                    "X-Data-Stale": "true",
-                    "X-Data-Age": str(age),
-                },
-            )
-
-        # Case 3: No data or prefer_fresh
-        try:
-            task_id = await task_queue.enqueue(handle)
-            return Response(
-                content=AsyncTaskResponse(
-                    status="processing", task_id=task_id, retry_after=2
-                ).model_dump(),
-                status_code=202,
-            )
-        except Exception:
-            # Fallback: try fetching directly if queue fails
-            try:
-                submissions = await data_service.get_user_submissions(handle)
-            except UserNotFoundError:
-                raise HTTPException(
-                    status_code=404, detail=f"User '{handle}' not found on Codeforces"
-                )
-
-            submissions = self._filter_by_date_range(
-                submissions, start_date=period.to_start_date(now=datetime.now(timezone.utc))
-            )
-            self._validate_submissions_exist(submissions, handle)
-
-            analysis = abandoned_service.analyze_abandoned_problems(handle, submissions)
-
-            tags = [
-                TagAbandonedSchema(
-                    tag=tag_stats.tag,
-                    problem_count=tag_stats.problem_count,
-                    total_failed_attempts=tag_stats.total_failed_attempts,
-                )
-                for tag_stats in analysis.tags_stats
-            ]
-
-            response = AbandonedProblemByTagsResponse(
-                tags=tags,
-                total_abandoned_problems=analysis.total_abandoned,
-                last_updated=self.get_current_timestamp(),
-            )
-
-            return Response(response, headers=self._cache_headers(14400))
-
-    @get(
-        path="/by-ratings/{handle:str}",
-        dependencies={
-            "data_service": codeforces_data_service_dependency,
-            "abandoned_service": abandoned_problems_service_dependency,
-            "redis": redis_dependency,
-            "task_queue": task_queue_dependency,
-        },
-    )
+        return await self._serve_cached(
+            redis,
+            task_queue,
+            data_service,
+            handle,
+            prefer_fresh,
+            start_date=self._period_start(period),
+            analyze=partial(abandoned_service.analyze_abandoned_problems, handle),
+            build_response=self._build_by_tags_response,
+            cache_key=self._response_cache_key("abandoned-problems:by-tags", handle, period),
+            if_none_match=if_none_match,
+        )
+
+    @get(path="/by-ratings/{handle:str}")
     async def get_abandoned_problems_by_ratings(
         self,
         handle: str,
@@ -205,6 +99,11 @@ class AbandonedProblemsController(BaseMetricController):
             default=False,
             description="If true, force refresh even if stale data is available",
         ),
+        if_none_match: str | None = HeaderParameter(
+            name="If-None-Match",
+            default=None,
+            description="ETag of a previously returned response",
+        ),
     ) -> Union[Response[AbandonedProblemByRatingsResponse], Response[AsyncTaskResponse]]:
         """
         Get problems that user attempted but never solved, grouped by rating bins.
@@ -216,111 +115,41 @@ class AbandonedProblemsController(BaseMetricController):
             handle: Codeforces handle
             period: Time period to filter submissions by
             prefer_fresh: Force refresh even if stale data exists
+            if_none_match: ETag of a cached copy; answered with 304 if still current
 
         Returns:
             Abandoned problems analysis grouped by rating bins
             OR 202 Accepted with task_id if data needs to be fetched
         """
-        # Get submissions with staleness check
-        submissions, age, is_stale = await self.get_submissions_with_staleness(redis, handle)
-
-        # Case 1: Fresh data (< 4 hours)
-        if submissions and not is_stale:
-            submissions = self._filter_by_date_range(
-                submissions, start_date=period.to_start_date(now=datetime.now(timezone.utc))
-            )
-            analysis = abandoned_service.analyze_abandoned_problems(handle, submissions)
-
-            ratings = [
-                RatingAbandonedSchema(
-                    rating=rating_stats.rating,
-                    problem_count=rating_stats.problem_count,
-                    total_failed_attempts=rating_stats.total_failed_attempts,
-                )
-                for rating_stats in analysis.ratings_stats
-            ]
-
-            response = AbandonedProblemByRatingsResponse(
-                ratings=ratings,
-                total_abandoned_problems=analysis.total_abandoned,
-                last_updated=self.get_current_timestamp(),
-            )
-
-            return Response(response, headers=self._cache_headers(14400 - age))
-
-        # Case 2: Stale data (4-24 hours) and !prefer_fresh
-        if submissions and is_stale and not prefer_fresh:
-            # Return stale data immediately
-            submissions = self._filter_by_date_range(
-                submissions, start_date=period.to_start_date(now=datetime.now(timezone.utc))
-            )
-            analysis = abandoned_service.analyze_abandoned_problems(handle, submissions)
-
-            ratings = [
-                RatingAbandonedSchema(
-                    rating=rating_stats.rating,
-                    problem_count=rating_stats.problem_count,
-                    total_failed_attempts=rating_stats.total_failed_attempts,
-                )
-                for rating_stats in analysis.ratings_stats
-            ]
-
-            response = AbandonedProblemByRatingsResponse(
-                ratings=ratings,
-                total_abandoned_problems=analysis.total_abandoned,
-                last_updated=self.get_current_timestamp(),
-            )
-
-            # Enqueue background refresh (non-blocking)
-            asyncio.create_task(task_queue.enqueue(handle))
-
-            return Response(
-                response,
-                headers={
-                    **self._cache_headers(0),
-                    "X-Data-Stale": "true",
-                    "X-Data-Age": str(age),
-                },
-            )
-
-        # Case 3: No data or prefer_fresh
-        try:
-            task_id = await task_queue.enqueue(handle)
-            return Response(
-                content=AsyncTaskResponse(
-                    status="processing", task_id=task_id, retry_after=2
-                ).model_dump(),
-                status_code=202,
-            )
-        except Exception:
-            # Fallback: try fetching directly if queue fails
-            try:
-                submissions = await data_service.get_user_submissions(handle)
-            except UserNotFoundError:
-                raise HTTPException(
-                    status_code=404, detail=f"User '{handle}' not found on Codeforces"
-                )
-
-            submissions = self._filter_by_date_range(
-                submissions, start_date=period.to_start_date(now=datetime.now(timezone.utc))
-            )
-            self._validate_submissions_exist(submissions, handle)
-
-            analysis = abandoned_service.analyze_abandoned_problems(handle, submissions)
-
-            ratings = [
-                RatingAbandonedSchema(
-                    rating=rating_stats.rating,
-                    problem_count=rating_stats.problem_count,
-                    total_failed_attempts=rating_stats.total_failed_attempts,
-                )
-                for rating_stats in analysis.ratings_stats
-            ]
-
-            response = AbandonedProblemByRatingsResponse(
-                ratings=ratings,
-                total_abandoned_problems=analysis.total_abandoned,
-                last_updated=self.get_current_timestamp(),
-            )
-
-            return Response(response, headers=self._cache_headers(14400))
+        return await self._serve_cached(
+            redis,
+            task_queue,
+            data_service,
+            handle,
+            prefer_fresh,
+            start_date=self._period_start(period),
+            analyze=partial(abandoned_service.analyze_abandoned_problems, handle),
+            build_response=self._build_by_ratings_response,
+            cache_key=self._response_cache_key("abandoned-problems:by-ratings", handle, period),
+            if_none_match=if_none_match,
+        )
+
+    def _build_by_tags_response(
+        self, analysis: AbandonedProblemsAnalysis
+    ) -> AbandonedProblemByTagsResponse:
+        """Build by-tags response schema from analysis result."""
+        return AbandonedProblemByTagsResponse(
+            tags=analysis.tags_stats,
+            total_abandoned_problems=analysis.total_abandoned,
+            last_updated=self.get_current_timestamp(),
+        )
+
+    def _build_by_ratings_response(
+        self, analysis: AbandonedProblemsAnalysis
+    ) -> AbandonedProblemByRatingsResponse:
+        """Build by-ratings response schema from analysis result."""
+        return AbandonedProblemByRatingsResponse(
+            ratings=analysis.ratings_stats,
+            total_abandoned_problems=analysis.total_abandoned,
+            last_updated=self.get_current_timestamp(),
+        )
@@ -1,17 +1,137 @@
-import json
+import asyncio
+import time
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
 from datetime import datetime, timezone
+from functools import lru_cache, partial
+from types import MappingProxyType
+from typing import Any, Callable, Mapping
 
 from litestar import Controller
+from litestar.enums import MediaType
 from litestar.exceptions import HTTPException
+from litestar.response import Response
+from pydantic import BaseModel
 from redis.asyncio import Redis
 
+from backend.api.deps import (
+    codeforces_data_service_dependency,
+    redis_dependency,
+    task_queue_dependency,
+)
+from backend.api.schemas.common import AsyncTaskResponse
 from backend.domain.models.codeforces import Submission
+from backend.domain.models.time_period import TimePeriod
+from backend.infrastructure.codeforces_client import UserNotFoundError
+from backend.infrastructure.submissions_codec import (
+    decode_submissions,
+    sort_newest_first,
+    submissions_age,
+)
+from backend.infrastructure.task_queue import TaskQueue
+from backend.services.codeforces_data_service import CodeforcesDataService
+
+
+def _negated_creation_time(submission: Submission) -> int:
+    """Sort key under which newest-first submissions are in ascending order."""
+    return -submission.creation_time_seconds
+
+
+# Decoded submissions per handle, tagged with the absolute expiry (PEXPIRETIME) of the
+# Redis payload they came from. Every rewrite of submissions:{handle} sets a new expiry,
+# so an unchanged expiry means the decoded list is still current. Entries are shared
+# between requests and must be treated as read-only.
+_SUBMISSIONS_MEMO: OrderedDict[str, tuple[int, list[Submission]]] = OrderedDict()
+_SUBMISSIONS_MEMO_SIZE = 256
+
+
+def _remember_submissions(handle: str, expires_at: int, submissions: list[Submission]) -> None:
+    """Store decoded submissions in the memo, evicting the least recently used handle."""
+    _SUBMISSIONS_MEMO[handle] = (expires_at, submissions)
+    _SUBMISSIONS_MEMO.move_to_end(handle)
+    if len(_SUBMISSIONS_MEMO) > _SUBMISSIONS_MEMO_SIZE:
+        _SUBMISSIONS_MEMO.popitem(last=False)
+
+
+# Seconds a handle that Codeforces reported as missing is remembered under
+# notfound:{handle}, so repeated requests for it do not reach the Codeforces API
+_NOT_FOUND_TTL = 300
+
+
+# Direct Codeforces fetches currently running, keyed by handle. Concurrent fallback
+# requests for the same handle await the one shared fetch instead of issuing their own.
+_INFLIGHT_FETCHES: dict[str, asyncio.Future[list[Submission]]] = {}
+
+
+def _fetch_done(handle: str, fetch: asyncio.Future[list[Submission]]) -> None:
+    """Forget a finished fetch and retrieve its exception so it is not reported."""
+    _INFLIGHT_FETCHES.pop(handle, None)
+    if not fetch.cancelled():
+        fetch.exception()
+
+
+# Response bodies currently being built, keyed by cache key and the expiry of the
+# submissions payload they are built from. Concurrent misses on the same body await
+# the one shared build instead of each repeating the analysis.
+_INFLIGHT_BODIES: dict[tuple[str, int], asyncio.Future[bytes]] = {}
+
+
+def _build_done(key: tuple[str, int], body: asyncio.Future[bytes]) -> None:
+    """Forget a finished body build and retrieve its exception so it is not reported."""
+    _INFLIGHT_BODIES.pop(key, None)
+    if not body.cancelled():
+        body.exception()
+
+
+# Background refresh enqueues currently running, keyed by handle. Also keeps a strong
+# reference to each task, since the event loop only holds weak ones.
+_PENDING_REFRESHES: dict[str, asyncio.Task[str]] = {}
+# Upper bound on concurrent background refreshes. Past it, stale hits skip scheduling;
+# the data is still served, and a later stale hit schedules the refresh instead.
+_MAX_PENDING_REFRESHES = 32
+
+
+def _refresh_done(handle: str, task: asyncio.Task[str]) -> None:
+    """Forget a finished refresh and retrieve its exception so it is not reported."""
+    _PENDING_REFRESHES.pop(handle, None)
+    if not task.cancelled():
+        task.exception()
+
+
+# Fresh responses advertise their remaining lifetime rounded down to whole minutes, so
+# at most 241 distinct header mappings (0..14400 in steps of 60) ever exist
+_MAX_AGE_QUANTUM = 60
+
+
+@lru_cache(maxsize=256)
+def _max_age_headers(max_age: int) -> Mapping[str, str]:
+    """Build the read-only Cache-Control mapping for one max-age bucket."""
+    return MappingProxyType({"Cache-Control": f"public, max-age={max_age}"})
+
+
+@lru_cache(maxsize=1)
+def _utc_second(second: int) -> datetime:
+    """Build the UTC datetime for a Unix second; memoized for the current second."""
+    return datetime.fromtimestamp(second, timezone.utc)
+
+
+# Read-only so they can be shared between responses
+_FRESH_CACHE_HEADERS = _max_age_headers(14400)
+_STALE_CACHE_HEADERS = _max_age_headers(0)
+_STALE_DATA_HEADERS = MappingProxyType({**_STALE_CACHE_HEADERS, "X-Data-Stale": "true"})
 
 
 class BaseMetricController(Controller):
     """Base class for all metric controllers with shared functionality."""
 
-    CACHE_HEADERS = {"Cache-Control": "public, max-age=14400"}
+    # Dependencies of _serve_cached; subclasses add their analysis service
+    dependencies = {
+        "data_service": codeforces_data_service_dependency,
+        "redis": redis_dependency,
+        "task_queue": task_queue_dependency,
+    }
+
+    CACHE_HEADERS = _FRESH_CACHE_HEADERS
 
     @staticmethod
     def _filter_by_date_range(
@@ -22,25 +142,32 @@ class BaseMetricController(Controller):
         """
         Filter submissions by date range.
 
+        Submissions must be ordered newest first. Cached lists are: the worker
+        sorts them before writing and the codec sorts legacy payloads on decode.
+        Each bound is located by binary search and the range is sliced out without
+        scanning the whole history.
+
         Args:
-            submissions: List of submissions to filter
+            submissions: List of submissions to filter, newest first
             start_date: Optional start date (inclusive)
             end_date: Optional end date (inclusive)
 
         Returns:
             Filtered list of submissions
         """
-        filtered = submissions
-
-        if start_date is not None:
-            start_timestamp = int(start_date.timestamp())
-            filtered = [s for s in filtered if s.creation_time_seconds >= start_timestamp]
+        if start_date is None and end_date is None:
+            return submissions
 
+        # Negated creation times ascend along the list, as bisect requires
+        low = 0
+        high = len(submissions)
         if end_date is not None:
-            end_timestamp = int(end_date.timestamp())
-            filtered = [s for s in filtered if s.creation_time_seconds <= end_timestamp]
-
-        return filtered
+            low = bisect_left(submissions, -int(end_date.timestamp()), key=_negated_creation_time)
+        if start_date is not None:
+            high = bisect_right(
+                submissions, -int(start_date.timestamp()), lo=low, key=_negated_creation_time
+            )
+        return submissions[low:high]
 
     @staticmethod
     def _validate_submissions_exist(submissions: list[Submission], handle: str) -> None:
@@ -60,67 +187,488 @@ class BaseMetricController(Controller):
                 detail=f"No submissions found for user '{handle}' in the specified date range",
             )
 
+    @staticmethod
+    def _user_not_found(handle: str) -> HTTPException:
+        """
+        Build the 404 error for a handle that does not exist on Codeforces.
+
+        Args:
+            handle: User handle for error message
+
+        Returns:
+            HTTPException to raise
+        """
+        return HTTPException(status_code=404, detail=f"User '{handle}' not found on Codeforces")
+
     @staticmethod
     def get_current_timestamp() -> datetime:
         """
         Get current UTC timestamp.
 
+        The datetime is built once per second and shared by every request in that
+        second.
+
         Returns:
-            Current datetime in UTC timezone
+            Current datetime in UTC timezone, truncated to whole seconds
         """
-        return datetime.now(timezone.utc)
+        return _utc_second(int(time.time()))
+
+    @classmethod
+    def _period_start(cls, period: TimePeriod) -> datetime | None:
+        """
+        Get the start date of a time period relative to now.
+
+        Args:
+            period: Requested time period
+
+        Returns:
+            Start datetime, or None for ALL_TIME (without reading the clock)
+        """
+        if period is TimePeriod.ALL_TIME:
+            return None
+        return period.to_start_date(now=cls.get_current_timestamp())
 
     @staticmethod
     async def get_submissions_with_staleness(
         redis: Redis, handle: str
-    ) -> tuple[list[Submission] | None, int, bool]:
+    ) -> tuple[list[Submission] | None, int, bool, int]:
         """
         Get submissions from cache with staleness information.
 
+        Decoded submissions are memoized in-process per cache generation, so repeated
+        requests for the same handle skip both the payload transfer and the decoding.
+
         Args:
             redis: Redis client instance
             handle: Codeforces user handle
 
         Returns:
-            Tuple of (submissions, age_seconds, is_stale)
+            Tuple of (submissions, age_seconds, is_stale, expires_at)
             - submissions: List of Submission objects or None if not cached
             - age_seconds: Age of cache in seconds
             - is_stale: True if age > 4 hours (14400 seconds)
+            - expires_at: PEXPIRETIME of the payload the submissions were decoded
+              from, identifying its generation (-2 if not cached)
         """
-        from backend.domain.models.codeforces import Problem
+        key = f"submissions:{handle}"
+        memo = _SUBMISSIONS_MEMO.get(handle)
 
-        cached = await redis.get(f"submissions:{handle}")
-        if not cached:
-            return None, 0, False
+        # Without a memo entry the payload is needed anyway, so it is read together with
+        # its TTL and expiry in a single atomic round trip
+        async with redis.pipeline(transaction=True) as pipe:
+            pipe.ttl(key)
+            pipe.pexpiretime(key)
+            pipe.get(f"submissions_ttl:{handle}")
+            if memo is None:
+                pipe.get(key)
+            ttl, expires_at, full_ttl, *payload = await pipe.execute()
 
-        ttl = await redis.ttl(f"submissions:{handle}")
-        if ttl < 0:  # Key exists but has no TTL or expired
-            return None, 0, False
+        if ttl < 0:  # Key does not exist or has no TTL
+            return None, 0, False, -2
 
-        age = 86400 - ttl  # 24h - remaining TTL = age
+        age = submissions_age(ttl, full_ttl)
         is_stale = age > 14400  # 4 hours
 
+        if memo is not None:
+            if memo[0] == expires_at:
+                _SUBMISSIONS_MEMO.move_to_end(handle)
+                return memo[1], age, is_stale, expires_at
+            # A new generation: read it again with the payload, so the payload and
+            # expires_at stay from the same atomic read
+            del _SUBMISSIONS_MEMO[handle]
+            return await BaseMetricController.get_submissions_with_staleness(redis, handle)
+
+        cached = payload[0]
+        if not cached:
+            return None, 0, False, -2
+
         # Deserialize submissions
-        submissions_data = json.loads(cached)
-        submissions = []
-        for s in submissions_data:
-            # Convert nested problem dict to Problem object
-            problem_data = s.pop("problem")
-            problem = Problem(**problem_data)
-            submission = Submission(problem=problem, **s)
-            submissions.append(submission)
+        submissions = decode_submissions(cached)
+        if submissions is None:
+            return None, 0, False, -2
+        _remember_submissions(handle, expires_at, submissions)
+
+        return submissions, age, is_stale, expires_at
+
+    @staticmethod
+    async def fetch_submissions_once(
+        data_service: CodeforcesDataService, handle: str
+    ) -> list[Submission]:
+        """
+        Fetch submissions directly from Codeforces, sharing in-flight fetches per handle.
+
+        Args:
+            data_service: Codeforces data service
+            handle: Codeforces user handle
+
+        Returns:
+            List of submissions
+
+        Raises:
+            UserNotFoundError: If the user doesn't exist
+        """
+        fetch = _INFLIGHT_FETCHES.get(handle)
+        if fetch is None:
+            fetch = asyncio.ensure_future(data_service.get_user_submissions(handle))
+            _INFLIGHT_FETCHES[handle] = fetch
+            fetch.add_done_callback(partial(_fetch_done, handle))
+
+        # Shielded so a cancelled request does not abort the fetch for the other waiters
+        return await asyncio.shield(fetch)
+
+    async def _serve_cached(
+        self,
+        redis: Redis,
+        task_queue: TaskQueue,
+        data_service: CodeforcesDataService,
+        handle: str,
+        prefer_fresh: bool,
+        start_date: datetime | None,
+        analyze: Callable[[list[Submission]], Any],
+        build_response: Callable[[Any], BaseModel],
+        cache_key: str | None = None,
+        if_none_match: str | None = None,
+    ) -> Response:
+        """
+        Serve a metric endpoint from cached submissions, refreshing them as needed.
+
+        Handles the three cases shared by all metric endpoints:
+        - Fresh data (< 4 hours): analyze cached submissions
+        - Stale data (4-24 hours) and !prefer_fresh: analyze cached submissions and
+          enqueue a background refresh
+        - No data or prefer_fresh: enqueue a fetch and return 202 Accepted, falling
+          back to fetching directly if the queue fails
+
+        Args:
+            redis: Redis client
+            task_queue: Task queue for fetch jobs
+            data_service: Codeforces data service for the direct-fetch fallback
+            handle: Codeforces user handle
+            prefer_fresh: Force refresh even if stale data exists
+            start_date: Optional start date for submission filtering (inclusive)
+            analyze: Runs the metric analysis on the filtered submissions
+            build_response: Builds the response schema from the analysis result
+            cache_key: Redis key for the serialized response body, or None to skip it
+            if_none_match: If-None-Match request header, checked against the ETag of
+                cached response bodies
+
+        Returns:
+            Metric response OR 202 Accepted with task_id if data needs to be fetched
+        """
+        cached = await self._get_cached_response(
+            redis, task_queue, handle, cache_key, prefer_fresh, if_none_match
+        )
+        if cached is not None:
+            return cached
+
+        # Get submissions with staleness check; the body built from them is cached and
+        # tagged with the expiry read together with their payload
+        submissions, age, is_stale, expires_at = await self.get_submissions_with_staleness(
+            redis, handle
+        )
+
+        # Case 1: Fresh data (< 4 hours)
+        if submissions and not is_stale:
+            content = await self._build_body_once(
+                redis, cache_key, expires_at, submissions, start_date, analyze, build_response
+            )
+            headers = self._cache_headers(14400 - age)
+
+            return Response(content, headers=self._with_etag(headers, cache_key, expires_at))
+
+        # Case 2: Stale data (4-24 hours) and !prefer_fresh
+        if submissions and is_stale and not prefer_fresh:
+            # Return stale data immediately
+            content = await self._build_body_once(
+                redis, cache_key, expires_at, submissions, start_date, analyze, build_response
+            )
+
+            # Enqueue background refresh (non-blocking)
+            self._schedule_refresh(task_queue, handle)
+
+            headers = self._stale_headers(age)
+            return Response(content, headers=self._with_etag(headers, cache_key, expires_at))
+
+        # Case 3: No data or prefer_fresh
+        # Handles recently reported missing by Codeforces are answered without a fetch
+        if await redis.exists(f"notfound:{handle}"):
+            raise self._user_not_found(handle)
 
-        return submissions, age, is_stale
+        try:
+            task_id = await task_queue.enqueue(handle)
+            return Response(
+                content=AsyncTaskResponse(
+                    status="processing", task_id=task_id, retry_after=2
+                ).model_dump(),
+                status_code=202,
+            )
+        except Exception:
+            # Fallback: try fetching directly if queue fails
+            try:
+                submissions = await self.fetch_submissions_once(data_service, handle)
+            except UserNotFoundError:
+                await redis.setex(f"notfound:{handle}", _NOT_FOUND_TTL, "1")
+                raise self._user_not_found(handle)
+
+            # Not read from the cache, so the date filter's order is not guaranteed yet
+            sort_newest_first(submissions)
+            submissions = self._filter_by_date_range(submissions, start_date=start_date)
+            self._validate_submissions_exist(submissions, handle)
+
+            response = build_response(analyze(submissions))
+            return Response(
+                response.__pydantic_serializer__.to_json(response),
+                media_type=MediaType.JSON,
+                headers=self._cache_headers(14400),
+            )
+
+    async def _build_body_once(
+        self,
+        redis: Redis,
+        cache_key: str | None,
+        expires_at: int,
+        submissions: list[Submission],
+        start_date: datetime | None,
+        analyze: Callable[[list[Submission]], Any],
+        build_response: Callable[[Any], BaseModel],
+    ) -> bytes:
+        """
+        Analyze submissions and store the response body, sharing in-flight builds.
+
+        Requests that miss the same cached body while it is being built (e.g. right
+        after a refresh of a popular handle) await the first build instead of each
+        running the analysis again.
+
+        Args:
+            redis: Redis client
+            cache_key: Redis key for the serialized response body, or None to skip it
+            expires_at: PEXPIRETIME of submissions:{handle}
+            submissions: Cached submissions of the handle
+            start_date: Optional start date for submission filtering (inclusive)
+            analyze: Runs the metric analysis on the filtered submissions
+            build_response: Builds the response schema from the analysis result
+
+        Returns:
+            Serialized response body
+        """
+
+        async def build() -> bytes:
+            filtered = self._filter_by_date_range(submissions, start_date=start_date)
+            response = build_response(analyze(filtered))
+            return await self._cache_response(redis, cache_key, response, expires_at)
+
+        # Same condition as _cache_response storing the body
+        if cache_key is None or expires_at < 0:
+            return await build()
+
+        key = (cache_key, expires_at)
+        body = _INFLIGHT_BODIES.get(key)
+        if body is None:
+            body = asyncio.ensure_future(build())
+            _INFLIGHT_BODIES[key] = body
+            body.add_done_callback(partial(_build_done, key))
+
+        # Shielded so a cancelled request does not abort the build for the other waiters
+        return await asyncio.shield(body)
 
     @staticmethod
-    def _cache_headers(max_age: int = 14400) -> dict:
+    def _response_cache_key(name: str, handle: str, period: TimePeriod) -> str | None:
+        """
+        Build the Redis key for a pre-serialized response body.
+
+        Only unfiltered (ALL_TIME) responses are cached: filtered periods are windows
+        relative to the current time, so their result changes without new submissions.
+
+        Args:
+            name: Endpoint-specific key part (including any query parameters)
+            handle: Codeforces user handle
+            period: Requested time period
+
+        Returns:
+            Redis key, or None if the response must not be cached
+        """
+        if period is not TimePeriod.ALL_TIME:
+            return None
+        return f"response:{name}:{handle}"
+
+    @classmethod
+    async def _get_cached_response(
+        cls,
+        redis: Redis,
+        task_queue: TaskQueue,
+        handle: str,
+        cache_key: str | None,
+        prefer_fresh: bool,
+        if_none_match: str | None = None,
+    ) -> Response | None:
+        """
+        Serve a pre-serialized response body stored by _cache_response.
+
+        Bodies expire at the same instant as submissions:{handle}, so a matching
+        expiry proves the body was built from the current submissions payload.
+        Stale bodies are served like stale submissions: with X-Data-Stale headers
+        and a background refresh, unless prefer_fresh is set. Clients that already
+        hold the body (matching If-None-Match) get 304 Not Modified without it.
+
+        Args:
+            redis: Redis client
+            task_queue: Task queue used for the background refresh
+            handle: Codeforces user handle
+            cache_key: Redis key of the response body, or None if not cacheable
+            prefer_fresh: Skip stale bodies
+            if_none_match: If-None-Match request header, if any
+
+        Returns:
+            Cached response, or None if there is no usable body
+        """
+        if cache_key is None:
+            return None
+
+        submissions_key = f"submissions:{handle}"
+        async with redis.pipeline(transaction=True) as pipe:
+            pipe.ttl(submissions_key)
+            pipe.pexpiretime(submissions_key)
+            pipe.get(f"submissions_ttl:{handle}")
+            pipe.pexpiretime(cache_key)
+            pipe.get(cache_key)
+            ttl, expires_at, full_ttl, body_expires_at, body = await pipe.execute()
+
+        if ttl < 0 or not body or body_expires_at != expires_at:
+            return None
+
+        age = submissions_age(ttl, full_ttl)
+        if age <= 14400:
+            headers = cls._cache_headers(14400 - age)
+        elif prefer_fresh:
+            return None
+        else:
+            cls._schedule_refresh(task_queue, handle)
+            headers = cls._stale_headers(age)
+
+        etag = cls._etag(expires_at)
+        headers = {**headers, "ETag": etag}
+        if if_none_match is not None and cls._etag_matches(if_none_match, etag):
+            return Response(None, status_code=304, headers=headers)
+
+        return Response(body, media_type=MediaType.JSON, headers=headers)
+
+    @staticmethod
+    async def _cache_response(
+        redis: Redis, cache_key: str | None, response: BaseModel, expires_at: int
+    ) -> bytes:
+        """
+        Serialize a response body and store it until submissions:{handle} expires.
+
+        The body is serialized by pydantic-core straight to JSON bytes whether or not
+        it is cached, which is about twice as fast as Litestar's model encoding and
+        produces the same output.
+
+        Args:
+            redis: Redis client
+            cache_key: Redis key of the response body, or None if not cacheable
+            response: Response schema to serialize
+            expires_at: PEXPIRETIME of the submissions the response was built from
+
+        Returns:
+            Response content as JSON bytes
+        """
+        body = response.__pydantic_serializer__.to_json(response)
+        if cache_key is not None and expires_at >= 0:
+            await redis.set(cache_key, body, pxat=expires_at)
+        return body
+
+    @staticmethod
+    def _etag(expires_at: int) -> str:
+        """
+        Build the ETag of a cached response body.
+
+        The body is derived entirely from the submissions generation (apart from
+        its last_updated timestamp), so the weak tag is that generation's expiry.
+
+        Args:
+            expires_at: PEXPIRETIME of the submissions the body was built from
+
+        Returns:
+            Weak ETag header value
+        """
+        return f'W/"{expires_at}"'
+
+    @staticmethod
+    def _etag_matches(if_none_match: str, etag: str) -> bool:
+        """
+        Check an If-None-Match header against an ETag (weak comparison).
+
+        Args:
+            if_none_match: Header value: "*" or a comma-separated list of ETags
+            etag: ETag of the current representation
+
+        Returns:
+            True if the client's copy is current
+        """
+        opaque = etag.removeprefix("W/")
+        return any(
+            candidate == "*" or candidate.removeprefix("W/") == opaque
+            for candidate in (part.strip() for part in if_none_match.split(","))
+        )
+
+    @classmethod
+    def _with_etag(
+        cls, headers: Mapping[str, str], cache_key: str | None, expires_at: int
+    ) -> Mapping[str, str]:
+        """
+        Add the ETag header when the response body was stored in the cache.
+
+        Args:
+            headers: Cache headers of the response
+            cache_key: Redis key of the response body, or None if not cacheable
+            expires_at: PEXPIRETIME of the submissions the body was built from
+
+        Returns:
+            Headers including ETag for cached bodies, otherwise headers unchanged
+        """
+        # Same condition as _cache_response storing the body
+        if cache_key is None or expires_at < 0:
+            return headers
+        return {**headers, "ETag": cls._etag(expires_at)}
+
+    @staticmethod
+    def _schedule_refresh(task_queue: TaskQueue, handle: str) -> None:
+        """
+        Enqueue a background refresh unless one is already being enqueued for handle
+        or the number of concurrent refreshes is at its limit.
+
+        Args:
+            task_queue: Task queue for fetch jobs
+            handle: Codeforces user handle
+        """
+        if handle in _PENDING_REFRESHES or len(_PENDING_REFRESHES) >= _MAX_PENDING_REFRESHES:
+            return
+        task = asyncio.create_task(task_queue.enqueue(handle))
+        _PENDING_REFRESHES[handle] = task
+        task.add_done_callback(partial(_refresh_done, handle))
+
+    @staticmethod
+    def _cache_headers(max_age: int = 14400) -> Mapping[str, str]:
         """
         Generate cache headers.
 
         Args:
-            max_age: Cache max age in seconds
+            max_age: Cache max age in seconds, rounded down to a whole minute
+
+        Returns:
+            Shared, read-only mapping with the Cache-Control header
+        """
+        return _max_age_headers(max(0, max_age // _MAX_AGE_QUANTUM * _MAX_AGE_QUANTUM))
+
+    @staticmethod
+    def _stale_headers(age: int) -> dict[str, str]:
+        """
+        Generate headers for a response served from stale data.
+
+        Args:
+            age: Age of the cached data in seconds
 
         Returns:
-            Dictionary with Cache-Control header
+            Dictionary with Cache-Control, X-Data-Stale and X-Data-Age headers
         """
-        return {"Cache-Control": f"public, max-age={max_age}"}
+        return {**_STALE_DATA_HEADERS, "X-Data-Age": str(age)}
@@ -1,31 +1,21 @@
 """Daily activity API routes."""
 
-import asyncio
-from datetime import datetime, timezone
+from functools import partial
 from typing import Union
 
 from litestar import get
-from litestar.params import Parameter
+from litestar.params import HeaderParameter, Parameter
 from litestar.response import Response
-from litestar.exceptions import HTTPException
 from redis.asyncio import Redis
 
-from backend.api.deps import (
-    codeforces_data_service_dependency,
-    daily_activity_service_dependency,
-    redis_dependency,
-    task_queue_dependency,
-)
+from backend.api.deps import daily_activity_service_dependency
 from backend.api.routes.base import BaseMetricController
+from backend.domain.models.daily_activity import DailyActivityAnalysis
 from backend.domain.models.time_period import TimePeriod
-from backend.api.schemas.daily_activity import (
-    DailyActivityItemSchema,
-    DailyActivityResponse,
-)
+from backend.api.schemas.daily_activity import DailyActivityResponse
 from backend.api.schemas.common import AsyncTaskResponse
 from backend.domain.services.daily_activity_service import DailyActivityService
 from backend.services.codeforces_data_service import CodeforcesDataService
-from backend.infrastructure.codeforces_client import UserNotFoundError
 from backend.infrastructure.task_queue import TaskQueue
 
 
@@ -34,16 +24,12 @@ class DailyActivityController(BaseMetricController):
 
     path = "/daily-activity"
     tags = ["Daily Activity"]
+    dependencies = {
+        **BaseMetricController.dependencies,
+        "daily_activity_service": daily_activity_service_dependency,
+    }
 
-    @get(
-        path="/{handle:str}",
-        dependencies={
-            "data_service": codeforces_data_service_dependency,
-            "daily_activity_service": daily_activity_service_dependency,
-            "redis": redis_dependency,
-            "task_queue": task_queue_dependency,
-        },
-    )
+    @get(path="/{handle:str}")
     async def get_daily_activity(
         self,
         handle: str,
@@ -59,6 +45,11 @@ class DailyActivityController(BaseMetricController):
             default=False,
             description="If true, force refresh even if stale data is available",
         ),
+        if_none_match: str | None = HeaderParameter(
+            name="If-None-Match",
+            default=None,
+            description="ETag of a previously returned response",
+        ),
     ) -> Union[Response[DailyActivityResponse], Response[AsyncTaskResponse]]:
         """
         Get user's submission activity with adaptive granularity.
@@ -70,68 +61,28 @@ class DailyActivityController(BaseMetricController):
         - half_year/year -> per-month buckets
         - all_time   -> per-year buckets
         """
-        now = datetime.now(timezone.utc)
+        now = self.get_current_timestamp()
         start_date = period.to_start_date(now=now)
 
-        submissions, age, is_stale = await self.get_submissions_with_staleness(redis, handle)
-
-        if submissions and not is_stale:
-            submissions = self._filter_by_date_range(submissions, start_date=start_date)
-            analysis = daily_activity_service.analyze(handle, submissions, period=period, now=now)
-            response = self._build_response(analysis)
-            return Response(response, headers=self._cache_headers(14400 - age))
-
-        if submissions and is_stale and not prefer_fresh:
-            submissions = self._filter_by_date_range(submissions, start_date=start_date)
-            analysis = daily_activity_service.analyze(handle, submissions, period=period, now=now)
-            response = self._build_response(analysis)
-
-            asyncio.create_task(task_queue.enqueue(handle))
-
-            return Response(
-                response,
-                headers={
-                    **self._cache_headers(0),
-                    "X-Data-Stale": "true",
-                    "X-Data-Age": str(age),
-                },
-            )
-
-        try:
-            task_id = await task_queue.enqueue(handle)
-            return Response(
-                content=AsyncTaskResponse(
-                    status="processing", task_id=task_id, retry_after=2
-                ).model_dump(),
-                status_code=202,
-            )
-        except Exception:
-            try:
-                submissions = await data_service.get_user_submissions(handle)
-            except UserNotFoundError:
-                raise HTTPException(
-                    status_code=404, detail=f"User '{handle}' not found on Codeforces"
-                )
-
-            submissions = self._filter_by_date_range(submissions, start_date=start_date)
-            self._validate_submissions_exist(submissions, handle)
-
-            analysis = daily_activity_service.analyze(handle, submissions, period=period, now=now)
-            response = self._build_response(analysis)
-            return Response(response, headers=self._cache_headers(14400))
+        return await self._serve_cached(
+            redis,
+            task_queue,
+            data_service,
+            handle,
+            prefer_fresh,
+            start_date=start_date,
+            analyze=partial(daily_activity_service.analyze, handle, period=period, now=now),
+            build_response=self._build_response,
+            # All-time buckets are yearly and run up to the current year, so the cached
+            # body only stays valid within that year
+            cache_key=self._response_cache_key(f"daily-activity:{now.year}", handle, period),
+            if_none_match=if_none_match,
+        )
 
-    def _build_response(self, analysis) -> DailyActivityResponse:
+    def _build_response(self, analysis: DailyActivityAnalysis) -> DailyActivityResponse:
         """Build response schema from analysis result."""
-        days = [
-            DailyActivityItemSchema(
-                date=day.date,
-                solved_count=day.solved_count,
-                attempt_count=day.attempt_count,
-            )
-            for day in analysis.days
-        ]
         return DailyActivityResponse(
-            days=days,
+            days=[day.to_dict() for day in analysis.days],
             total_solved=analysis.total_solved,
             total_attempts=analysis.total_attempts,
             active_days=analysis.active_days,
@@ -1,28 +1,21 @@
 """Tags API routes."""
 
-import asyncio
-from datetime import datetime, timezone
+from functools import partial
 from typing import Union
 
 from litestar import get
-from litestar.params import Parameter
+from litestar.params import HeaderParameter, Parameter
 from litestar.response import Response
-from litestar.exceptions import HTTPException
 from redis.asyncio import Redis
 
-from backend.api.deps import (
-    codeforces_data_service_dependency,
-    tags_service_dependency,
-    redis_dependency,
-    task_queue_dependency,
-)
+from backend.api.deps import tags_service_dependency
 from backend.api.routes.base import BaseMetricController
+from backend.domain.models.tags import TagsAnalysis
 from backend.domain.models.time_period import TimePeriod
 from backend.api.schemas.tags import SimpleTagInfoSchema, TagsResponse, WeakTagsResponse
 from backend.api.schemas.common import AsyncTaskResponse
 from backend.domain.services.tags_service import TagsService
 from backend.services.codeforces_data_service import CodeforcesDataService
-from backend.infrastructure.codeforces_client import UserNotFoundError
 from backend.infrastructure.task_queue import TaskQueue
 
 
@@ -31,16 +24,9 @@ class TagsController(BaseMetricController):
 
     path = "/tag-ratings"
     tags = ["Tag Ratings"]
+    dependencies = {**BaseMetricController.dependencies, "tags_service": tags_service_dependency}
 
-    @get(
-        path="/{handle:str}",
-        dependencies={
-            "data_service": codeforces_data_service_dependency,
-            "tags_service": tags_service_dependency,
-            "redis": redis_dependency,
-            "task_queue": task_queue_dependency,
-        },
-    )
+    @get(path="/{handle:str}")
     async def get_tag_ratings(
         self,
         handle: str,
@@ -56,6 +42,11 @@ class TagsController(BaseMetricController):
             default=False,
             description="If true, force refresh even if stale data is available",
         ),
+        if_none_match: str | None = HeaderParameter(
+            name="If-None-Match",
+            default=None,
+            description="ETag of a previously returned response",
+        ),
     ) -> Union[Response[TagsResponse], Response[AsyncTaskResponse]]:
         """
         Get user's average and median rating by problem tags.
@@ -67,109 +58,26 @@ class TagsController(BaseMetricController):
             handle: Codeforces handle
             period: Time period to filter submissions by
             prefer_fresh: Force refresh even if stale data exists
+            if_none_match: ETag of a cached copy; answered with 304 if still current
 
         Returns:
             Tag ratings with median and average ratings by tag
             OR 202 Accepted with task_id if data needs to be fetched
         """
-        # Get submissions with staleness check
-        submissions, age, is_stale = await self.get_submissions_with_staleness(redis, handle)
-
-        # Case 1: Fresh data (< 4 hours)
-        if submissions and not is_stale:
-            submissions = self._filter_by_date_range(
-                submissions, start_date=period.to_start_date(now=datetime.now(timezone.utc))
-            )
-            tags_analysis = tags_service.analyze_tags(handle, submissions)
-
-            tags_info = [SimpleTagInfoSchema.model_validate(tag) for tag in tags_analysis.tags]
-
-            response = TagsResponse(
-                tags=tags_info,
-                overall_average_rating=tags_analysis.overall_average_rating,
-                overall_median_rating=tags_analysis.overall_median_rating,
-                total_solved=tags_analysis.total_solved,
-                last_updated=self.get_current_timestamp(),
-            )
-
-            return Response(response, headers=self._cache_headers(14400 - age))
-
-        # Case 2: Stale data (4-24 hours) and !prefer_fresh
-        if submissions and is_stale and not prefer_fresh:
-            # Return stale data immediately
-            submissions = self._filter_by_date_range(
-                submissions, start_date=period.to_start_date(now=datetime.now(timezone.utc))
-            )
-            tags_analysis = tags_service.analyze_tags(handle, submissions)
-
-            tags_info = [SimpleTagInfoSchema.model_validate(tag) for tag in tags_analysis.tags]
-
-            response = TagsResponse(
-                tags=tags_info,
-                overall_average_rating=tags_analysis.overall_average_rating,
-                overall_median_rating=tags_analysis.overall_median_rating,
-                total_solved=tags_analysis.total_solved,
-                last_updated=self.get_current_timestamp(),
-            )
-
-            # Enqueue background refresh (non-blocking)
-            asyncio.create_task(task_queue.enqueue(handle))
-
-            return Response(
-                response,
-                headers={
-                    **self._cache_headers(0),
-                    "X-Data-Stale": "true",
-                    "X-Data-Age": str(age),
-                },
-            )
-
-        # Case 3: No data or prefer_fresh
-        try:
-            task_id = await task_queue.enqueue(handle)
-            return Response(
-                content=AsyncTaskResponse(
-                    status="processing", task_id=task_id, retry_after=2
-                ).model_dump(),
-                status_code=202,
-            )
-        except Exception:
-            # Fallback: try fetching directly if queue fails
-            try:
-                submissions = await data_service.get_user_submissions(handle)
-            except UserNotFoundError:
-                raise HTTPException(
-                    status_code=404, detail=f"User '{handle}' not found on Codeforces"
-                )
-
-            submissions = self._filter_by_date_range(
-                submissions, start_date=period.to_start_date(now=datetime.now(timezone.utc))
-            )
-            self._validate_submissions_exist(submissions, handle)
-
-            tags_analysis = tags_service.analyze_tags(handle, submissions)
-
-            tags_info = [SimpleTagInfoSchema.model_validate(tag) for tag in tags_analysis.tags]
-
-            response = TagsResponse(
-                tags=tags_info,
-                overall_average_rating=tags_analysis.overall_average_rating,
-                overall_median_rating=tags_analysis.overall_median_rating,
-                total_solved=tags_analysis.total_solved,
-                last_updated=self.get_current_timestamp(),
-            )
-
-            return Response(response, headers=self._cache_headers(14400))
-
-    @get(
-        path="/{handle:str}/weak",
-        dependencies={
-            "data_service": codeforces_data_service_dependency,
-            "tags_service": tags_service_dependency,
-            "redis": redis_dependency,
-            "task_queue": task_queue_dependency,
-        },
-    )
+        return await self._serve_cached(
+            redis,
+            task_queue,
+            data_service,
+            handle,
+            prefer_fresh,
+            start_date=self._period_start(period),
+            analyze=partial(tags_service.analyze_tags, handle),
+            build_response=self._build_tags_response,
+            cache_key=self._response_cache_key("tag-ratings", handle, period),
+            if_none_match=if_none_match,
+        )
+
+    @get(path="/{handle:str}/weak")
     async def get_weak_tag_ratings(
         self,
         handle: str,
@@ -191,6 +99,11 @@ class TagsController(BaseMetricController):
             default=False,
             description="If true, force refresh even if stale data is available",
         ),
+        if_none_match: str | None = HeaderParameter(
+            name="If-None-Match",
+            default=None,
+            description="ETag of a previously returned response",
+        ),
     ) -> Union[Response[WeakTagsResponse], Response[AsyncTaskResponse]]:
         """
         Get user's weak tag ratings - topics where median rating is significantly lower.
@@ -202,105 +115,50 @@ class TagsController(BaseMetricController):
             threshold: Minimum rating difference from overall median to be considered weak
             period: Time period to filter submissions by
             prefer_fresh: Force refresh even if stale data exists
+            if_none_match: ETag of a cached copy; answered with 304 if still current
 
         Returns:
             Weak tag ratings analysis
             OR 202 Accepted with task_id if data needs to be fetched
         """
-        # Get submissions with staleness check
-        submissions, age, is_stale = await self.get_submissions_with_staleness(redis, handle)
-
-        # Case 1: Fresh data (< 4 hours)
-        if submissions and not is_stale:
-            submissions = self._filter_by_date_range(
-                submissions, start_date=period.to_start_date(now=datetime.now(timezone.utc))
-            )
-            tags_analysis = tags_service.analyze_tags(handle, submissions)
-
-            weak_tags = tags_analysis.get_weak_tags(threshold)
-
-            weak_tags_info = [SimpleTagInfoSchema.model_validate(tag) for tag in weak_tags]
-
-            response = WeakTagsResponse(
-                weak_tags=weak_tags_info,
-                overall_average_rating=tags_analysis.overall_average_rating,
-                overall_median_rating=tags_analysis.overall_median_rating,
-                total_solved=tags_analysis.total_solved,
-                threshold_used=threshold,
-                last_updated=self.get_current_timestamp(),
-            )
-
-            return Response(response, headers=self._cache_headers(14400 - age))
-
-        # Case 2: Stale data (4-24 hours) and !prefer_fresh
-        if submissions and is_stale and not prefer_fresh:
-            # Return stale data immediately
-            submissions = self._filter_by_date_range(
-                submissions, start_date=period.to_start_date(now=datetime.now(timezone.utc))
-            )
-            tags_analysis = tags_service.analyze_tags(handle, submissions)
-
-            weak_tags = tags_analysis.get_weak_tags(threshold)
-
-            weak_tags_info = [SimpleTagInfoSchema.model_validate(tag) for tag in weak_tags]
-
-            response = WeakTagsResponse(
-                weak_tags=weak_tags_info,
-                overall_average_rating=tags_analysis.overall_average_rating,
-                overall_median_rating=tags_analysis.overall_median_rating,
-                total_solved=tags_analysis.total_solved,
-                threshold_used=threshold,
-                last_updated=self.get_current_timestamp(),
-            )
-
-            # Enqueue background refresh (non-blocking)
-            asyncio.create_task(task_queue.enqueue(handle))
-
-            return Response(
-                response,
-                headers={
-                    **self._cache_headers(0),
-                    "X-Data-Stale": "true",
-                    "X-Data-Age": str(age),
-                },
-            )
-
-        # Case 3: No data or prefer_fresh
-        try:
-            task_id = await task_queue.enqueue(handle)
-            return Response(
-                content=AsyncTaskResponse(
-                    status="processing", task_id=task_id, retry_after=2
-                ).model_dump(),
-                status_code=202,
-            )
-        except Exception:
-            # Fallback: try fetching directly if queue fails
-            try:
-                submissions = await data_service.get_user_submissions(handle)
-            except UserNotFoundError:
-                raise HTTPException(
-                    status_code=404, detail=f"User '{handle}' not found on Codeforces"
-                )
-
-            submissions = self._filter_by_date_range(
-                submissions, start_date=period.to_start_date(now=datetime.now(timezone.utc))
-            )
-            self._validate_submissions_exist(submissions, handle)
-
-            tags_analysis = tags_service.analyze_tags(handle, submissions)
-
-            weak_tags = tags_analysis.get_weak_tags(threshold)
-
-            weak_tags_info = [SimpleTagInfoSchema.model_validate(tag) for tag in weak_tags]
-
-            response = WeakTagsResponse(
-                weak_tags=weak_tags_info,
-                overall_average_rating=tags_analysis.overall_average_rating,
-                overall_median_rating=tags_analysis.overall_median_rating,
-                total_solved=tags_analysis.total_solved,
-                threshold_used=threshold,
-                last_updated=self.get_current_timestamp(),
-            )
-
-            return Response(response, headers=self._cache_headers(14400))
+        return await self._serve_cached(
+            redis,
+            task_queue,
+            data_service,
+            handle,
+            prefer_fresh,
+            start_date=self._period_start(period),
+            analyze=partial(tags_service.analyze_tags, handle),
+            build_response=partial(self._build_weak_tags_response, threshold=threshold),
+            cache_key=self._response_cache_key(f"tag-ratings:weak:{threshold}", handle, period),
+            if_none_match=if_none_match,
+        )
+
+    def _build_tags_response(self, tags_analysis: TagsAnalysis) -> TagsResponse:
+        """Build tag ratings response schema from analysis result."""
+        tags_info = [SimpleTagInfoSchema.from_domain(tag) for tag in tags_analysis.tags]
+
+        return TagsResponse(
+            tags=tags_info,
+            overall_average_rating=tags_analysis.overall_average_rating,
+            overall_median_rating=tags_analysis.overall_median_rating,
+            total_solved=tags_analysis.total_solved,
+            last_updated=self.get_current_timestamp(),
+        )
+
+    def _build_weak_tags_response(
+        self, tags_analysis: TagsAnalysis, threshold: int
+    ) -> WeakTagsResponse:
+        """Build weak tag ratings response schema from analysis result."""
+        weak_tags = tags_analysis.get_weak_tags(threshold)
+
+        weak_tags_info = [SimpleTagInfoSchema.from_domain(tag) for tag in weak_tags]
+
+        return WeakTagsResponse(
+            weak_tags=weak_tags_info,
+            overall_average_rating=tags_analysis.overall_average_rating,
+            overall_median_rating=tags_analysis.overall_median_rating,
+            total_solved=tags_analysis.total_solved,
+            threshold_used=threshold,
+            last_updated=self.get_current_timestamp(),
+        )
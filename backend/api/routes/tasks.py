@@ -1,12 +1,10 @@
 """Task status API routes."""
 
-import json
-
 from litestar import Controller, get
+from litestar.enums import MediaType
 from litestar.response import Response
-from redis.asyncio import Redis
 
-from backend.api.deps import redis_dependency, task_queue_dependency
+from backend.api.deps import task_queue_dependency
 from backend.infrastructure.task_queue import TaskQueue
 
 
@@ -20,14 +18,12 @@ class TaskController(Controller):
         path="/{task_id:str}",
         dependencies={
             "task_queue": task_queue_dependency,
-            "redis": redis_dependency,
         },
     )
     async def get_task_status(
         self,
         task_id: str,
         task_queue: TaskQueue,
-        redis: Redis,
     ) -> Response:
         """
         Get status of an async task.
@@ -39,67 +35,46 @@ class TaskController(Controller):
         - 500 Internal Server Error if task failed
 
         Args:
-            task_id: UUID of the task to check
+            task_id: ID of the task to check
 
         Returns:
             Task status and result/error data
         """
-        # Get task info
-        task_info = await task_queue.get_task_info(task_id)
+        # Status, payload and the "updated by another task" check in one round trip
+        task = await task_queue.poll_task(task_id)
 
-        if not task_info:
+        if not task:
             return Response(
                 content={"error": "Task not found or expired"},
                 status_code=404,
             )
 
-        handle = task_info.get("handle")
-        status = task_info.get("status")
+        status, payload = task
 
-        # Completed
+        # Completed: the stored result is already JSON, so it is sent as-is
         if status == "completed":
-            result = await redis.get(f"task:{task_id}:result")
             return Response(
-                content=json.loads(result) if result else {"status": "completed"},
+                content=payload or {"status": "completed"},
+                media_type=MediaType.JSON,
                 status_code=200,
             )
 
         # Failed
         if status == "failed":
-            error = await redis.get(f"task:{task_id}:error")
             return Response(
-                content={"error": error.decode() if error else "Unknown error"},
+                content={"error": payload.decode() if payload else "Unknown error"},
                 status_code=500,
             )
 
-        # Still processing - check if cache was updated by another task
-        if handle:
-            cached = await redis.get(f"submissions:{handle}")
-            if cached:
-                ttl = await redis.ttl(f"submissions:{handle}")
-                if ttl > 0:
-                    age = 86400 - ttl
-
-                    if age < 14400:  # Fresh data available!
-                        # Mark task as completed
-                        await redis.setex(f"task:{task_id}:status", 300, "completed")
-                        await redis.setex(
-                            f"task:{task_id}:result",
-                            300,
-                            json.dumps(
-                                {
-                                    "handle": handle,
-                                    "status": "completed_by_another_task",
-                                }
-                            ),
-                        )
-                        return Response(
-                            content={
-                                "status": "completed",
-                                "message": "Data updated by concurrent request",
-                            },
-                            status_code=200,
-                        )
+        # Cache was updated by another task while this one was still queued
+        if status == "completed_by_another_task":
+            return Response(
+                content={
+                    "status": "completed",
+                    "message": "Data updated by concurrent request",
+                },
+                status_code=200,
+            )
 
         # Still processing
         return Response(
@@ -1,19 +1,24 @@
 """Daily activity API schemas."""
 
 from datetime import datetime
-from typing import List
+from typing import Annotated, List, TypedDict
 
 from pydantic import Field
 
 from backend.api.schemas.base import BaseAPISchema
 
 
-class DailyActivityItemSchema(BaseAPISchema):
-    """Schema for a single day's activity."""
+class DailyActivityItemSchema(TypedDict):
+    """
+    Schema for a single day's activity.
 
-    date: str = Field(..., description="Time bucket label (format depends on granularity)")
-    solved_count: int = Field(..., description="Number of unique problems solved")
-    attempt_count: int = Field(..., description="Number of failed submissions")
+    A TypedDict rather than a model: a response holds one item per bucket, and items
+    are validated from DailyActivity.to_dict() without building a model per bucket.
+    """
+
+    date: Annotated[str, Field(description="Time bucket label (format depends on granularity)")]
+    solved_count: Annotated[int, Field(description="Number of unique problems solved")]
+    attempt_count: Annotated[int, Field(description="Number of failed submissions")]
 
 
 class DailyActivityResponse(BaseAPISchema):
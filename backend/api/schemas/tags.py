@@ -1,11 +1,12 @@
 """Tags API schemas."""
 
 from datetime import datetime
-from typing import List
+from typing import List, Self
 
 from pydantic import Field
 
 from backend.api.schemas.base import BaseAPISchema
+from backend.domain.models.tags import TagInfo
 
 
 class SimpleTagInfoSchema(BaseAPISchema):
@@ -20,6 +21,19 @@ class SimpleTagInfoSchema(BaseAPISchema):
     )
     problem_count: int = Field(..., description="Number of solved problems with this tag")
 
+    @classmethod
+    def from_domain(cls, tag: TagInfo) -> Self:
+        """
+        Build the schema from a TagInfo produced by TagsService, without validation.
+
+        Args:
+            tag: Tag statistics computed by the service (trusted input)
+
+        Returns:
+            Schema instance holding the tag's fields
+        """
+        return cls.model_construct(**{field: getattr(tag, field) for field in cls.model_fields})
+
 
 class TagInfoSchema(SimpleTagInfoSchema):
     """Schema for a single tag information (detailed version for weak tags)."""
@@ -1,5 +1,6 @@
 """Application configuration using Pydantic settings."""
 
+from functools import cache
 from typing import Literal
 
 from pydantic import Field
@@ -35,7 +36,7 @@ class Settings(BaseSettings):
     worker_rate_limit: int = Field(
         default=5, description="Worker rate limit (requests per second to Codeforces API)"
     )
-    worker_queue_key: str = Field(default="fetch_queue", description="Worker queue key")
+    worker_queue_key: str = Field(default="fetch_stream", description="Worker queue stream key")
 
     # Task settings
     task_status_ttl: int = Field(default=300, description="Task status TTL in seconds (5 minutes)")
@@ -65,8 +66,19 @@ class Settings(BaseSettings):
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
+        # The validator is built on first instantiation rather than at import
+        defer_build=True,
     )
 
 
-# Global settings instance
-settings = Settings()
+@cache
+def get_settings() -> Settings:
+    """Return the global settings instance, loading it on first use."""
+    return Settings()
+
+
+def __getattr__(name: str) -> Settings:
+    """Resolve the global ``settings`` instance lazily (PEP 562)."""
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
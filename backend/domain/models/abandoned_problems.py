@@ -6,7 +6,7 @@ from typing import List
 from backend.domain.models.base import BaseDomainModel
 
 
-@dataclass
+@dataclass(slots=True)
 class AbandonedProblem(BaseDomainModel):
     """A problem that was attempted but never solved."""
 
@@ -18,7 +18,7 @@ class AbandonedProblem(BaseDomainModel):
     failed_attempts: int
 
 
-@dataclass
+@dataclass(slots=True)
 class TagAbandonedStats(BaseDomainModel):
     """Abandoned problems statistics by tag."""
 
@@ -27,7 +27,7 @@ class TagAbandonedStats(BaseDomainModel):
     total_failed_attempts: int
 
 
-@dataclass
+@dataclass(slots=True)
 class RatingAbandonedStats(BaseDomainModel):
     """Abandoned problems statistics by rating."""
 
@@ -36,7 +36,7 @@ class RatingAbandonedStats(BaseDomainModel):
     total_failed_attempts: int
 
 
-@dataclass
+@dataclass(slots=True)
 class AbandonedProblemsAnalysis(BaseDomainModel):
     """Complete analysis of user's abandoned problems."""
 
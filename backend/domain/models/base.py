@@ -1,10 +1,64 @@
-from dataclasses import asdict, dataclass
+import copy
+import types
+from dataclasses import asdict, dataclass, fields, is_dataclass
+from enum import Enum
+from typing import Any, Callable, Union, get_args, get_origin, get_type_hints
 
+# Field types that asdict would return unchanged (deepcopy of them is the identity)
+_ATOMIC_TYPES = (str, int, float, bool, type(None), Enum)
 
-@dataclass
+# Generated to_dict functions, built on first use per model class
+_TO_DICT_FUNCTIONS: dict[type, Callable[[Any], dict]] = {}
+
+
+def _is_atomic(annotation: Any) -> bool:
+    """Check whether a field annotation only admits immutable scalar values."""
+    if get_origin(annotation) in (Union, types.UnionType):
+        return all(_is_atomic(arg) for arg in get_args(annotation))
+    return isinstance(annotation, type) and issubclass(annotation, _ATOMIC_TYPES)
+
+
+def _to_plain(value: Any) -> Any:
+    """Convert a non-scalar field value the same way dataclasses.asdict does."""
+    if isinstance(value, BaseDomainModel):
+        return value.to_dict()
+    if is_dataclass(value) and not isinstance(value, type):
+        return asdict(value)
+    if isinstance(value, (list, tuple)):
+        return type(value)(_to_plain(item) for item in value)
+    if isinstance(value, dict):
+        return {_to_plain(key): _to_plain(item) for key, item in value.items()}
+    return copy.deepcopy(value)
+
+
+def _build_to_dict(cls: type) -> Callable[[Any], dict]:
+    """
+    Generate a to_dict function for a model class.
+
+    Scalar fields are read directly; only containers and nested models go through
+    _to_plain, so the common case avoids asdict's recursive deepcopy.
+    """
+    hints = get_type_hints(cls)
+    items = [
+        f"{field.name!r}: self.{field.name}"
+        if _is_atomic(hints.get(field.name))
+        else f"{field.name!r}: _to_plain(self.{field.name})"
+        for field in fields(cls)
+    ]
+    source = f"def to_dict(self):\n    return {{{', '.join(items)}}}\n"
+    namespace: dict[str, Any] = {"_to_plain": _to_plain}
+    exec(source, namespace)
+    return namespace["to_dict"]
+
+
+@dataclass(slots=True)
 class BaseDomainModel:
     """Base class for all domain models."""
 
     def to_dict(self) -> dict:
         """Convert model to dictionary."""
-        return asdict(self)
+        cls = type(self)
+        to_dict = _TO_DICT_FUNCTIONS.get(cls)
+        if to_dict is None:
+            to_dict = _TO_DICT_FUNCTIONS[cls] = _build_to_dict(cls)
+        return to_dict(self)
@@ -19,7 +19,12 @@ class SubmissionStatus(str, Enum):
     IDLENESS_LIMIT_EXCEEDED = "IDLENESS_LIMIT_EXCEEDED"
 
 
-@dataclass
+# Module-level alias: is_solved runs once per submission, and a global lookup is
+# cheaper than resolving the member on the enum class each time
+_ACCEPTED = SubmissionStatus.OK
+
+
+@dataclass(slots=True)
 class Problem(BaseDomainModel):
     """Codeforces problem model."""
 
@@ -35,7 +40,7 @@ class Problem(BaseDomainModel):
         return f"{self.contest_id}{self.index}"
 
 
-@dataclass
+@dataclass(slots=True)
 class Submission(BaseDomainModel):
     """Codeforces submission model."""
 
@@ -49,4 +54,4 @@ class Submission(BaseDomainModel):
     @property
     def is_solved(self) -> bool:
         """Check if the submission was accepted."""
-        return self.verdict == SubmissionStatus.OK
+        return self.verdict == _ACCEPTED
@@ -6,7 +6,7 @@ from typing import List
 from backend.domain.models.base import BaseDomainModel
 
 
-@dataclass
+@dataclass(slots=True)
 class DailyActivity(BaseDomainModel):
     """Activity stats for a single time bucket (minute, hour, day, month, or year)."""
 
@@ -15,7 +15,7 @@ class DailyActivity(BaseDomainModel):
     attempt_count: int
 
 
-@dataclass
+@dataclass(slots=True)
 class DailyActivityAnalysis(BaseDomainModel):
     """Aggregated activity analysis over a time range."""
 
@@ -6,7 +6,7 @@ from typing import List
 from backend.domain.models.base import BaseDomainModel
 
 
-@dataclass
+@dataclass(slots=True)
 class RatingRange(BaseDomainModel):
     """A rating range grouping problems by difficulty."""
 
@@ -14,7 +14,7 @@ class RatingRange(BaseDomainModel):
     problem_count: int
 
 
-@dataclass
+@dataclass(slots=True)
 class DifficultyDistribution(BaseDomainModel):
     """Distribution of solved problems by difficulty levels."""
 
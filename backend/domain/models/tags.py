@@ -6,7 +6,7 @@ from typing import List
 from backend.domain.models.base import BaseDomainModel
 
 
-@dataclass
+@dataclass(slots=True)
 class TagInfo(BaseDomainModel):
     """Information about a single tag."""
 
@@ -17,7 +17,7 @@ class TagInfo(BaseDomainModel):
     problems: List[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class TagsAnalysis(BaseDomainModel):
     """Analysis of user's problem-solving activity by tags."""
 
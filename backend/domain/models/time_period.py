@@ -1,7 +1,11 @@
 """Time period enum for filtering submissions by date range."""
 
-from datetime import datetime, timedelta
+import calendar
+from datetime import datetime, timedelta, tzinfo
 from enum import Enum
+from functools import lru_cache
+
+_DAYS_IN_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
 
 
 class TimePeriod(str, Enum):
@@ -24,46 +28,54 @@ class TimePeriod(str, Enum):
         Returns:
             Start datetime for the period, or None for ALL_TIME
         """
-        if self is TimePeriod.ALL_TIME:
-            return None
-
-        if self is TimePeriod.HOUR:
-            return now - timedelta(hours=1)
-
-        if self is TimePeriod.DAY:
-            return now - timedelta(days=1)
-
-        if self is TimePeriod.WEEK:
-            return now - timedelta(weeks=1)
-
-        if self is TimePeriod.MONTH:
-            # Go back one month, handling edge cases
-            month = now.month - 1
-            year = now.year
-            if month == 0:
-                month = 12
-                year -= 1
-            day = min(now.day, _days_in_month(year, month))
-            return now.replace(year=year, month=month, day=day)
-
-        if self is TimePeriod.HALF_YEAR:
-            # Go back 6 months
-            month = now.month - 6
-            year = now.year
-            if month <= 0:
-                month += 12
-                year -= 1
-            day = min(now.day, _days_in_month(year, month))
-            return now.replace(year=year, month=month, day=day)
-
-        # YEAR
-        year = now.year - 1
-        day = min(now.day, _days_in_month(year, now.month))
-        return now.replace(year=year, day=day)
+        # Equal instants in different zones compare equal, so tzinfo is part of the key
+        return _start_date(self, now, now.tzinfo)
+
+
+# Callers pass the per-second request timestamp, so concurrent requests share entries
+@lru_cache(maxsize=64)
+def _start_date(period: TimePeriod, now: datetime, tz: tzinfo | None) -> datetime | None:
+    """Compute TimePeriod.to_start_date (memoized per period, timestamp and zone)."""
+    if period is TimePeriod.ALL_TIME:
+        return None
+
+    if period is TimePeriod.HOUR:
+        return now - timedelta(hours=1)
+
+    if period is TimePeriod.DAY:
+        return now - timedelta(days=1)
+
+    if period is TimePeriod.WEEK:
+        return now - timedelta(weeks=1)
+
+    if period is TimePeriod.MONTH:
+        # Go back one month, handling edge cases
+        month = now.month - 1
+        year = now.year
+        if month == 0:
+            month = 12
+            year -= 1
+        day = min(now.day, _days_in_month(year, month))
+        return now.replace(year=year, month=month, day=day)
+
+    if period is TimePeriod.HALF_YEAR:
+        # Go back 6 months
+        month = now.month - 6
+        year = now.year
+        if month <= 0:
+            month += 12
+            year -= 1
+        day = min(now.day, _days_in_month(year, month))
+        return now.replace(year=year, month=month, day=day)
+
+    # YEAR
+    year = now.year - 1
+    day = min(now.day, _days_in_month(year, now.month))
+    return now.replace(year=year, day=day)
 
 
 def _days_in_month(year: int, month: int) -> int:
     """Return the number of days in a given month/year."""
-    if month == 12:
-        return 31
-    return (datetime(year, month + 1, 1) - datetime(year, month, 1)).days
+    if month == 2 and calendar.isleap(year):
+        return 29
+    return _DAYS_IN_MONTH[month - 1]
@@ -58,11 +58,13 @@ class AbandonedProblemsService(BaseMetricService):
     @staticmethod
     def _group_submissions_by_problem(submissions: List[Submission]) -> Dict[str, List[Submission]]:
         """Group submissions by unique problem key."""
-        grouped = defaultdict(list)
+        grouped: defaultdict[str, List[Submission]] = defaultdict(list)
         for submission in submissions:
             problem_key = submission.problem.problem_key
             grouped[problem_key].append(submission)
-        return dict(grouped)
+        # Returned without a copy; dropping the factory makes missing keys raise again
+        grouped.default_factory = None
+        return grouped
 
     @staticmethod
     def _find_abandoned_problems(
@@ -97,24 +99,24 @@ class AbandonedProblemsService(BaseMetricService):
     @staticmethod
     def _aggregate_by_tags(abandoned_problems: List[AbandonedProblem]) -> List[TagAbandonedStats]:
         """Aggregate abandoned problems statistics by tags."""
-        tag_stats = defaultdict(lambda: {"problems": set(), "attempts": 0})
+        # Flat per-tag tallies instead of a dict of dicts built by a lambda per tag
+        tag_problems: dict[str, set[str]] = defaultdict(set)
+        tag_attempts: dict[str, int] = defaultdict(int)
 
         for problem in abandoned_problems:
             for tag in problem.tags:
-                tag_stats[tag]["problems"].add(problem.name)
-                tag_stats[tag]["attempts"] += problem.failed_attempts
+                tag_problems[tag].add(problem.name)
+                tag_attempts[tag] += problem.failed_attempts
 
         # Convert to TagAbandonedStats objects
-        tags_stats = []
-        for tag, stats in tag_stats.items():
-            tag_stat = TagAbandonedStats(
+        return [
+            TagAbandonedStats(
                 tag=tag,
-                problem_count=len(stats["problems"]),
-                total_failed_attempts=stats["attempts"],
+                problem_count=len(problems),
+                total_failed_attempts=tag_attempts[tag],
             )
-            tags_stats.append(tag_stat)
-
-        return tags_stats
+            for tag, problems in tag_problems.items()
+        ]
 
     @staticmethod
     def _aggregate_by_ratings(
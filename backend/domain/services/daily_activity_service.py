@@ -1,10 +1,12 @@
 """Daily activity service for analyzing submission activity with variable granularity."""
 
+import time
 from collections import defaultdict
 from datetime import datetime, timedelta, timezone
-from typing import List, Optional
+from itertools import chain
+from typing import Any, Callable, List, Optional
 
-from backend.domain.models.codeforces import Submission
+from backend.domain.models.codeforces import Submission, SubmissionStatus
 from backend.domain.models.daily_activity import DailyActivity, DailyActivityAnalysis
 from backend.domain.models.time_period import TimePeriod
 from backend.domain.services.base import BaseMetricService
@@ -19,15 +21,55 @@ _GRANULARITY_MAP = {
     TimePeriod.ALL_TIME: "year",
 }
 
-_BUCKET_FORMAT = {
-    "minute": "%Y-%m-%d %H:%M",
-    "hour": "%Y-%m-%d %H:00",
-    "day": "%Y-%m-%d",
-    "month": "%Y-%m",
-    "year": "%Y",
+# Bucket labels, equivalent to strftime with "%Y-%m-%d %H:%M", "%Y-%m-%d %H:00",
+# "%Y-%m-%d", "%Y-%m" and "%Y" but without parsing a format string per bucket
+_BUCKET_LABEL: dict[str, Callable[[datetime], str]] = {
+    "minute": lambda dt: f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d} {dt.hour:02d}:{dt.minute:02d}",
+    "hour": lambda dt: f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d} {dt.hour:02d}:00",
+    "day": lambda dt: f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d}",
+    "month": lambda dt: f"{dt.year:04d}-{dt.month:02d}",
+    "year": lambda dt: f"{dt.year:04d}",
 }
 
 
+# Bucket keys computed straight from epoch seconds: the bucket index for fixed-length
+# buckets, (year, month) or year otherwise. Labels are formatted once per bucket.
+_SECONDS_PER_STEP = {"minute": 60, "hour": 3600, "day": 86400}
+
+_EPOCH_BUCKET_KEY: dict[str, Callable[[int], Any]] = {
+    "minute": lambda ts: ts // 60,
+    "hour": lambda ts: ts // 3600,
+    "day": lambda ts: ts // 86400,
+    "month": lambda ts: time.gmtime(ts)[:2],
+    "year": lambda ts: time.gmtime(ts)[0],
+}
+
+
+# Everything analyze needs per period, resolved with a single lookup
+_PERIOD_BUCKETING: dict[TimePeriod, tuple[str, Callable[[datetime], str], Callable[[int], Any]]] = {
+    period: (granularity, _BUCKET_LABEL[granularity], _EPOCH_BUCKET_KEY[granularity])
+    for period, granularity in _GRANULARITY_MAP.items()
+}
+
+
+def _bucket_key(dt: datetime, granularity: str) -> Any:
+    """Return the bucket key of an aligned bucket start, as _EPOCH_BUCKET_KEY would."""
+    if granularity == "year":
+        return dt.year
+    if granularity == "month":
+        return (dt.year, dt.month)
+    return int(dt.timestamp()) // _SECONDS_PER_STEP[granularity]
+
+
+def _bucket_start(key: Any, granularity: str) -> datetime:
+    """Return the UTC start of the bucket with the given key."""
+    if granularity == "year":
+        return datetime(key, 1, 1, tzinfo=timezone.utc)
+    if granularity == "month":
+        return datetime(key[0], key[1], 1, tzinfo=timezone.utc)
+    return datetime.fromtimestamp(key * _SECONDS_PER_STEP[granularity], tz=timezone.utc)
+
+
 def _truncate(dt: datetime, granularity: str) -> datetime:
     if granularity == "minute":
         return dt.replace(second=0, microsecond=0)
@@ -84,8 +126,7 @@ class DailyActivityService(BaseMetricService):
         if now is None:
             now = datetime.now(timezone.utc)
 
-        granularity = _GRANULARITY_MAP[period]
-        fmt = _BUCKET_FORMAT[granularity]
+        granularity, label_of, key_of = _PERIOD_BUCKETING[period]
 
         if not submissions:
             return DailyActivityAnalysis(
@@ -96,13 +137,15 @@ class DailyActivityService(BaseMetricService):
                 active_days=0,
             )
 
-        solved_by_bucket: dict[str, set[str]] = defaultdict(set)
-        attempts_by_bucket: dict[str, int] = defaultdict(int)
+        # Per-bucket sets measured faster than a flat set of (bucket, problem) pairs
+        solved_by_bucket: dict[Any, set[str]] = defaultdict(set)
+        attempts_by_bucket: dict[Any, int] = defaultdict(int)
+        # Submission.is_solved inlined: a property call per submission is measurable here
+        accepted = SubmissionStatus.OK
 
         for sub in submissions:
-            dt = datetime.fromtimestamp(sub.creation_time_seconds, tz=timezone.utc)
-            bucket = dt.strftime(fmt)
-            if sub.is_solved:
+            bucket = key_of(sub.creation_time_seconds)
+            if sub.verdict == accepted:
                 solved_by_bucket[bucket].add(sub.problem.problem_key)
             else:
                 attempts_by_bucket[bucket] += 1
@@ -112,9 +155,9 @@ class DailyActivityService(BaseMetricService):
         end_dt = _truncate(now, granularity)
 
         if start_dt is None:
-            all_buckets = set(solved_by_bucket.keys()) | set(attempts_by_bucket.keys())
-            min_bucket = min(all_buckets)
-            start_dt = datetime.strptime(min_bucket, fmt).replace(tzinfo=timezone.utc)
+            # Earliest bucket, taken from the bucket keys without building their union
+            min_bucket = min(chain(solved_by_bucket, attempts_by_bucket))
+            start_dt = _bucket_start(min_bucket, granularity)
 
         days: List[DailyActivity] = []
         total_solved = 0
@@ -123,12 +166,12 @@ class DailyActivityService(BaseMetricService):
         current = start_dt
 
         while current <= end_dt:
-            label = current.strftime(fmt)
-            solved = len(solved_by_bucket.get(label, set()))
-            attempts = attempts_by_bucket.get(label, 0)
+            bucket = _bucket_key(current, granularity)
+            solved = len(solved_by_bucket.get(bucket, ()))
+            attempts = attempts_by_bucket.get(bucket, 0)
             days.append(
                 DailyActivity(
-                    date=label,
+                    date=label_of(current),
                     solved_count=solved,
                     attempt_count=attempts,
                 )
@@ -1,7 +1,7 @@
 """Tags analysis service for analyzing solved problems by tags."""
 
 from collections import defaultdict
-from statistics import mean, median
+from statistics import median
 from typing import List
 
 from backend.domain.models.codeforces import Submission
@@ -42,15 +42,17 @@ class TagsService(BaseMetricService):
         # Group problems by tags and calculate statistics
         tags_data, overall_ratings = TagsService._analyze_tags(unique_solves)
 
-        # Calculate overall average and median ratings
-        overall_average = mean(overall_ratings) if overall_ratings else 0
+        # Calculate overall average and median ratings. Ratings are ints, so plain
+        # sum/len gives the same correctly rounded float as statistics.mean, which
+        # goes through exact fractions and is far slower.
+        overall_average = sum(overall_ratings) / len(overall_ratings) if overall_ratings else 0
         overall_median = median(overall_ratings) if overall_ratings else 0
 
         # Convert to TagInfo objects
         tags_info = []
         for tag, (tag_ratings, problems) in tags_data.items():
             if tag_ratings:  # Only include tags with rated problems
-                avg_rating = mean(tag_ratings)
+                avg_rating = sum(tag_ratings) / len(tag_ratings)
                 med_rating = median(tag_ratings)
                 tag_info = TagInfo(
                     tag=tag,
@@ -1,11 +1,90 @@
 """Codeforces API client for BetterForces."""
 
+import re
 import httpx
-from typing import List, Dict, Any
-import json
-from backend.config import settings
+import msgspec
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+from backend.config import get_settings
 from backend.domain.models.codeforces import Submission, Problem, SubmissionStatus
 
+# Comments of non-OK responses that mean the handle does not exist
+_USER_NOT_FOUND = re.compile(r"User with handle .*(?:not found|does not (?:exist|have))")
+
+# Verdict lookup; unknown verdicts are treated as failed without raising
+_VERDICTS = {status.value: status for status in SubmissionStatus}
+
+
+# Typed view of a user.status response holding only the fields BetterForces uses.
+# Decoding into it skips every other field (author, test counts, timings, ...) in C
+# and builds no intermediate dict per submission, which keeps peak memory per fetch
+# close to the raw body plus the result.
+class _RawProblem(msgspec.Struct, rename="camel"):
+    contest_id: int = 0
+    index: str = ""
+    name: str = ""
+    rating: int | None = None
+    tags: list[str] = []
+
+
+class _RawSubmission(msgspec.Struct, rename="camel"):
+    id: int = 0
+    contest_id: int = 0
+    creation_time_seconds: int = 0
+    problem: _RawProblem = msgspec.field(default_factory=_RawProblem)
+    verdict: str = ""
+    programming_language: str = ""
+
+
+class _UserStatusResponse(msgspec.Struct):
+    status: str | None = None
+    comment: str = ""
+    result: list[_RawSubmission] = []
+
+
+_USER_STATUS_DECODER = msgspec.json.Decoder(_UserStatusResponse)
+
+# Submissions requested by an incremental fetch; a larger delta falls back to a full fetch
+_DELTA_PAGE_SIZE = 100
+
+# Keep-alive pool for api.codeforces.com; the worker's rate limit keeps concurrency low
+_HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=30)
+# A slow connect fails fast instead of holding a task for the full read timeout
+_HTTP_TIMEOUT = httpx.Timeout(30.0, connect=5.0)
+# Sent with every request; httpx already asks for gzip/deflate bodies and decodes them
+_HTTP_HEADERS = {"User-Agent": "betterforces/0.1.0"}
+# Largest decoded user.status body read; far above the most active handles' histories
+_MAX_RESPONSE_BYTES = 50 * 1024 * 1024
+
+# Process-wide client, so every CodeforcesClient reuses the same keep-alive pool
+_http_client: httpx.AsyncClient | None = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Return the shared HTTP client, creating it on first use.
+
+    Returns:
+        Process-wide httpx.AsyncClient for Codeforces API requests
+    """
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            timeout=_HTTP_TIMEOUT,
+            headers=_HTTP_HEADERS,
+            # Limits belong to the transport when one is passed; retries covers
+            # connection failures only, never a request that reached the server
+            transport=httpx.AsyncHTTPTransport(retries=1, limits=_HTTP_LIMITS),
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client; called on application and worker shutdown."""
+    global _http_client
+    client, _http_client = _http_client, None
+    if client is not None:
+        await client.aclose()
+
 
 class CodeforcesAPIError(Exception):
     """Exception raised when Codeforces API returns an error."""
@@ -24,104 +103,203 @@ class UserNotFoundError(Exception):
 class CodeforcesClient:
     """Client for interacting with Codeforces API."""
 
-    def __init__(self):
-        self.base_url = settings.codeforces_api_base.rstrip("/")
-        self.http_client = httpx.AsyncClient(timeout=30.0)
+    def __init__(self, throttle: Optional[Callable[[], Awaitable[None]]] = None):
+        """
+        Initialize the client.
+
+        Args:
+            throttle: Awaited before every request to the Codeforces API (e.g. a rate
+                limiter's acquire), so each upstream request is accounted for
+        """
+        self.base_url = get_settings().codeforces_api_base.rstrip("/")
+        self.http_client = get_http_client()
+        self.throttle = throttle
 
     async def __aenter__(self):
         """Async context manager entry."""
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Async context manager exit."""
-        await self.http_client.aclose()
+        """Async context manager exit; the shared HTTP client stays open for reuse."""
 
     async def close(self) -> None:
-        """Close the HTTP client."""
-        await self.http_client.aclose()
+        """Close the shared HTTP client (process shutdown only)."""
+        await close_http_client()
 
-    async def get_user_submissions(self, handle: str) -> List[Submission]:
+    async def get_user_submissions(
+        self, handle: str, since_id: int | None = None
+    ) -> List[Submission]:
         """
-        Fetch all submissions for a user.
+        Fetch submissions for a user, newest first.
+
+        With since_id only submissions newer than it are returned. They are read from
+        the first page of user.status; if that page does not reach back to since_id,
+        the full history is fetched instead, so a delta costs at most two requests.
+        The check looks only at the ids, as the lenient parse may drop malformed rows
+        and shorten a full page.
 
         Args:
             handle: Codeforces handle
+            since_id: Return only submissions with a greater id (None for all)
 
         Returns:
             List of user's submissions
 
+        Raises:
+            CodeforcesAPIError: If API request fails
+        """
+        if since_id is None:
+            return await self._fetch_user_status({"handle": handle})
+
+        page = await self._fetch_user_status(
+            {"handle": handle, "from": 1, "count": _DELTA_PAGE_SIZE}
+        )
+        if not page or page[-1].id > since_id:
+            page = await self._fetch_user_status({"handle": handle})
+        return [submission for submission in page if submission.id > since_id]
+
+    async def _fetch_user_status(self, params: Dict[str, Any]) -> List[Submission]:
+        """
+        Call user.status and parse its submissions.
+
+        Args:
+            params: Query parameters (handle and optional paging)
+
+        Returns:
+            List of submissions in the order returned by the API
+
         Raises:
             CodeforcesAPIError: If API request fails
         """
         url = f"{self.base_url}/user.status"
+        handle = params["handle"]
 
-        try:
-            response = await self.http_client.get(url, params={"handle": handle})
+        if self.throttle is not None:
+            await self.throttle()
 
-            data = response.json()
+        try:
+            async with self.http_client.stream("GET", url, params=params) as response:
+                content = await self._read_body(response)
 
-            # Check API response status
-            status = data.get("status")
-            result = data.get("result", [])
-            comment = data.get("comment", "")
+            try:
+                data = _USER_STATUS_DECODER.decode(content)
+                status, comment, result = data.status, data.comment, data.result
+                parse = self._convert_submissions
+            except msgspec.ValidationError:
+                # Some field has an unexpected type: parse leniently, skipping the
+                # malformed submissions
+                raw = msgspec.json.decode(content)
+                status = raw.get("status")
+                comment = raw.get("comment", "")
+                result = raw.get("result", [])
+                parse = self._parse_submissions
 
             if status != "OK":
                 # Check for user not found cases
-                if "User with handle" in comment and (
-                    "not found" in comment
-                    or "does not exist" in comment
-                    or "does not have" in comment
-                ):
+                if _USER_NOT_FOUND.search(comment):
                     raise UserNotFoundError(f"User '{handle}' not found on Codeforces")
                 raise CodeforcesAPIError(
                     f"API returned status: {status}. Comment: {comment}", response.status_code
                 )
 
             # Empty result means no submissions, but user exists
-            return self._parse_submissions(result)
+            return parse(result)
 
         except httpx.HTTPStatusError as e:
             raise CodeforcesAPIError(f"HTTP error {e.response.status_code}: {e.response.text}")
         except httpx.RequestError as e:
             raise CodeforcesAPIError(f"Request error: {str(e)}")
-        except json.JSONDecodeError as e:
+        except msgspec.DecodeError as e:
             raise CodeforcesAPIError(f"JSON decode error: {str(e)}")
 
+    @staticmethod
+    async def _read_body(response: httpx.Response) -> bytearray:
+        """
+        Read a streamed response body, refusing bodies over _MAX_RESPONSE_BYTES.
+
+        Args:
+            response: Response opened with http_client.stream
+
+        Returns:
+            Decoded (decompressed) response body
+
+        Raises:
+            CodeforcesAPIError: If the body is larger than the limit
+        """
+        too_large = f"Response body exceeds {_MAX_RESPONSE_BYTES} bytes"
+        # Content-Length is the compressed size, so it can only reject early
+        content_length = response.headers.get("Content-Length")
+        if content_length is not None and int(content_length) > _MAX_RESPONSE_BYTES:
+            raise CodeforcesAPIError(too_large, response.status_code)
+
+        content = bytearray()
+        async for chunk in response.aiter_bytes():
+            content += chunk
+            if len(content) > _MAX_RESPONSE_BYTES:
+                raise CodeforcesAPIError(too_large, response.status_code)
+        return content
+
+    @staticmethod
+    def _convert_submissions(raw_submissions: List[_RawSubmission]) -> List[Submission]:
+        """Convert typed user.status entries into Submission objects."""
+        submissions = []
+        append = submissions.append
+        unknown_verdict = SubmissionStatus.WRONG_ANSWER
+
+        for raw in raw_submissions:
+            raw_problem = raw.problem
+            append(
+                Submission(
+                    id=raw.id,
+                    contest_id=raw.contest_id,
+                    creation_time_seconds=raw.creation_time_seconds,
+                    problem=Problem(
+                        contest_id=raw_problem.contest_id,
+                        index=raw_problem.index,
+                        name=raw_problem.name,
+                        rating=raw_problem.rating,
+                        tags=raw_problem.tags,
+                    ),
+                    # Unknown verdict, treat as failed
+                    verdict=_VERDICTS.get(raw.verdict, unknown_verdict),
+                    programming_language=raw.programming_language,
+                )
+            )
+
+        return submissions
+
     def _parse_submissions(self, raw_submissions: List[Dict[str, Any]]) -> List[Submission]:
         """Parse raw API response into Submission objects."""
         submissions = []
+        append = submissions.append
+        unknown_verdict = SubmissionStatus.WRONG_ANSWER
 
         for raw_submission in raw_submissions:
             try:
+                get = raw_submission.get
+
                 # Parse problem
-                raw_problem = raw_submission.get("problem", {})
+                problem_get = get("problem", {}).get
                 problem = Problem(
-                    contest_id=raw_problem.get("contestId", 0),
-                    index=raw_problem.get("index", ""),
-                    name=raw_problem.get("name", ""),
-                    rating=raw_problem.get("rating"),
-                    tags=raw_problem.get("tags", []),
+                    contest_id=problem_get("contestId", 0),
+                    index=problem_get("index", ""),
+                    name=problem_get("name", ""),
+                    rating=problem_get("rating"),
+                    tags=problem_get("tags", []),
                 )
 
-                # Parse verdict
-                verdict_str = raw_submission.get("verdict", "")
-                try:
-                    verdict = SubmissionStatus(verdict_str)
-                except ValueError:
-                    # Unknown verdict, treat as failed
-                    verdict = SubmissionStatus.WRONG_ANSWER
-
-                submission = Submission(
-                    id=raw_submission.get("id", 0),
-                    contest_id=raw_submission.get("contestId", 0),
-                    creation_time_seconds=raw_submission.get("creationTimeSeconds", 0),
-                    problem=problem,
-                    verdict=verdict,
-                    programming_language=raw_submission.get("programmingLanguage", ""),
+                append(
+                    Submission(
+                        id=get("id", 0),
+                        contest_id=get("contestId", 0),
+                        creation_time_seconds=get("creationTimeSeconds", 0),
+                        problem=problem,
+                        # Unknown verdict, treat as failed
+                        verdict=_VERDICTS.get(get("verdict", ""), unknown_verdict),
+                        programming_language=get("programmingLanguage", ""),
+                    )
                 )
 
-                submissions.append(submission)
-
             except (KeyError, TypeError):
                 # Skip malformed submissions
                 continue
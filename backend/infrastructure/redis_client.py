@@ -1,27 +1,64 @@
 """Redis client utilities for direct Redis access."""
 
-from redis.asyncio import Redis
+from redis.asyncio import BlockingConnectionPool, Redis
 
-from backend.config import settings
+from backend.config import get_settings
+
+# One pool per process, shared by every client below. It blocks rather than raising
+# when all connections are busy, so a burst waits briefly instead of failing.
+_MAX_CONNECTIONS = 50
+_POOL_TIMEOUT = 5
+
+_pool: BlockingConnectionPool | None = None
+_client: Redis | None = None
+
+
+def get_connection_pool() -> BlockingConnectionPool:
+    """
+    Get the process-wide Redis connection pool, creating it on first use.
+
+    Returns:
+        BlockingConnectionPool: Shared connection pool
+    """
+    global _pool
+    if _pool is None:
+        _pool = BlockingConnectionPool.from_url(
+            get_settings().redis_url,
+            decode_responses=False,
+            max_connections=_MAX_CONNECTIONS,
+            timeout=_POOL_TIMEOUT,
+        )
+    return _pool
 
 
 async def create_redis_client() -> Redis:
     """
-    Create a Redis client instance.
+    Create a Redis client instance backed by the shared connection pool.
 
     Returns:
         Redis: Async Redis client
     """
-    return Redis.from_url(settings.redis_url, decode_responses=False)
+    return Redis(connection_pool=get_connection_pool())
 
 
-async def get_redis_client() -> Redis:
+def get_redis_client() -> Redis:
     """
-    Get Redis client for dependency injection.
+    Get the shared Redis client for dependency injection.
 
     This is a convenience function for DI in route handlers.
 
     Returns:
         Redis: Async Redis client instance
     """
-    return await create_redis_client()
+    global _client
+    if _client is None:
+        _client = Redis(connection_pool=get_connection_pool())
+    return _client
+
+
+async def close_redis_pool() -> None:
+    """Disconnect the shared connection pool; called on application and worker shutdown."""
+    global _pool, _client
+    pool, _pool, _client = _pool, None, None
+    if pool is not None:
+        await pool.disconnect()
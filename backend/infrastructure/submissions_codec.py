@@ -0,0 +1,105 @@
+"""
+Serialization of cached Codeforces submissions.
+
+Submissions are stored row-wise, one msgpack map per submission, and decoded straight
+into Submission objects, which is what the analyzers and the date filter consume. The
+API decodes a payload once per cache generation (see get_submissions_with_staleness),
+so a columnar layout would only move the cost into rebuilding Submission objects.
+Decoded tag names are interned: a handful of distinct tags repeat across every
+problem, and decoded lists stay in the API's submissions memo.
+
+Cached lists are newest first: the worker sorts before encoding, and legacy JSON
+payloads are sorted on decode. The API's date filter bisects on that order.
+
+The worker jitters the TTL of each entry and stores the TTL it chose under
+submissions_ttl:{handle}, with the same TTL, so readers can tell the age of an entry
+from its remaining TTL (see submissions_age).
+"""
+
+import sys
+from operator import attrgetter
+
+import msgspec
+
+from backend.domain.models.codeforces import Submission
+
+_ENCODER = msgspec.msgpack.Encoder()
+_DECODER = msgspec.msgpack.Decoder(list[Submission])
+# Entries written before the switch to msgpack were stored as JSON text
+_LEGACY_DECODER = msgspec.json.Decoder(list[Submission])
+_CREATION_TIME = attrgetter("creation_time_seconds")
+
+# Longest TTL of a submissions entry; entries without a stored TTL are assumed to have
+# been written with it
+SUBMISSIONS_TTL = 86400
+
+
+def submissions_age(ttl: int, full_ttl: bytes | None) -> int:
+    """
+    Age in seconds of a submissions entry.
+
+    Args:
+        ttl: Remaining TTL of submissions:{handle}
+        full_ttl: Value of submissions_ttl:{handle}, the TTL the entry was written with
+
+    Returns:
+        Seconds since the entry was written
+    """
+    return (int(full_ttl) if full_ttl else SUBMISSIONS_TTL) - ttl
+
+
+def sort_newest_first(submissions: list[Submission]) -> None:
+    """
+    Sort submissions in place by creation time, newest first.
+
+    The sort is stable, so submissions created in the same second keep their order.
+
+    Args:
+        submissions: Submissions to sort
+    """
+    submissions.sort(key=_CREATION_TIME, reverse=True)
+
+
+def encode_submissions(submissions: list[Submission]) -> bytes:
+    """
+    Encode submissions for storage under submissions:{handle}.
+
+    Args:
+        submissions: Submissions to encode
+
+    Returns:
+        msgpack payload
+    """
+    return _ENCODER.encode(submissions)
+
+
+def decode_submissions(payload: bytes) -> list[Submission] | None:
+    """
+    Decode a cached submissions payload.
+
+    Args:
+        payload: Raw Redis value written by encode_submissions (or legacy JSON)
+
+    Returns:
+        List of Submission objects, or None if the payload cannot be decoded
+    """
+    try:
+        submissions = _DECODER.decode(payload)
+    except msgspec.DecodeError:
+        try:
+            submissions = _LEGACY_DECODER.decode(payload)
+        except msgspec.DecodeError:
+            return None
+        # Written before the worker sorted on write, so the order is not guaranteed
+        sort_newest_first(submissions)
+
+    _intern_tags(submissions)
+    return submissions
+
+
+def _intern_tags(submissions: list[Submission]) -> None:
+    """Replace each problem's tag strings with their interned, shared copies."""
+    intern = sys.intern
+    for submission in submissions:
+        problem = submission.problem
+        problem.tags = [intern(tag) for tag in problem.tags]
@@ -1,19 +1,81 @@
 """Task queue service for asynchronous job processing."""
 
-import json
+import asyncio
+import secrets
 import time
-import uuid
-from typing import Optional
+from functools import partial
+from typing import Iterable, Optional
 
+import msgspec
 from redis.asyncio import Redis
 
+from backend.config import get_settings
+from backend.infrastructure.submissions_codec import SUBMISSIONS_TTL
+
+# Re-reads the state of a task that was processing. If its handle already has fresh
+# submissions (refreshed by a concurrent task), the task is marked completed in the
+# same atomic step, so no worker write can land between the check and the update.
+# The submissions key is passed in KEYS like every key the script touches, as Redis
+# Cluster and key-prefixing proxies require.
+# The age of the submissions is the TTL they were written with (submissions_ttl, or the
+# submissions TTL argument for entries without one) minus their remaining TTL.
+# KEYS: status, result, error, submissions, submissions_ttl. ARGV: handle, submissions
+# TTL, fresh age, task TTL.
+_POLL_TASK_SCRIPT = """
+local status = redis.call('GET', KEYS[1])
+if not status then
+    return false
+end
+if status == 'completed' then
+    return {status, redis.call('GET', KEYS[2])}
+end
+if status == 'failed' then
+    return {status, redis.call('GET', KEYS[3])}
+end
+local ttl = redis.call('TTL', KEYS[4])
+local full_ttl = tonumber(redis.call('GET', KEYS[5])) or tonumber(ARGV[2])
+if ttl > 0 and full_ttl - ttl < tonumber(ARGV[3]) then
+    local result = cjson.encode({handle = ARGV[1], status = 'completed_by_another_task'})
+    redis.call('SETEX', KEYS[1], ARGV[4], 'completed')
+    redis.call('SETEX', KEYS[2], ARGV[4], result)
+    return {'completed_by_another_task', result}
+end
+return {status, false}
+"""
+
+# Claims the handle and creates the task in one atomic step, or returns the task id
+# already pending for the handle. The task id is generated by the caller.
+# The task is appended to the queue stream as native fields; the stream is capped at
+# about 100k entries, far more than can be pending at once.
+# KEYS: pending_task, queue, status, handle. ARGV: task id, enqueue timestamp, handle,
+# pending lock TTL, task TTL.
+_ENQUEUE_SCRIPT = """
+local existing = redis.call('GET', KEYS[1])
+if existing then
+    return existing
+end
+redis.call('SET', KEYS[1], ARGV[1], 'EX', ARGV[4])
+redis.call('SETEX', KEYS[3], ARGV[5], 'processing')
+redis.call('SETEX', KEYS[4], ARGV[5], ARGV[3])
+redis.call('XADD', KEYS[2], 'MAXLEN', '~', 100000, '*',
+    'task_id', ARGV[1], 'handle', ARGV[3], 'timestamp', ARGV[2])
+return ARGV[1]
+"""
+
+# Task states as stored in Redis, mapped to shared str constants so reads do not decode
+_TASK_STATUSES = {
+    status.encode(): status
+    for status in ("processing", "completed", "failed", "completed_by_another_task")
+}
+
 
 class TaskQueue:
     """
     Manages task queue for fetching Codeforces submissions asynchronously.
 
     Provides atomic deduplication using SETNX to prevent duplicate tasks
-    for the same handle, with support for task status tracking.
+    for the same handle, with support for task status tracking. Tasks are
+    appended to a Redis stream read by the workers' consumer group.
     """
 
     def __init__(self, redis: Redis):
@@ -24,7 +86,11 @@ class TaskQueue:
             redis: Async Redis client instance
         """
         self.redis = redis
-        self.queue_key = "fetch_queue"
+        self.queue_key = get_settings().worker_queue_key
+        self._poll_task = redis.register_script(_POLL_TASK_SCRIPT)
+        self._enqueue_task = redis.register_script(_ENQUEUE_SCRIPT)
+        # Enqueues currently running in this process, keyed by handle
+        self._enqueuing: dict[str, asyncio.Task[str]] = {}
 
     async def enqueue(self, handle: str) -> str:
         """
@@ -33,99 +99,197 @@ class TaskQueue:
         This method atomically checks if a task already exists for the given
         handle and creates a new one only if none exists. This prevents race
         conditions when multiple clients request the same handle simultaneously.
+        Concurrent calls for the same handle within this process (e.g. stale hits
+        on different endpoints) share a single enqueue and its Redis round trips.
 
         Args:
             handle: Codeforces user handle
 
         Returns:
-            task_id: UUID of the task (new or existing)
+            task_id: ID of the task (new or existing)
+        """
+        task = self._enqueuing.get(handle)
+        if task is None:
+            task = asyncio.create_task(self._enqueue(handle))
+            self._enqueuing[handle] = task
+            task.add_done_callback(partial(self._enqueue_done, handle))
+
+        # Shielded so a cancelled caller does not abort the enqueue for the others
+        return await asyncio.shield(task)
 
-        Flow:
-            1. Quick check for existing pending task
-            2. Generate new task_id
-            3. Atomically try to claim handle using SETNX
-            4. If successful, create task in queue
-            5. If failed (race condition), return existing task_id
+    def _enqueue_done(self, handle: str, task: asyncio.Task[str]) -> None:
+        """Forget a finished enqueue and retrieve its exception so it is not reported."""
+        if self._enqueuing.get(handle) is task:
+            del self._enqueuing[handle]
+        if not task.cancelled():
+            task.exception()
+
+    async def _enqueue(self, handle: str) -> str:
         """
-        # Step 1: Quick check for existing pending task
-        existing_task_id = await self.redis.get(f"pending_task:{handle}")
-        if existing_task_id:
-            return existing_task_id.decode()
+        Create a task for handle unless one is already pending.
 
-        # Step 2: Generate new task_id
-        task_id = str(uuid.uuid4())
+        The pending check, the SETNX-style claim and the task keys and queue entry
+        are written by one Lua script, so enqueueing is a single round trip and a
+        claimed handle always has its task queued.
 
-        # Step 3: Atomically try to "claim" the handle (SETNX)
-        was_set = await self.redis.set(
-            f"pending_task:{handle}",
-            task_id,
-            ex=60,  # Expire after 60 seconds
-            nx=True,  # Set only if Not eXists (atomic!)
-        )
+        Args:
+            handle: Codeforces user handle
+
+        Returns:
+            task_id: ID of the task (new or existing)
+        """
+        keys, args = self._enqueue_script_args(handle)
+        result = await self._enqueue_task(keys=keys, args=args)
+        return result.decode()
+
+    async def enqueue_many(self, handles: Iterable[str]) -> dict[str, str]:
+        """
+        Enqueue tasks for several handles in one pipeline.
+
+        Each handle goes through the same atomic script as enqueue, so handles
+        with a pending task keep it; all scripts are sent in a single round trip.
 
-        # Step 4: Check if we won the race
-        if not was_set:
-            # Race condition: someone else created task between step 1 and 3
-            existing_task_id = await self.redis.get(f"pending_task:{handle}")
-            return existing_task_id.decode() if existing_task_id else task_id
+        Args:
+            handles: Codeforces user handles (duplicates are enqueued once)
 
-        # Step 5: We successfully claimed handle - create the task
-        task_data = {"task_id": task_id, "handle": handle, "timestamp": time.time()}
+        Returns:
+            Mapping of handle to task_id (new or existing)
+        """
+        unique_handles = list(dict.fromkeys(handles))
+        if not unique_handles:
+            return {}
 
-        # Add to queue
-        await self.redis.rpush(self.queue_key, json.dumps(task_data))  # type: ignore[misc]
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for handle in unique_handles:
+                keys, args = self._enqueue_script_args(handle)
+                await self._enqueue_task(keys=keys, args=args, client=pipe)
+            results = await pipe.execute()
 
-        # Set initial status
-        await self.redis.setex(f"task:{task_id}:status", 300, "processing")
+        return {handle: result.decode() for handle, result in zip(unique_handles, results)}
 
-        # Store handle for reverse lookup (task_id → handle)
-        await self.redis.setex(f"task:{task_id}:handle", 300, handle)
+    def _enqueue_script_args(self, handle: str) -> tuple[list[str], list]:
+        """
+        Build the keys and arguments of the enqueue script for a new task.
 
-        return task_id
+        Args:
+            handle: Codeforces user handle
+
+        Returns:
+            Script KEYS and ARGV
+        """
+        task_id = secrets.token_hex(16)
+
+        keys = [
+            f"pending_task:{handle}",
+            self.queue_key,
+            f"task:{task_id}:status",
+            f"task:{task_id}:handle",
+        ]
+        return keys, [task_id, time.time(), handle, 60, 300]
 
     async def get_task_info(self, task_id: str) -> Optional[dict]:
         """
         Get task information including handle for deduplication checks.
 
+        All task keys are read with a single MGET, so callers get the result or error
+        of a finished task without further round trips.
+
         Args:
-            task_id: UUID of the task
+            task_id: ID of the task
 
         Returns:
-            Dictionary with task_id, status, and handle, or None if not found
+            Dictionary with task_id, status, handle, raw JSON result and error message,
+            or None if not found
         """
-        status = await self.redis.get(f"task:{task_id}:status")
+        status, handle, result, error = await self.redis.mget(
+            f"task:{task_id}:status",
+            f"task:{task_id}:handle",
+            f"task:{task_id}:result",
+            f"task:{task_id}:error",
+        )
         if not status:
             return None
 
-        handle = await self.redis.get(f"task:{task_id}:handle")
-
         return {
             "task_id": task_id,
-            "status": status.decode(),
+            "status": _TASK_STATUSES.get(status) or status.decode(),
             "handle": handle.decode() if handle else None,
+            "result": result,
+            "error": error.decode() if error else None,
         }
 
+    async def poll_task(self, task_id: str) -> Optional[tuple[str, Optional[bytes]]]:
+        """
+        Get task status and payload.
+
+        The task keys are read with one MGET, which answers finished tasks. A task
+        still processing is checked again by an atomic script: if fresh submissions
+        for its handle are already cached, the task is marked completed in the same
+        step and reported as "completed_by_another_task".
+
+        Args:
+            task_id: ID of the task
+
+        Returns:
+            Tuple of status and payload (raw JSON result for completed tasks, error
+            message for failed ones, None otherwise), or None if not found
+        """
+        status_key = f"task:{task_id}:status"
+        result_key = f"task:{task_id}:result"
+        error_key = f"task:{task_id}:error"
+        status, handle, result, error = await self.redis.mget(
+            status_key, f"task:{task_id}:handle", result_key, error_key
+        )
+        if not status:
+            return None
+        if status == b"completed":
+            return "completed", result
+        if status == b"failed":
+            return "failed", error
+        if not handle:
+            return _TASK_STATUSES.get(status) or status.decode(), None
+
+        # The handle is needed to name the submissions keys, so it is read first
+        handle_name = handle.decode()
+        reply = await self._poll_task(
+            keys=[
+                status_key,
+                result_key,
+                error_key,
+                f"submissions:{handle_name}",
+                f"submissions_ttl:{handle_name}",
+            ],
+            args=[handle, SUBMISSIONS_TTL, 14400, 300],
+        )
+        if not reply:
+            return None
+
+        status, payload = reply
+        return _TASK_STATUSES.get(status) or status.decode(), payload
+
     async def get_task_status(self, task_id: str) -> dict:
         """
         Get task status and result.
 
         Args:
-            task_id: UUID of the task
+            task_id: ID of the task
 
         Returns:
             Dictionary with status and optional result/error data
         """
-        status = await self.redis.get(f"task:{task_id}:status")
-        if not status:
+        task_info = await self.get_task_info(task_id)
+        if not task_info:
             return {"status": "not_found"}
 
-        status = status.decode()
+        status = task_info["status"]
 
         if status == "completed":
-            result = await self.redis.get(f"task:{task_id}:result")
-            return {"status": "completed", "result": json.loads(result) if result else None}
+            result = task_info["result"]
+            return {
+                "status": "completed",
+                "result": msgspec.json.decode(result) if result else None,
+            }
         elif status == "failed":
-            error = await self.redis.get(f"task:{task_id}:error")
-            return {"status": "failed", "error": error.decode() if error else "Unknown error"}
+            return {"status": "failed", "error": task_info["error"] or "Unknown error"}
         else:
             return {"status": "processing"}
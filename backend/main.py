@@ -13,10 +13,10 @@ from backend.api.app import create_app
 
 def main() -> None:
     """Run the application."""
-    from backend.config import settings
+    from backend.config import get_settings
 
     # Enable reload in development mode
-    reload_mode = settings.dev_mode
+    reload_mode = get_settings().dev_mode
 
     if reload_mode:
         # For development with reload, use import string
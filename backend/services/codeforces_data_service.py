@@ -9,20 +9,20 @@ from backend.domain.models.codeforces import Submission
 class CodeforcesDataService:
     """Service for fetching user data from Codeforces API."""
 
-    def __init__(self):
-        self.codeforces_client = CodeforcesClient()
-
     async def get_user_submissions(self, handle: str) -> List[Submission]:
         """
         Get user submissions from Codeforces API.
 
+        Clients are cheap: they all share the process-wide HTTP connection pool,
+        which is closed on application shutdown.
+
         Args:
             handle: Codeforces handle
 
         Returns:
             List of user's submissions
         """
-        async with self.codeforces_client as client:
+        async with CodeforcesClient() as client:
             try:
                 return await client.get_user_submissions(handle)
             except UserNotFoundError:
@@ -1,15 +1,105 @@
 """Shared test fixtures for the Base Metric Service unit tests."""
-import datetime
 from typing import Callable, List
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 
-from backend.domain.models import SubmissionStatus, Problem, Submission
+from backend.api.routes import base
+from backend.domain.models import SubmissionStatus
+from backend.infrastructure.task_queue import TaskQueue
+from backend.tests.unit.fakes import FakeProblem, FakeSubmission
+
+
+class FakeRedis:
+    """
+    Redis stand-in keeping values, TTLs and absolute expiry times (-2: missing key).
+
+    Counts round trips and records the keys read with GET, so tests can check what a
+    lookup transferred.
+    """
+
+    def __init__(self):
+        self.values: dict[str, bytes] = {}
+        self.ttls: dict[str, int] = {}
+        self.expiry: dict[str, int] = {}
+        self.round_trips = 0
+        self.reads: list[str] = []
+
+    def pipeline(self, transaction: bool = True) -> "_FakePipeline":
+        return _FakePipeline(self)
+
+    def read(self, key: str) -> bytes | None:
+        self.reads.append(key)
+        return self.values.get(key)
+
+    async def get(self, key: str) -> bytes | None:
+        self.round_trips += 1
+        return self.read(key)
+
+    async def set(self, key: str, value: bytes, pxat: int) -> None:
+        self.values[key] = value
+        self.expiry[key] = pxat
+
+
+class _FakePipeline:
+    """Async pipeline answering queued commands from a FakeRedis in one round trip."""
+
+    def __init__(self, redis: FakeRedis):
+        self.redis = redis
+        self.results: list = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    def ttl(self, key: str):
+        self.results.append(self.redis.ttls.get(key, -2))
+
+    def pexpiretime(self, key: str):
+        self.results.append(self.redis.expiry.get(key, -2))
+
+    def get(self, key: str):
+        self.results.append(self.redis.read(key))
+
+    async def execute(self) -> list:
+        self.redis.round_trips += 1
+        return self.results
+
+
+@pytest.fixture
+def fake_redis() -> FakeRedis:
+    """Empty FakeRedis; tests fill values, ttls and expiry as needed."""
+    return FakeRedis()
+
+
+@pytest.fixture
+def task_queue_factory() -> Callable[..., Mock]:
+    """
+    Fixture that returns a factory function to create task queue mocks.
+    Usage in tests: task_queue_factory(task_id="task-1", error=ConnectionError())
+    """
+
+    def _create(task_id: str = "task", error: Exception | None = None) -> Mock:
+        task_queue = Mock(spec=TaskQueue)
+        task_queue.enqueue = AsyncMock(return_value=task_id, side_effect=error)
+        return task_queue
+
+    return _create
+
+
+@pytest.fixture(autouse=True)
+def clear_background_state():
+    """Reset module-level in-flight bookkeeping between tests."""
+    yield
+    base._PENDING_REFRESHES.clear()
+    base._INFLIGHT_FETCHES.clear()
+    base._INFLIGHT_BODIES.clear()
 
 
 @pytest.fixture
-def mock_submission()-> Callable[..., Mock]:
+def mock_submission()-> Callable[..., FakeSubmission]:
     """
     Fixture that returns a factory function to create mock submissions.
     Usage in tests: mock_submission(contest_id=1, index='A', ...)
@@ -24,22 +114,16 @@ def mock_submission()-> Callable[..., Mock]:
             verdict: SubmissionStatus = SubmissionStatus.OK,
             programming_language: str =  "Python 3",
             is_solved: bool = False,
-    ) -> Mock:
-        mock_problem = Mock(spec=Problem)
-        mock_problem.contest_id = contest_id
-        mock_problem.index = index
-        mock_problem.name = name
-        mock_problem.rating = rating
-        mock_problem.tags = tags
-        mock_problem.problem_key = f"{contest_id}{index}"
-
-        mock_submission = Mock(spec=Submission)
-        mock_submission.contest_id = contest_id
-        mock_submission.creation_time_seconds = datetime.datetime.now().second
-        mock_submission.problem = mock_problem
-        mock_submission.verdict = verdict
-        mock_submission.programming_language = programming_language
-        mock_submission.is_solved = is_solved
-
-        return mock_submission
+            creation_time_seconds: int = 0,
+    ) -> FakeSubmission:
+        return FakeSubmission(
+            contest_id=contest_id,
+            creation_time_seconds=creation_time_seconds,
+            problem=FakeProblem(
+                contest_id=contest_id, index=index, name=name, rating=rating, tags=tags
+            ),
+            verdict=verdict,
+            programming_language=programming_language,
+            is_solved=is_solved,
+        )
     return _create
\ No newline at end of file
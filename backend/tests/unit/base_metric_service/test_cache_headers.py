@@ -0,0 +1,43 @@
+"""Tests for BaseMetricController._cache_headers()."""
+
+import pytest
+
+from backend.api.routes.base import BaseMetricController
+
+
+class TestCacheHeaders:
+    """Tests for _cache_headers static method."""
+
+    def test_default_max_age(self):
+        assert BaseMetricController._cache_headers() == {"Cache-Control": "public, max-age=14400"}
+
+    def test_zero_max_age(self):
+        assert BaseMetricController._cache_headers(0) == {"Cache-Control": "public, max-age=0"}
+
+    def test_arbitrary_max_age(self):
+        assert BaseMetricController._cache_headers(120) == {"Cache-Control": "public, max-age=120"}
+
+    def test_max_age_rounds_down_to_minute(self):
+        assert BaseMetricController._cache_headers(179) == {"Cache-Control": "public, max-age=120"}
+        assert BaseMetricController._cache_headers(59) == {"Cache-Control": "public, max-age=0"}
+
+    def test_negative_max_age_clamps_to_zero(self):
+        assert BaseMetricController._cache_headers(-5) == {"Cache-Control": "public, max-age=0"}
+
+    def test_common_values_reuse_one_dict(self):
+        assert BaseMetricController._cache_headers(14400) is BaseMetricController._cache_headers()
+        assert BaseMetricController._cache_headers(0) is BaseMetricController._cache_headers(0)
+
+    def test_same_minute_reuses_one_dict(self):
+        assert BaseMetricController._cache_headers(130) is BaseMetricController._cache_headers(170)
+
+    def test_shared_headers_are_read_only(self):
+        with pytest.raises(TypeError):
+            BaseMetricController._cache_headers()["Cache-Control"] = "no-store"  # type: ignore[index]
+
+    def test_stale_headers(self):
+        assert BaseMetricController._stale_headers(20000) == {
+            "Cache-Control": "public, max-age=0",
+            "X-Data-Stale": "true",
+            "X-Data-Age": "20000",
+        }
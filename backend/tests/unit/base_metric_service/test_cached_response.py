@@ -0,0 +1,165 @@
+"""Tests for BaseMetricController._get_cached_response() and _cache_response()."""
+
+import asyncio
+
+from backend.api.routes.base import BaseMetricController
+from backend.api.schemas.common import AsyncTaskResponse
+from backend.domain.models.time_period import TimePeriod
+
+EXPIRES_AT = 1_700_000_000_000
+CACHE_KEY = "response:test:user"
+
+
+def _store_submissions(redis, ttl: int):
+    """Give the fake Redis a submissions entry for "user" with the given TTL."""
+    redis.ttls["submissions:user"] = ttl
+    redis.expiry["submissions:user"] = EXPIRES_AT
+    return redis
+
+
+RESPONSE = AsyncTaskResponse(status="processing", task_id="t", retry_after=2)
+
+
+class TestCachedResponse:
+    """Tests for the pre-serialized response cache."""
+
+    async def test_not_cacheable(self, fake_redis, task_queue_factory):
+        redis = _store_submissions(fake_redis, 86400)
+        result = await BaseMetricController._get_cached_response(
+            redis, task_queue_factory(), "user", None, False
+        )
+        assert result is None
+
+    async def test_miss_without_body(self, fake_redis, task_queue_factory):
+        redis = _store_submissions(fake_redis, 86400)
+        result = await BaseMetricController._get_cached_response(
+            redis, task_queue_factory(), "user", CACHE_KEY, False
+        )
+        assert result is None
+
+    async def test_round_trip_fresh(self, fake_redis, task_queue_factory):
+        redis = _store_submissions(fake_redis, 86400 - 60)
+        await BaseMetricController._cache_response(redis, CACHE_KEY, RESPONSE, EXPIRES_AT)
+
+        response = await BaseMetricController._get_cached_response(
+            redis, task_queue_factory(), "user", CACHE_KEY, False
+        )
+        assert response is not None
+        assert response.content == RESPONSE.model_dump_json().encode()
+        assert response.media_type == "application/json"
+        assert response.headers["Cache-Control"] == "public, max-age=14340"
+        assert response.headers["ETag"] == f'W/"{EXPIRES_AT}"'
+
+    async def test_age_is_derived_from_stored_ttl(self, fake_redis, task_queue_factory):
+        # Written with a jittered 23h TTL 60s ago
+        redis = _store_submissions(fake_redis, 82800 - 60)
+        redis.values["submissions_ttl:user"] = b"82800"
+        await BaseMetricController._cache_response(redis, CACHE_KEY, RESPONSE, EXPIRES_AT)
+
+        response = await BaseMetricController._get_cached_response(
+            redis, task_queue_factory(), "user", CACHE_KEY, False
+        )
+        assert response is not None
+        assert response.headers["Cache-Control"] == "public, max-age=14340"
+
+    async def test_matching_etag_returns_304(self, fake_redis, task_queue_factory):
+        redis = _store_submissions(fake_redis, 86400 - 60)
+        await BaseMetricController._cache_response(redis, CACHE_KEY, RESPONSE, EXPIRES_AT)
+
+        response = await BaseMetricController._get_cached_response(
+            redis, task_queue_factory(), "user", CACHE_KEY, False, f'"other", W/"{EXPIRES_AT}"'
+        )
+        assert response is not None
+        assert response.status_code == 304
+        assert response.content is None
+        assert response.headers["ETag"] == f'W/"{EXPIRES_AT}"'
+
+    async def test_etag_from_previous_generation_returns_body(self, fake_redis, task_queue_factory):
+        redis = _store_submissions(fake_redis, 86400 - 60)
+        await BaseMetricController._cache_response(redis, CACHE_KEY, RESPONSE, EXPIRES_AT)
+
+        response = await BaseMetricController._get_cached_response(
+            redis, task_queue_factory(), "user", CACHE_KEY, False, f'W/"{EXPIRES_AT - 1}"'
+        )
+        assert response is not None
+        assert response.status_code != 304
+        assert response.content == RESPONSE.model_dump_json().encode()
+
+    def test_etag_matches(self):
+        assert BaseMetricController._etag_matches('"1"', 'W/"1"')
+        assert BaseMetricController._etag_matches("*", 'W/"1"')
+        assert not BaseMetricController._etag_matches('W/"2"', 'W/"1"')
+
+    def test_with_etag_only_for_cached_bodies(self):
+        headers = BaseMetricController._cache_headers()
+        assert BaseMetricController._with_etag(headers, None, EXPIRES_AT) is headers
+        assert BaseMetricController._with_etag(headers, CACHE_KEY, -2) is headers
+        assert BaseMetricController._with_etag(headers, CACHE_KEY, EXPIRES_AT) == {
+            **headers,
+            "ETag": f'W/"{EXPIRES_AT}"',
+        }
+
+    async def test_body_from_previous_generation_is_ignored(self, fake_redis, task_queue_factory):
+        redis = _store_submissions(fake_redis, 86400)
+        await BaseMetricController._cache_response(redis, CACHE_KEY, RESPONSE, EXPIRES_AT - 1)
+
+        response = await BaseMetricController._get_cached_response(
+            redis, task_queue_factory(), "user", CACHE_KEY, False
+        )
+        assert response is None
+
+    async def test_missing_submissions_ignore_body(self, fake_redis, task_queue_factory):
+        redis = fake_redis
+        await BaseMetricController._cache_response(redis, CACHE_KEY, RESPONSE, EXPIRES_AT)
+        response = await BaseMetricController._get_cached_response(
+            redis, task_queue_factory(), "user", CACHE_KEY, False
+        )
+        assert response is None
+
+    async def test_stale_body_served_and_refresh_enqueued(self, fake_redis, task_queue_factory):
+        redis = _store_submissions(fake_redis, 86400 - 20000)
+        task_queue = task_queue_factory()
+        await BaseMetricController._cache_response(redis, CACHE_KEY, RESPONSE, EXPIRES_AT)
+
+        response = await BaseMetricController._get_cached_response(
+            redis, task_queue, "user", CACHE_KEY, False
+        )
+        assert response is not None
+        assert response.headers["X-Data-Stale"] == "true"
+        assert response.headers["X-Data-Age"] == "20000"
+        assert response.headers["Cache-Control"] == "public, max-age=0"
+        await asyncio.sleep(0)  # let the background enqueue task run
+        task_queue.enqueue.assert_awaited_once_with("user")
+
+    async def test_stale_body_skipped_when_prefer_fresh(self, fake_redis, task_queue_factory):
+        redis = _store_submissions(fake_redis, 86400 - 20000)
+        await BaseMetricController._cache_response(redis, CACHE_KEY, RESPONSE, EXPIRES_AT)
+        response = await BaseMetricController._get_cached_response(
+            redis, task_queue_factory(), "user", CACHE_KEY, True
+        )
+        assert response is None
+
+    async def test_cache_response_returns_stored_body(self, fake_redis):
+        redis = fake_redis
+        content = await BaseMetricController._cache_response(redis, CACHE_KEY, RESPONSE, EXPIRES_AT)
+        assert content == RESPONSE.model_dump_json().encode()
+        assert redis.values[CACHE_KEY] == content
+
+    async def test_cache_response_skips_without_expiry(self, fake_redis):
+        redis = fake_redis
+        assert (
+            await BaseMetricController._cache_response(redis, CACHE_KEY, RESPONSE, -2)
+            == RESPONSE.model_dump_json().encode()
+        )
+        await BaseMetricController._cache_response(redis, None, RESPONSE, EXPIRES_AT)
+        assert redis.values == {}
+
+    def test_cache_key_for_all_time(self):
+        key = BaseMetricController._response_cache_key("tag-ratings", "user", TimePeriod.ALL_TIME)
+        assert key == "response:tag-ratings:user"
+
+    def test_no_cache_key_for_filtered_period(self):
+        assert (
+            BaseMetricController._response_cache_key("tag-ratings", "user", TimePeriod.MONTH)
+            is None
+        )
@@ -1,183 +1,46 @@
-from backend.domain.services import BaseMetricService
-
-
-def test_deduplicate_problems_happy_path(mock_submission):
-    submission1 = mock_submission(
-        contest_id=1,
-        index='1',
-        name="submission1",
-        rating=800,
-        tags=['tag'],
-        is_solved=False,
-    )
-
-    submission2 = mock_submission(
-        contest_id=1,
-        index='1',
-        name="submission2",
-        rating=900,
-        tags=['tag'],
-        is_solved=True,
-    )
-
-    result = BaseMetricService._deduplicate_problems([submission1, submission2])
-    assert result == [submission1]
-
-def test_deduplicate_problems_empty_submissions_list(mock_submission):
-   result = BaseMetricService._deduplicate_problems([])
-   assert result == []
-
-def test_deduplicate_problems_single_submission(mock_submission):
-   submission1 = mock_submission(
-       contest_id=1,
-       index='1',
-       name="submission1",
-       rating=800,
-       tags=['tag'],
-       is_solved=False,
-   )
-
-   result = BaseMetricService._deduplicate_problems([submission1])
-
-   assert result == [submission1]
-
-def test_deduplicate_problems_all_unique_submissions(mock_submission):
-    submission1 = mock_submission(
-        contest_id=1,
-        index='1',
-        name="submission1",
-        rating=800,
-        tags=['tag'],
-        is_solved=False,
-    )
-
-    submission2 = mock_submission(
-        contest_id=2,
-        index='2',
-        name="submission2",
-        rating=900,
-        tags=['tag'],
-        is_solved=True,
-    )
-
-    submission3 = mock_submission(
-        contest_id=3,
-        index='3',
-        name="submission3",
-        rating=900,
-        tags=['tag'],
-        is_solved=True,
-    )
-
-    result = BaseMetricService._deduplicate_problems([submission1, submission2, submission3])
-
-    assert result == [submission1, submission2, submission3]
-
-def test_deduplicate_problems_multiple_duplicates(mock_submission):
-    submission1 = mock_submission(
-        contest_id=1,
-        index='1',
-        name="submission1",
-        rating=800,
-        tags=['tag'],
-        is_solved=False,
-    )
+import pytest
 
-    submission2 = mock_submission(
-        contest_id=1,
-        index='1',
-        name="submission2",
-        rating=900,
-        tags=['tag'],
-        is_solved=True,
-    )
-
-    submission3 = mock_submission(
-        contest_id=1,
-        index='1',
-        name="submission3",
-        rating=800,
-        tags=['tag'],
-        is_solved=False,
-    )
-
-    result = BaseMetricService._deduplicate_problems([submission1, submission2, submission3])
-
-    assert result == [submission1]
-
-def test_deduplicate_problems_preserves_order(mock_submission):
-    submission1 = mock_submission(
-        contest_id=1,
-        index='1',
-        name="submission1",
-        rating=800,
-        tags=['tag'],
-        is_solved=False,
-    )
-
-    submission2 = mock_submission(
-        contest_id=2,
-        index='2',
-        name="submission2",
-        rating=900,
-        tags=['tag'],
-        is_solved=True,
-    )
-
-    submission3 = mock_submission(
-        contest_id=1,
-        index='1',
-        name="submission3",
-        rating=800,
-        tags=['tag'],
-        is_solved=False,
-    )
-
-    result = BaseMetricService._deduplicate_problems([submission1, submission2, submission3])
-
-    assert result == [submission1, submission2]
-
-def test_deduplicate_problems_same_index_different_contest_id(mock_submission):
-    submission1 = mock_submission(
-        contest_id=1,
-        index='1',
-        name="submission1",
-        rating=800,
-        tags=['tag'],
-        is_solved=False,
-    )
-
-    submission2 = mock_submission(
-        contest_id=2,
-        index='1',
-        name="submission2",
-        rating=900,
-        tags=['tag'],
-        is_solved=True,
-    )
-
-    result = BaseMetricService._deduplicate_problems([submission1, submission2])
-    assert result == [submission1, submission2]
-
-def test_deduplicate_problems_different_index_same_contest_id(mock_submission):
-
-    submission1 = mock_submission(
-        contest_id=1,
-        index='2',
-        name="submission1",
-        rating=800,
-        tags=['tag'],
-        is_solved=False,
-    )
+from backend.domain.services import BaseMetricService
 
-    submission2 = mock_submission(
-        contest_id=1,
-        index='1',
-        name="submission2",
-        rating=900,
-        tags=['tag'],
-        is_solved=True,
-    )
 
-    result = BaseMetricService._deduplicate_problems([submission1, submission2])
-    assert result == [submission1, submission2]
+@pytest.mark.parametrize(
+    ("specs", "expected"),
+    [
+        pytest.param([(1, "1", False), (1, "1", True)], [0], id="happy_path"),
+        pytest.param([], [], id="empty_submissions_list"),
+        pytest.param([(1, "1", False)], [0], id="single_submission"),
+        pytest.param(
+            [(1, "1", False), (2, "2", True), (3, "3", True)],
+            [0, 1, 2],
+            id="all_unique_submissions",
+        ),
+        pytest.param(
+            [(1, "1", False), (1, "1", True), (1, "1", False)], [0], id="multiple_duplicates"
+        ),
+        pytest.param(
+            [(1, "1", False), (2, "2", True), (1, "1", False)], [0, 1], id="preserves_order"
+        ),
+        pytest.param(
+            [(1, "1", False), (2, "1", True)], [0, 1], id="same_index_different_contest_id"
+        ),
+        pytest.param(
+            [(1, "2", False), (1, "1", True)], [0, 1], id="different_index_same_contest_id"
+        ),
+    ],
+)
+def test_deduplicate_problems(mock_submission, specs, expected):
+    submissions = [
+        mock_submission(
+            contest_id=contest_id,
+            index=index,
+            name=f"submission{number}",
+            rating=800,
+            tags=["tag"],
+            is_solved=is_solved,
+        )
+        for number, (contest_id, index, is_solved) in enumerate(specs, start=1)
+    ]
+
+    result = BaseMetricService._deduplicate_problems(submissions)
+
+    assert result == [submissions[i] for i in expected]
@@ -0,0 +1,109 @@
+"""Tests for BaseMetricController.fetch_submissions_once()."""
+
+import asyncio
+from unittest.mock import Mock
+
+import pytest
+
+from backend.api.routes import base
+from backend.api.routes.base import BaseMetricController
+from backend.infrastructure.codeforces_client import UserNotFoundError
+from backend.services.codeforces_data_service import CodeforcesDataService
+
+
+def _make_data_service(result=None, error: Exception | None = None) -> Mock:
+    """Create a data service whose fetch blocks until the returned event is set."""
+    release = asyncio.Event()
+    data_service = Mock(spec=CodeforcesDataService)
+
+    async def get_user_submissions(handle: str):
+        await release.wait()
+        if error is not None:
+            raise error
+        return result
+
+    data_service.get_user_submissions = Mock(side_effect=get_user_submissions)
+    data_service.release = release
+    return data_service
+
+
+class TestFetchSubmissionsOnce:
+    """Tests for fetch_submissions_once static method."""
+
+    async def test_concurrent_requests_share_one_fetch(self):
+        data_service = _make_data_service(result=["sub"])
+        waiters = [
+            asyncio.create_task(BaseMetricController.fetch_submissions_once(data_service, "user"))
+            for _ in range(5)
+        ]
+        await asyncio.sleep(0)
+        data_service.release.set()
+
+        results = await asyncio.gather(*waiters)
+        assert all(r == ["sub"] for r in results)
+        data_service.get_user_submissions.assert_called_once_with("user")
+        assert "user" not in base._INFLIGHT_FETCHES
+
+    async def test_different_handles_fetch_separately(self):
+        data_service = _make_data_service(result=[])
+        data_service.release.set()
+        await asyncio.gather(
+            BaseMetricController.fetch_submissions_once(data_service, "a"),
+            BaseMetricController.fetch_submissions_once(data_service, "b"),
+        )
+        assert data_service.get_user_submissions.call_count == 2
+
+    async def test_error_propagates_to_all_waiters(self):
+        data_service = _make_data_service(error=UserNotFoundError("missing"))
+        waiters = [
+            asyncio.create_task(BaseMetricController.fetch_submissions_once(data_service, "user"))
+            for _ in range(2)
+        ]
+        await asyncio.sleep(0)
+        data_service.release.set()
+
+        results = await asyncio.gather(*waiters, return_exceptions=True)
+        assert all(isinstance(r, UserNotFoundError) for r in results)
+        assert "user" not in base._INFLIGHT_FETCHES
+
+    async def test_next_request_after_completion_fetches_again(self):
+        data_service = _make_data_service(result=[])
+        data_service.release.set()
+        await BaseMetricController.fetch_submissions_once(data_service, "user")
+        await BaseMetricController.fetch_submissions_once(data_service, "user")
+        assert data_service.get_user_submissions.call_count == 2
+
+    async def test_cancelled_waiter_does_not_cancel_shared_fetch(self):
+        data_service = _make_data_service(result=["sub"])
+        first = asyncio.create_task(
+            BaseMetricController.fetch_submissions_once(data_service, "user")
+        )
+        second = asyncio.create_task(
+            BaseMetricController.fetch_submissions_once(data_service, "user")
+        )
+        await asyncio.sleep(0)
+        first.cancel()
+        data_service.release.set()
+
+        assert await second == ["sub"]
+        with pytest.raises(asyncio.CancelledError):
+            await first
+
+    async def test_failure_with_only_cancelled_waiters_is_retrieved(self):
+        data_service = _make_data_service(error=UserNotFoundError("missing"))
+        waiter = asyncio.create_task(
+            BaseMetricController.fetch_submissions_once(data_service, "user")
+        )
+        await asyncio.sleep(0)
+        fetch = base._INFLIGHT_FETCHES["user"]
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        data_service.release.set()
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+
+        assert fetch.done()
+        # A retrieved exception is not logged as "never retrieved" on collection
+        assert not fetch._log_traceback
+        assert "user" not in base._INFLIGHT_FETCHES
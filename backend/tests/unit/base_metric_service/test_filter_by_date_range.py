@@ -5,6 +5,7 @@ from unittest.mock import Mock
 
 from backend.api.routes.base import BaseMetricController
 from backend.domain.models import Submission
+from backend.infrastructure.submissions_codec import sort_newest_first
 
 
 def _make_submission(timestamp: int) -> Mock:
@@ -18,34 +19,53 @@ class TestFilterByDateRange:
     """Tests for _filter_by_date_range static method."""
 
     def test_no_filters_returns_all(self):
-        subs = [_make_submission(100), _make_submission(200), _make_submission(300)]
+        subs = [_make_submission(300), _make_submission(200), _make_submission(100)]
         result = BaseMetricController._filter_by_date_range(subs)
         assert len(result) == 3
 
     def test_start_date_only(self):
-        subs = [_make_submission(100), _make_submission(200), _make_submission(300)]
+        subs = [_make_submission(300), _make_submission(200), _make_submission(100)]
         start = datetime(1970, 1, 1, 0, 3, 15, tzinfo=timezone.utc)  # timestamp 195
         result = BaseMetricController._filter_by_date_range(subs, start_date=start)
         assert len(result) == 2
         assert all(s.creation_time_seconds >= 195 for s in result)
 
     def test_end_date_only(self):
-        subs = [_make_submission(100), _make_submission(200), _make_submission(300)]
+        subs = [_make_submission(300), _make_submission(200), _make_submission(100)]
         end = datetime(1970, 1, 1, 0, 3, 15, tzinfo=timezone.utc)  # timestamp 195
         result = BaseMetricController._filter_by_date_range(subs, end_date=end)
         assert len(result) == 1
         assert result[0].creation_time_seconds == 100
 
     def test_both_start_and_end(self):
-        subs = [_make_submission(100), _make_submission(200), _make_submission(300)]
+        subs = [_make_submission(300), _make_submission(200), _make_submission(100)]
         start = datetime(1970, 1, 1, 0, 2, 30, tzinfo=timezone.utc)  # timestamp 150
         end = datetime(1970, 1, 1, 0, 4, 10, tzinfo=timezone.utc)  # timestamp 250
         result = BaseMetricController._filter_by_date_range(subs, start_date=start, end_date=end)
         assert len(result) == 1
         assert result[0].creation_time_seconds == 200
 
+    def test_no_filters_returns_same_list(self):
+        subs = [_make_submission(200), _make_submission(100)]
+        assert BaseMetricController._filter_by_date_range(subs) is subs
+
+    def test_preserves_order(self):
+        subs = [_make_submission(300), _make_submission(100), _make_submission(200)]
+        # Unsorted input is ordered where it is written or decoded, before filtering
+        sort_newest_first(subs)
+        start = datetime(1970, 1, 1, 0, 2, 30, tzinfo=timezone.utc)  # timestamp 150
+        result = BaseMetricController._filter_by_date_range(subs, start_date=start)
+        assert [s.creation_time_seconds for s in result] == [300, 200]
+
+    def test_equal_timestamps_on_boundaries_are_kept(self):
+        subs = [_make_submission(t) for t in (300, 200, 200, 100, 100)]
+        start = datetime(1970, 1, 1, 0, 1, 40, tzinfo=timezone.utc)  # timestamp 100
+        end = datetime(1970, 1, 1, 0, 3, 20, tzinfo=timezone.utc)  # timestamp 200
+        result = BaseMetricController._filter_by_date_range(subs, start_date=start, end_date=end)
+        assert [s.creation_time_seconds for s in result] == [200, 200, 100, 100]
+
     def test_none_parameters_no_filtering(self):
-        subs = [_make_submission(100), _make_submission(200)]
+        subs = [_make_submission(200), _make_submission(100)]
         result = BaseMetricController._filter_by_date_range(subs, start_date=None, end_date=None)
         assert len(result) == 2
 
@@ -61,7 +81,7 @@ class TestFilterByDateRange:
 
     def test_inclusive_boundaries(self):
         # start_date and end_date should be inclusive (>= and <=)
-        subs = [_make_submission(100), _make_submission(200), _make_submission(300)]
+        subs = [_make_submission(300), _make_submission(200), _make_submission(100)]
         start = datetime(1970, 1, 1, 0, 1, 40, tzinfo=timezone.utc)  # timestamp 100
         end = datetime(1970, 1, 1, 0, 5, 0, tzinfo=timezone.utc)  # timestamp 300
         result = BaseMetricController._filter_by_date_range(subs, start_date=start, end_date=end)
@@ -0,0 +1,148 @@
+"""Tests for BaseMetricController.get_submissions_with_staleness()."""
+
+import pytest
+
+from backend.api.routes import base
+from backend.api.routes.base import BaseMetricController
+from backend.domain.models import Problem, Submission, SubmissionStatus
+from backend.infrastructure.submissions_codec import encode_submissions
+
+EXPIRES_AT = 1_700_000_000_000
+KEY = "submissions:user"
+
+
+@pytest.fixture(autouse=True)
+def clear_submissions_memo():
+    base._SUBMISSIONS_MEMO.clear()
+    yield
+    base._SUBMISSIONS_MEMO.clear()
+
+
+def _store(redis, cached: bytes | None, ttl: int, handles=("user",)):
+    """Give the fake Redis a submissions payload, TTL and expiry time per handle."""
+    for handle in handles:
+        key = f"submissions:{handle}"
+        if cached is not None:
+            redis.values[key] = cached
+        redis.ttls[key] = ttl
+        redis.expiry[key] = EXPIRES_AT
+    return redis
+
+
+def _cached_payload(submissions: list[Submission]) -> bytes:
+    """Serialize submissions the same way the worker stores them."""
+    return encode_submissions(submissions)
+
+
+SUBMISSIONS = [
+    Submission(
+        id=1,
+        contest_id=1000,
+        creation_time_seconds=1609459200,
+        problem=Problem(contest_id=1000, index="A", name="P1", rating=800, tags=["math"]),
+        verdict=SubmissionStatus.OK,
+        programming_language="Python 3",
+    ),
+    Submission(
+        id=2,
+        contest_id=1001,
+        creation_time_seconds=1609545600,
+        problem=Problem(contest_id=1001, index="B", name="P2"),
+        verdict=SubmissionStatus.WRONG_ANSWER,
+        programming_language="C++17",
+    ),
+]
+
+
+class TestGetSubmissionsWithStaleness:
+    """Tests for get_submissions_with_staleness static method."""
+
+    async def test_cache_miss(self, fake_redis):
+        redis = _store(fake_redis, None, -2)
+        result = await BaseMetricController.get_submissions_with_staleness(redis, "user")
+        assert result == (None, 0, False, -2)
+
+    async def test_key_without_ttl_treated_as_miss(self, fake_redis):
+        redis = _store(fake_redis, _cached_payload(SUBMISSIONS), -1)
+        result = await BaseMetricController.get_submissions_with_staleness(redis, "user")
+        assert result == (None, 0, False, -2)
+
+    async def test_fresh_cache_decodes_submissions(self, fake_redis):
+        redis = _store(fake_redis, _cached_payload(SUBMISSIONS), 86400 - 60)
+        result = await BaseMetricController.get_submissions_with_staleness(redis, "user")
+        submissions, age, is_stale, expires_at = result
+        assert submissions == SUBMISSIONS
+        assert age == 60
+        assert is_stale is False
+        assert expires_at == EXPIRES_AT
+
+    async def test_age_is_derived_from_stored_ttl(self, fake_redis):
+        redis = _store(fake_redis, _cached_payload(SUBMISSIONS), 82800 - 60)
+        redis.values["submissions_ttl:user"] = b"82800"
+        _, age, is_stale, _ = await BaseMetricController.get_submissions_with_staleness(
+            redis, "user"
+        )
+        assert age == 60
+        assert is_stale is False
+
+    async def test_cold_lookup_takes_single_round_trip(self, fake_redis):
+        redis = _store(fake_redis, _cached_payload(SUBMISSIONS), 86400)
+        await BaseMetricController.get_submissions_with_staleness(redis, "user")
+        assert redis.round_trips == 1
+
+    async def test_decoded_submissions_keep_domain_behaviour(self, fake_redis):
+        redis = _store(fake_redis, _cached_payload(SUBMISSIONS), 86400)
+        submissions, _, _, _ = await BaseMetricController.get_submissions_with_staleness(
+            redis, "user"
+        )
+        assert submissions is not None
+        assert submissions[0].is_solved is True
+        assert submissions[1].is_solved is False
+        assert submissions[1].verdict is SubmissionStatus.WRONG_ANSWER
+        assert submissions[1].problem.rating is None
+        assert submissions[1].problem.tags == []
+        assert submissions[0].problem.problem_key == "1000A"
+
+    async def test_undecodable_payload_treated_as_miss(self, fake_redis):
+        redis = _store(fake_redis, b"\xc1", 86400)
+        result = await BaseMetricController.get_submissions_with_staleness(redis, "user")
+        assert result == (None, 0, False, -2)
+        assert "user" not in base._SUBMISSIONS_MEMO
+
+    async def test_stale_cache(self, fake_redis):
+        redis = _store(fake_redis, _cached_payload(SUBMISSIONS), 86400 - 14401)
+        _, age, is_stale, _ = await BaseMetricController.get_submissions_with_staleness(
+            redis, "user"
+        )
+        assert age == 14401
+        assert is_stale is True
+
+    async def test_repeat_lookup_served_from_memo(self, fake_redis):
+        redis = _store(fake_redis, _cached_payload(SUBMISSIONS), 86400 - 60)
+        first, _, _, _ = await BaseMetricController.get_submissions_with_staleness(redis, "user")
+        second, age, _, _ = await BaseMetricController.get_submissions_with_staleness(redis, "user")
+        assert second is first
+        assert age == 60
+        assert redis.reads.count(KEY) == 1
+
+    async def test_new_cache_generation_is_decoded_again(self, fake_redis):
+        redis = _store(fake_redis, _cached_payload(SUBMISSIONS), 86400)
+        first, _, _, _ = await BaseMetricController.get_submissions_with_staleness(redis, "user")
+
+        redis.values[KEY] = _cached_payload(SUBMISSIONS[:1])
+        redis.expiry[KEY] = EXPIRES_AT + 5000
+        second, _, _, expires_at = await BaseMetricController.get_submissions_with_staleness(
+            redis, "user"
+        )
+        assert first == SUBMISSIONS
+        assert second == SUBMISSIONS[:1]
+        # The expiry comes from the same read as the payload it was decoded from
+        assert expires_at == EXPIRES_AT + 5000
+        assert redis.reads.count(KEY) == 2
+
+    async def test_memo_is_bounded(self, fake_redis, monkeypatch):
+        monkeypatch.setattr(base, "_SUBMISSIONS_MEMO_SIZE", 2)
+        redis = _store(fake_redis, _cached_payload(SUBMISSIONS), 86400, ("a", "b", "c"))
+        for handle in ("a", "b", "c"):
+            await BaseMetricController.get_submissions_with_staleness(redis, handle)
+        assert list(base._SUBMISSIONS_MEMO) == ["b", "c"]
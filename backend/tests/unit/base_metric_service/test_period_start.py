@@ -0,0 +1,35 @@
+"""Tests for BaseMetricController._period_start() and get_current_timestamp()."""
+
+from datetime import timezone
+from unittest.mock import patch
+
+from backend.api.routes.base import BaseMetricController
+from backend.domain.models.time_period import TimePeriod
+
+
+class TestPeriodStart:
+    """Tests for the cached clock and period start helper."""
+
+    def test_all_time_skips_clock(self):
+        with patch("backend.api.routes.base.time.time") as clock:
+            assert BaseMetricController._period_start(TimePeriod.ALL_TIME) is None
+        clock.assert_not_called()
+
+    def test_bounded_period_uses_current_timestamp(self):
+        now = BaseMetricController.get_current_timestamp()
+        start = BaseMetricController._period_start(TimePeriod.DAY)
+        assert start is not None
+        assert 86400 <= (now - start).total_seconds() <= 86401
+
+    def test_timestamp_is_utc_whole_seconds(self):
+        now = BaseMetricController.get_current_timestamp()
+        assert now.tzinfo is timezone.utc
+        assert now.microsecond == 0
+
+    def test_timestamp_shared_within_a_second(self):
+        with patch("backend.api.routes.base.time.time", return_value=1700000000.25):
+            first = BaseMetricController.get_current_timestamp()
+        with patch("backend.api.routes.base.time.time", return_value=1700000000.75):
+            second = BaseMetricController.get_current_timestamp()
+        assert first is second
+        assert first.timestamp() == 1700000000
@@ -0,0 +1,58 @@
+"""Tests for BaseMetricController._schedule_refresh()."""
+
+import asyncio
+
+from backend.api.routes import base
+from backend.api.routes.base import BaseMetricController
+
+
+async def _drain() -> None:
+    """Let scheduled tasks and their done callbacks run."""
+    for _ in range(3):
+        await asyncio.sleep(0)
+
+
+class TestScheduleRefresh:
+    """Tests for _schedule_refresh static method."""
+
+    async def test_concurrent_refreshes_coalesce(self, task_queue_factory):
+        task_queue = task_queue_factory()
+        for _ in range(5):
+            BaseMetricController._schedule_refresh(task_queue, "user")
+        await _drain()
+        task_queue.enqueue.assert_awaited_once_with("user")
+        assert "user" not in base._PENDING_REFRESHES
+
+    async def test_different_handles_enqueue_separately(self, task_queue_factory):
+        task_queue = task_queue_factory()
+        BaseMetricController._schedule_refresh(task_queue, "a")
+        BaseMetricController._schedule_refresh(task_queue, "b")
+        await _drain()
+        assert task_queue.enqueue.await_count == 2
+
+    async def test_refresh_allowed_again_after_completion(self, task_queue_factory):
+        task_queue = task_queue_factory()
+        BaseMetricController._schedule_refresh(task_queue, "user")
+        await _drain()
+        BaseMetricController._schedule_refresh(task_queue, "user")
+        await _drain()
+        assert task_queue.enqueue.await_count == 2
+
+    async def test_failed_enqueue_is_forgotten(self, task_queue_factory):
+        task_queue = task_queue_factory(error=ConnectionError())
+        BaseMetricController._schedule_refresh(task_queue, "user")
+        await _drain()
+        assert "user" not in base._PENDING_REFRESHES
+
+    async def test_concurrent_refreshes_are_bounded(self, monkeypatch, task_queue_factory):
+        monkeypatch.setattr(base, "_MAX_PENDING_REFRESHES", 2)
+        task_queue = task_queue_factory()
+        for handle in ("a", "b", "c"):
+            BaseMetricController._schedule_refresh(task_queue, handle)
+        assert set(base._PENDING_REFRESHES) == {"a", "b"}
+        await _drain()
+        assert task_queue.enqueue.await_count == 2
+
+        BaseMetricController._schedule_refresh(task_queue, "c")
+        await _drain()
+        task_queue.enqueue.assert_awaited_with("c")
@@ -0,0 +1,317 @@
+"""Tests for BaseMetricController._serve_cached()."""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from litestar.exceptions import HTTPException
+
+from backend.api.routes import base
+from backend.api.routes.base import BaseMetricController
+from backend.api.schemas.common import AsyncTaskResponse
+from backend.domain.models import Submission
+from backend.infrastructure.codeforces_client import UserNotFoundError
+from backend.services.codeforces_data_service import CodeforcesDataService
+
+SUBMISSIONS = [Mock(spec=Submission, creation_time_seconds=100)]
+RESPONSE = AsyncTaskResponse(status="done", task_id="t", retry_after=0)
+
+
+@pytest.fixture
+def controller(monkeypatch) -> BaseMetricController:
+    """Controller instance with Redis-backed lookups replaced by mocks."""
+    controller = BaseMetricController.__new__(BaseMetricController)
+    monkeypatch.setattr(BaseMetricController, "_get_cached_response", AsyncMock(return_value=None))
+    monkeypatch.setattr(
+        BaseMetricController,
+        "_cache_response",
+        AsyncMock(side_effect=lambda redis, key, response, expires_at: response),
+    )
+    return controller
+
+
+def _data_service(submissions=SUBMISSIONS, error: Exception | None = None) -> Mock:
+    data_service = Mock(spec=CodeforcesDataService)
+    data_service.get_user_submissions = AsyncMock(return_value=submissions, side_effect=error)
+    return data_service
+
+
+def _redis(not_found: bool = False) -> AsyncMock:
+    redis = AsyncMock()
+    redis.exists.return_value = int(not_found)
+    return redis
+
+
+async def _serve(
+    controller, monkeypatch, cached, task_queue, data_service, prefer_fresh=False, redis=None
+):
+    monkeypatch.setattr(
+        BaseMetricController,
+        "get_submissions_with_staleness",
+        AsyncMock(return_value=cached),
+    )
+    analyze = Mock(return_value="analysis")
+    build_response = Mock(return_value=RESPONSE)
+    response = await controller._serve_cached(
+        redis or _redis(),
+        task_queue,
+        data_service,
+        "user",
+        prefer_fresh,
+        start_date=None,
+        analyze=analyze,
+        build_response=build_response,
+    )
+    return response, analyze, build_response
+
+
+class TestServeCached:
+    """Tests for the shared fresh/stale/cold request flow."""
+
+    async def test_fresh_data(self, controller, monkeypatch, task_queue_factory):
+        response, analyze, build_response = await _serve(
+            controller,
+            monkeypatch,
+            (SUBMISSIONS, 60, False, 1),
+            task_queue_factory(),
+            _data_service(),
+        )
+        assert response.content is RESPONSE
+        assert response.headers["Cache-Control"] == "public, max-age=14340"
+        analyze.assert_called_once_with(SUBMISSIONS)
+        build_response.assert_called_once_with("analysis")
+
+    async def test_stale_data_enqueues_refresh(self, controller, monkeypatch, task_queue_factory):
+        task_queue = task_queue_factory()
+        response, _, _ = await _serve(
+            controller, monkeypatch, (SUBMISSIONS, 20000, True, 1), task_queue, _data_service()
+        )
+        await asyncio.sleep(0)
+        assert response.content is RESPONSE
+        assert response.headers["X-Data-Stale"] == "true"
+        assert response.headers["X-Data-Age"] == "20000"
+        task_queue.enqueue.assert_awaited_once_with("user")
+
+    async def test_stale_data_with_prefer_fresh_enqueues_fetch(
+        self, controller, monkeypatch, task_queue_factory
+    ):
+        response, analyze, _ = await _serve(
+            controller,
+            monkeypatch,
+            (SUBMISSIONS, 20000, True, 1),
+            task_queue_factory(),
+            _data_service(),
+            prefer_fresh=True,
+        )
+        assert response.status_code == 202
+        assert response.content["task_id"] == "task"
+        analyze.assert_not_called()
+
+    async def test_cache_miss_returns_202(self, controller, monkeypatch, task_queue_factory):
+        response, _, _ = await _serve(
+            controller, monkeypatch, (None, 0, False, -2), task_queue_factory(), _data_service()
+        )
+        assert response.status_code == 202
+        assert response.content == {"status": "processing", "task_id": "task", "retry_after": 2}
+
+    async def test_queue_failure_falls_back_to_direct_fetch(
+        self, controller, monkeypatch, task_queue_factory
+    ):
+        data_service = _data_service()
+        response, analyze, _ = await _serve(
+            controller,
+            monkeypatch,
+            (None, 0, False, -2),
+            task_queue_factory(error=ConnectionError()),
+            data_service,
+        )
+        assert response.content == RESPONSE.model_dump_json().encode()
+        assert response.media_type == "application/json"
+        assert response.headers["Cache-Control"] == "public, max-age=14400"
+        data_service.get_user_submissions.assert_awaited_once_with("user")
+        analyze.assert_called_once_with(SUBMISSIONS)
+
+    async def test_fallback_user_not_found(self, controller, monkeypatch, task_queue_factory):
+        redis = _redis()
+        with pytest.raises(HTTPException) as exc_info:
+            await _serve(
+                controller,
+                monkeypatch,
+                (None, 0, False, -2),
+                task_queue_factory(error=ConnectionError()),
+                _data_service(error=UserNotFoundError("missing")),
+                redis=redis,
+            )
+        assert exc_info.value.status_code == 404
+        redis.setex.assert_awaited_once_with("notfound:user", 300, "1")
+
+    async def test_known_missing_handle_skips_enqueue(
+        self, controller, monkeypatch, task_queue_factory
+    ):
+        task_queue = task_queue_factory()
+        data_service = _data_service()
+        with pytest.raises(HTTPException) as exc_info:
+            await _serve(
+                controller,
+                monkeypatch,
+                (None, 0, False, -2),
+                task_queue,
+                data_service,
+                redis=_redis(not_found=True),
+            )
+        assert exc_info.value.status_code == 404
+        task_queue.enqueue.assert_not_called()
+        data_service.get_user_submissions.assert_not_called()
+
+    async def test_fallback_without_submissions(self, controller, monkeypatch, task_queue_factory):
+        with pytest.raises(HTTPException) as exc_info:
+            await _serve(
+                controller,
+                monkeypatch,
+                (None, 0, False, -2),
+                task_queue_factory(error=ConnectionError()),
+                _data_service(submissions=[]),
+            )
+        assert exc_info.value.status_code == 404
+
+    async def test_cached_body_short_circuits(self, controller, monkeypatch, task_queue_factory):
+        cached = Mock()
+        monkeypatch.setattr(
+            BaseMetricController, "_get_cached_response", AsyncMock(return_value=cached)
+        )
+        response, analyze, _ = await _serve(
+            controller,
+            monkeypatch,
+            (SUBMISSIONS, 60, False, 1),
+            task_queue_factory(),
+            _data_service(),
+        )
+        assert response is cached
+        analyze.assert_not_called()
+
+    async def test_fresh_response_uses_cached_body(
+        self, controller, monkeypatch, task_queue_factory
+    ):
+        monkeypatch.setattr(BaseMetricController, "_cache_response", AsyncMock(return_value=b"{}"))
+        response, _, _ = await _serve(
+            controller,
+            monkeypatch,
+            (SUBMISSIONS, 60, False, 1),
+            task_queue_factory(),
+            _data_service(),
+        )
+        assert response.content == b"{}"
+
+    async def test_body_tagged_with_expiry_of_its_submissions(
+        self, controller, monkeypatch, task_queue_factory
+    ):
+        cache_response = AsyncMock(return_value=b"{}")
+        monkeypatch.setattr(BaseMetricController, "_cache_response", cache_response)
+        monkeypatch.setattr(
+            BaseMetricController,
+            "get_submissions_with_staleness",
+            AsyncMock(return_value=(SUBMISSIONS, 60, False, 7)),
+        )
+
+        response = await controller._serve_cached(
+            _redis(),
+            task_queue_factory(),
+            _data_service(),
+            "user",
+            False,
+            start_date=None,
+            analyze=Mock(),
+            build_response=Mock(return_value=RESPONSE),
+            cache_key="response:test:user",
+        )
+
+        assert cache_response.await_args.args[3] == 7
+        assert response.headers["ETag"] == 'W/"7"'
+
+    async def test_unbounded_period_analyzes_cached_list(
+        self, controller, monkeypatch, task_queue_factory
+    ):
+        submissions = list(SUBMISSIONS)
+        _, analyze, _ = await _serve(
+            controller,
+            monkeypatch,
+            (submissions, 60, False, 1),
+            task_queue_factory(),
+            _data_service(),
+        )
+        assert analyze.call_args.args[0] is submissions
+
+    async def test_concurrent_misses_share_one_build(
+        self, controller, monkeypatch, task_queue_factory
+    ):
+        cache_response = AsyncMock(return_value=b"{}")
+        monkeypatch.setattr(BaseMetricController, "_cache_response", staticmethod(cache_response))
+        monkeypatch.setattr(
+            BaseMetricController,
+            "get_submissions_with_staleness",
+            AsyncMock(return_value=(SUBMISSIONS, 60, False, 1)),
+        )
+        analyze = Mock(return_value="analysis")
+
+        responses = await asyncio.gather(
+            *(
+                controller._serve_cached(
+                    _redis(),
+                    task_queue_factory(),
+                    _data_service(),
+                    "user",
+                    False,
+                    start_date=None,
+                    analyze=analyze,
+                    build_response=Mock(return_value=RESPONSE),
+                    cache_key="response:test:user",
+                )
+                for _ in range(3)
+            )
+        )
+
+        assert [response.content for response in responses] == [b"{}"] * 3
+        analyze.assert_called_once_with(SUBMISSIONS)
+        cache_response.assert_awaited_once()
+
+    async def test_failed_build_with_only_cancelled_waiters_is_retrieved(
+        self, controller, monkeypatch, task_queue_factory
+    ):
+        release = asyncio.Event()
+
+        async def cache_response(redis, key, response, expires_at):
+            await release.wait()
+            raise ConnectionError()
+
+        monkeypatch.setattr(BaseMetricController, "_cache_response", staticmethod(cache_response))
+        monkeypatch.setattr(
+            BaseMetricController,
+            "get_submissions_with_staleness",
+            AsyncMock(return_value=(SUBMISSIONS, 60, False, 1)),
+        )
+        waiter = asyncio.create_task(
+            controller._serve_cached(
+                _redis(),
+                task_queue_factory(),
+                _data_service(),
+                "user",
+                False,
+                start_date=None,
+                analyze=Mock(),
+                build_response=Mock(return_value=RESPONSE),
+                cache_key="response:test:user",
+            )
+        )
+        await asyncio.sleep(0)
+        build = base._INFLIGHT_BODIES[("response:test:user", 1)]
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        release.set()
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+
+        assert build.done()
+        # A retrieved exception is not logged as "never retrieved" on collection
+        assert not build._log_traceback
+        assert not base._INFLIGHT_BODIES
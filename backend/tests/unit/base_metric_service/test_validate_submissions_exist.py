@@ -0,0 +1,22 @@
+"""Tests for BaseMetricController._validate_submissions_exist()."""
+
+from unittest.mock import Mock
+
+import pytest
+from litestar.exceptions import HTTPException
+
+from backend.api.routes.base import BaseMetricController
+from backend.domain.models import Submission
+
+
+class TestValidateSubmissionsExist:
+    """Tests for _validate_submissions_exist static method."""
+
+    def test_non_empty_passes(self):
+        BaseMetricController._validate_submissions_exist([Mock(spec=Submission)], "user")
+
+    def test_empty_raises_404(self):
+        with pytest.raises(HTTPException) as exc_info:
+            BaseMetricController._validate_submissions_exist([], "user")
+        assert exc_info.value.status_code == 404
+        assert "'user'" in exc_info.value.detail
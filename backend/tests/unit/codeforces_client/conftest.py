@@ -1,6 +1,7 @@
 """Fixtures for Codeforces client unit tests."""
 
 import pytest
+from contextlib import asynccontextmanager
 from unittest.mock import AsyncMock, patch
 from typing import Dict, Any, List
 
@@ -9,15 +10,36 @@ from backend.infrastructure.codeforces_client import CodeforcesClient
 
 @pytest.fixture
 def mock_httpx_client():
+    """
+    HTTP client mock; tests set get's return value or side effect.
+
+    Streamed requests are answered through get, with the mocked response's content
+    as the only body chunk.
+    """
     mock_client = AsyncMock()
     mock_client.aclose = AsyncMock()
+
+    @asynccontextmanager
+    async def stream(method, url, **kwargs):
+        response = await mock_client.get(url, **kwargs)
+        response.headers = {}
+
+        async def aiter_bytes():
+            yield response.content
+
+        response.aiter_bytes = aiter_bytes
+        yield response
+
+    mock_client.stream = stream
     return mock_client
 
 
 @pytest.fixture
 def codeforces_client(mock_httpx_client):
-    with patch("backend.infrastructure.codeforces_client.httpx.AsyncClient") as mock:
-        mock.return_value = mock_httpx_client
+    with patch(
+        "backend.infrastructure.codeforces_client.get_http_client",
+        return_value=mock_httpx_client,
+    ):
         client = CodeforcesClient()
         yield client
 
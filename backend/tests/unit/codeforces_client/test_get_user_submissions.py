@@ -17,7 +17,7 @@ async def test_get_user_submissions_success(
     codeforces_client, mock_httpx_client, sample_api_response_success
 ):
     mock_response = MagicMock()
-    mock_response.json.return_value = sample_api_response_success
+    mock_response.content = json.dumps(sample_api_response_success).encode()
     mock_response.status_code = 200
     mock_httpx_client.get = AsyncMock(return_value=mock_response)
 
@@ -40,7 +40,7 @@ async def test_get_user_submissions_empty_result(
     codeforces_client, mock_httpx_client, sample_api_response_empty
 ):
     mock_response = MagicMock()
-    mock_response.json.return_value = sample_api_response_empty
+    mock_response.content = json.dumps(sample_api_response_empty).encode()
     mock_response.status_code = 200
     mock_httpx_client.get = AsyncMock(return_value=mock_response)
 
@@ -55,7 +55,7 @@ async def test_get_user_submissions_user_not_found(
     codeforces_client, mock_httpx_client, sample_api_response_user_not_found
 ):
     mock_response = MagicMock()
-    mock_response.json.return_value = sample_api_response_user_not_found
+    mock_response.content = json.dumps(sample_api_response_user_not_found).encode()
     mock_response.status_code = 400
     mock_httpx_client.get = AsyncMock(return_value=mock_response)
 
@@ -71,7 +71,7 @@ async def test_get_user_submissions_user_not_found_variant(
     codeforces_client, mock_httpx_client, sample_api_response_user_not_found_variant
 ):
     mock_response = MagicMock()
-    mock_response.json.return_value = sample_api_response_user_not_found_variant
+    mock_response.content = json.dumps(sample_api_response_user_not_found_variant).encode()
     mock_response.status_code = 400
     mock_httpx_client.get = AsyncMock(return_value=mock_response)
 
@@ -86,10 +86,12 @@ async def test_get_user_submissions_user_not_found_does_not_have(
     codeforces_client, mock_httpx_client
 ):
     mock_response = MagicMock()
-    mock_response.json.return_value = {
-        "status": "FAILED",
-        "comment": "User with handle test does not have submissions",
-    }
+    mock_response.content = json.dumps(
+        {
+            "status": "FAILED",
+            "comment": "User with handle test does not have submissions",
+        }
+    ).encode()
     mock_response.status_code = 400
     mock_httpx_client.get = AsyncMock(return_value=mock_response)
 
@@ -102,7 +104,7 @@ async def test_get_user_submissions_generic_api_error(
     codeforces_client, mock_httpx_client, sample_api_response_generic_error
 ):
     mock_response = MagicMock()
-    mock_response.json.return_value = sample_api_response_generic_error
+    mock_response.content = json.dumps(sample_api_response_generic_error).encode()
     mock_response.status_code = 500
     mock_httpx_client.get = AsyncMock(return_value=mock_response)
 
@@ -144,7 +146,7 @@ async def test_get_user_submissions_request_error(codeforces_client, mock_httpx_
 @pytest.mark.asyncio
 async def test_get_user_submissions_json_decode_error(codeforces_client, mock_httpx_client):
     mock_response = MagicMock()
-    mock_response.json.side_effect = json.JSONDecodeError("Invalid JSON", "", 0)
+    mock_response.content = b"<html>Invalid JSON</html>"
     mock_httpx_client.get = AsyncMock(return_value=mock_response)
 
     with pytest.raises(CodeforcesAPIError) as exc_info:
@@ -156,7 +158,7 @@ async def test_get_user_submissions_json_decode_error(codeforces_client, mock_ht
 @pytest.mark.asyncio
 async def test_get_user_submissions_missing_status_field(codeforces_client, mock_httpx_client):
     mock_response = MagicMock()
-    mock_response.json.return_value = {"result": []}
+    mock_response.content = json.dumps({"result": []}).encode()
     mock_response.status_code = 200
     mock_httpx_client.get = AsyncMock(return_value=mock_response)
 
@@ -167,7 +169,7 @@ async def test_get_user_submissions_missing_status_field(codeforces_client, mock
 @pytest.mark.asyncio
 async def test_get_user_submissions_correct_url_construction(codeforces_client, mock_httpx_client):
     mock_response = MagicMock()
-    mock_response.json.return_value = {"status": "OK", "result": []}
+    mock_response.content = json.dumps({"status": "OK", "result": []}).encode()
     mock_httpx_client.get = AsyncMock(return_value=mock_response)
 
     await codeforces_client.get_user_submissions("testuser")
@@ -175,3 +177,101 @@ async def test_get_user_submissions_correct_url_construction(codeforces_client,
     call_args = mock_httpx_client.get.call_args
     assert call_args[0][0] == "https://codeforces.com/api/user.status"
     assert call_args[1]["params"] == {"handle": "testuser"}
+
+
+@pytest.mark.asyncio
+async def test_get_user_submissions_unexpected_field_type_falls_back(
+    codeforces_client, mock_httpx_client, sample_api_response_success
+):
+    payload = json.loads(json.dumps(sample_api_response_success))
+    payload["result"][0]["problem"]["rating"] = "1500"
+    mock_response = MagicMock()
+    mock_response.content = json.dumps(payload).encode()
+    mock_httpx_client.get = AsyncMock(return_value=mock_response)
+
+    result = await codeforces_client.get_user_submissions("tourist")
+
+    assert len(result) == 2
+    assert result[0].problem.rating == "1500"
+    assert result[1].id == payload["result"][1]["id"]
+
+
+@pytest.mark.asyncio
+async def test_get_user_submissions_unknown_verdict_is_failed(
+    codeforces_client, mock_httpx_client, sample_api_response_success
+):
+    payload = json.loads(json.dumps(sample_api_response_success))
+    payload["result"][0]["verdict"] = "SOMETHING_NEW"
+    mock_response = MagicMock()
+    mock_response.content = json.dumps(payload).encode()
+    mock_httpx_client.get = AsyncMock(return_value=mock_response)
+
+    result = await codeforces_client.get_user_submissions("tourist")
+
+    assert result[0].verdict == SubmissionStatus.WRONG_ANSWER
+
+
+def status_response(submission_ids):
+    response = MagicMock()
+    response.content = json.dumps(
+        {"status": "OK", "result": [{"id": submission_id} for submission_id in submission_ids]}
+    ).encode()
+    return response
+
+
+@pytest.mark.asyncio
+async def test_get_user_submissions_since_id_reads_first_page(codeforces_client, mock_httpx_client):
+    mock_httpx_client.get = AsyncMock(return_value=status_response([12, 11, 10, 9]))
+
+    result = await codeforces_client.get_user_submissions("tourist", since_id=10)
+
+    assert [submission.id for submission in result] == [12, 11]
+    mock_httpx_client.get.assert_called_once_with(
+        "https://codeforces.com/api/user.status",
+        params={"handle": "tourist", "from": 1, "count": 100},
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_user_submissions_since_id_falls_back_to_full_fetch(
+    codeforces_client, mock_httpx_client
+):
+    mock_httpx_client.get = AsyncMock(
+        side_effect=[status_response(range(200, 100, -1)), status_response(range(200, 0, -1))]
+    )
+
+    result = await codeforces_client.get_user_submissions("tourist", since_id=50)
+
+    assert [submission.id for submission in result] == list(range(200, 50, -1))
+    assert mock_httpx_client.get.call_args_list[1].kwargs["params"] == {"handle": "tourist"}
+
+
+@pytest.mark.asyncio
+async def test_get_user_submissions_since_id_full_page_with_dropped_row_falls_back(
+    codeforces_client, mock_httpx_client
+):
+    # The oldest row of the first page is malformed and skipped by the lenient parse
+    first_page = status_response(range(200, 100, -1))
+    payload = json.loads(first_page.content)
+    payload["result"][-1]["verdict"] = []
+    first_page.content = json.dumps(payload).encode()
+    mock_httpx_client.get = AsyncMock(side_effect=[first_page, status_response(range(200, 0, -1))])
+
+    result = await codeforces_client.get_user_submissions("tourist", since_id=50)
+
+    assert [submission.id for submission in result] == list(range(200, 50, -1))
+    assert mock_httpx_client.get.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_get_user_submissions_throttles_every_request(codeforces_client, mock_httpx_client):
+    codeforces_client.throttle = AsyncMock()
+    mock_httpx_client.get = AsyncMock(
+        side_effect=[status_response(range(200, 100, -1)), status_response(range(200, 0, -1))]
+    )
+
+    await codeforces_client.get_user_submissions("tourist", since_id=50)
+
+    # A full first page triggers the full-fetch fallback: two requests, two tokens
+    assert mock_httpx_client.get.await_count == 2
+    assert codeforces_client.throttle.await_count == 2
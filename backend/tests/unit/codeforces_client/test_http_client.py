@@ -0,0 +1,88 @@
+"""Unit tests for the shared HTTP client of CodeforcesClient."""
+
+import httpx
+import pytest
+
+from backend.infrastructure import codeforces_client
+from backend.infrastructure.codeforces_client import (
+    CodeforcesAPIError,
+    CodeforcesClient,
+    close_http_client,
+    get_http_client,
+)
+
+
+@pytest.fixture
+async def shared_client():
+    yield get_http_client()
+    await close_http_client()
+
+
+@pytest.mark.asyncio
+async def test_http_client_uses_connect_timeout_and_pooled_transport(shared_client):
+    timeout = shared_client.timeout
+    pool = shared_client._transport._pool
+
+    assert timeout.connect == 5.0
+    assert timeout.read == 30.0
+    assert pool._max_connections == 100
+    assert pool._max_keepalive_connections == 20
+    assert pool._keepalive_expiry == 30
+
+
+@pytest.mark.asyncio
+async def test_clients_share_one_http_client_that_outlives_them(shared_client):
+    async with CodeforcesClient() as first:
+        pass
+    second = CodeforcesClient()
+
+    assert first.http_client is shared_client
+    assert second.http_client is shared_client
+    assert not shared_client.is_closed
+
+
+@pytest.mark.asyncio
+async def test_close_recreates_client_on_next_use(shared_client):
+    await CodeforcesClient().close()
+
+    assert shared_client.is_closed
+    assert get_http_client() is not shared_client
+
+
+@pytest.mark.asyncio
+async def test_http_client_identifies_betterforces(shared_client):
+    assert shared_client.headers["User-Agent"] == "betterforces/0.1.0"
+    assert "gzip" in shared_client.headers["Accept-Encoding"]
+
+
+async def chunks(*parts):
+    for part in parts:
+        yield part
+
+
+@pytest.mark.parametrize("chunked", [False, True])
+@pytest.mark.asyncio
+async def test_oversized_body_is_refused(monkeypatch, chunked):
+    body = b'{"status": "OK", "result": []}'
+    monkeypatch.setattr(codeforces_client, "_MAX_RESPONSE_BYTES", len(body) - 1)
+
+    def handler(request):
+        # A generator body is sent chunked, without Content-Length
+        return httpx.Response(200, content=chunks(body[:10], body[10:]) if chunked else body)
+
+    client = CodeforcesClient()
+    client.http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    with pytest.raises(CodeforcesAPIError, match="exceeds"):
+        await client.get_user_submissions("tourist")
+
+
+@pytest.mark.asyncio
+async def test_body_within_limit_is_parsed():
+    def handler(request):
+        return httpx.Response(200, content=chunks(b'{"status": "OK", ', b'"result": []}'))
+
+    client = CodeforcesClient()
+    client.http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    assert await client.get_user_submissions("tourist") == []
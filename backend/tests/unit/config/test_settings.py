@@ -0,0 +1,31 @@
+"""Tests for lazy loading of the global settings."""
+
+import importlib
+
+import pytest
+
+from backend import config
+
+
+class TestSettings:
+    def test_settings_attribute_is_cached_instance(self):
+        from backend.config import settings
+
+        assert settings is config.get_settings()
+        assert config.settings is settings
+
+    def test_unknown_attribute_raises(self):
+        with pytest.raises(AttributeError, match="no attribute 'missing'"):
+            getattr(config, "missing")
+
+    @pytest.mark.parametrize(
+        "module",
+        [
+            "backend.api.app",
+            "backend.infrastructure.codeforces_client",
+            "backend.infrastructure.redis_client",
+        ],
+    )
+    def test_entry_points_do_not_bind_settings_at_import(self, module):
+        # They call get_settings() at use time, so importing them builds no Settings
+        assert not hasattr(importlib.import_module(module), "settings")
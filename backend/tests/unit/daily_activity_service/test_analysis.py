@@ -53,6 +53,32 @@ class TestAnalyzeSolvedDeduplication:
         assert day_15.solved_count == 1
         assert result.total_solved == 1
 
+    def test_plain_string_verdict_counts_as_solved(self, mock_submission):
+        ts = int(datetime(2025, 1, 15, 10, 0, 0, tzinfo=timezone.utc).timestamp())
+        now = datetime(2025, 1, 15, 23, 59, 0, tzinfo=timezone.utc)
+        # Equal to SubmissionStatus.OK but not the same object (e.g. a legacy JSON decode)
+        verdict = "".join(["O", "K"])
+        subs = [mock_submission(1, "A", "P1", ts, is_solved=True, verdict=verdict)]
+
+        result = DailyActivityService.analyze("user", subs, period=TimePeriod.WEEK, now=now)
+
+        assert result.total_solved == 1
+
+    def test_same_problem_solved_on_different_days_counted_per_day(self, mock_submission):
+        ts = int(datetime(2025, 1, 14, 10, 0, 0, tzinfo=timezone.utc).timestamp())
+        ts2 = int(datetime(2025, 1, 15, 10, 0, 0, tzinfo=timezone.utc).timestamp())
+        now = datetime(2025, 1, 15, 23, 59, 0, tzinfo=timezone.utc)
+        subs = [
+            mock_submission(1, "A", "P1", ts, is_solved=True),
+            mock_submission(1, "A", "P1", ts2, is_solved=True),
+        ]
+
+        result = DailyActivityService.analyze("user", subs, period=TimePeriod.WEEK, now=now)
+
+        solved = {d.date: d.solved_count for d in result.days if d.solved_count}
+        assert solved == {"2025-01-14": 1, "2025-01-15": 1}
+        assert result.total_solved == 2
+
 
 class TestAnalyzeGapFilling:
     def test_missing_days_filled_with_zeros(self, mock_submission):
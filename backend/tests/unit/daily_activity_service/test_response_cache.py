@@ -0,0 +1,47 @@
+"""Tests for response caching of the daily activity endpoint."""
+
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, Mock
+
+from backend.api.routes.daily_activity import DailyActivityController
+from backend.domain.models.time_period import TimePeriod
+
+
+async def _serve(period: TimePeriod, now: datetime) -> dict:
+    controller = DailyActivityController.__new__(DailyActivityController)
+    controller.get_current_timestamp = Mock(return_value=now)
+    controller._serve_cached = AsyncMock()
+
+    await DailyActivityController.get_daily_activity.fn(
+        controller,
+        handle="user",
+        data_service=Mock(),
+        daily_activity_service=Mock(),
+        redis=Mock(),
+        task_queue=Mock(),
+        period=period,
+        prefer_fresh=False,
+        if_none_match='W/"1"',
+    )
+    return controller._serve_cached.await_args.kwargs
+
+
+class TestResponseCacheKey:
+    async def test_all_time_key_includes_current_year(self):
+        kwargs = await _serve(TimePeriod.ALL_TIME, datetime(2025, 6, 1, tzinfo=timezone.utc))
+
+        assert kwargs["cache_key"] == "response:daily-activity:2025:user"
+        assert kwargs["if_none_match"] == 'W/"1"'
+
+    async def test_key_changes_with_the_year(self):
+        before = await _serve(
+            TimePeriod.ALL_TIME, datetime(2025, 12, 31, 23, 59, tzinfo=timezone.utc)
+        )
+        after = await _serve(TimePeriod.ALL_TIME, datetime(2026, 1, 1, tzinfo=timezone.utc))
+
+        assert before["cache_key"] != after["cache_key"]
+
+    async def test_filtered_period_not_cached(self):
+        kwargs = await _serve(TimePeriod.MONTH, datetime(2025, 6, 1, tzinfo=timezone.utc))
+
+        assert kwargs["cache_key"] is None
@@ -0,0 +1,29 @@
+"""Tests for DailyActivityController._build_response wire format."""
+
+import json
+
+from backend.api.routes.daily_activity import DailyActivityController
+from backend.domain.models.daily_activity import DailyActivity, DailyActivityAnalysis
+
+
+class TestBuildResponse:
+    def test_days_validated_from_domain_buckets(self):
+        analysis = DailyActivityAnalysis(
+            handle="user",
+            days=[DailyActivity("2024", 3, 1), DailyActivity("2025", 0, 2)],
+            total_solved=3,
+            total_attempts=3,
+            active_days=2,
+        )
+        controller = DailyActivityController.__new__(DailyActivityController)
+
+        response = controller._build_response(analysis)
+
+        assert response.days[0] == {"date": "2024", "solved_count": 3, "attempt_count": 1}
+        body = json.loads(response.model_dump_json())
+        assert body["days"] == [
+            {"date": "2024", "solved_count": 3, "attempt_count": 1},
+            {"date": "2025", "solved_count": 0, "attempt_count": 2},
+        ]
+        assert body["total_solved"] == 3
+        assert body["active_days"] == 2
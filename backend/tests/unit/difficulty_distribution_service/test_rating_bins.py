@@ -157,3 +157,42 @@ class TestCreateBinDistribution:
         result = DifficultyDistributionService._create_bin_distribution(submissions)
 
         assert result == {800: 1, 1200: 1}
+
+    def test_bins_ratings_outside_standard_range(self, mock_submission) -> None:
+        submissions = [
+            mock_submission(
+                contest_id=100,
+                index=index,
+                name=f"Problem {index}",
+                rating=rating,
+                tags=[],
+                is_solved=True,
+            )
+            for index, rating in [("A", 3500), ("B", 3850), ("C", 700)]
+        ]
+
+        result = DifficultyDistributionService._create_bin_distribution(submissions)
+
+        assert result == {3500: 1, 3800: 1, 700: 1}
+
+    def test_histogram_bins_match_get_rating_bin(self, mock_submission) -> None:
+        ratings = range(650, 4000, 25)
+        submissions = [
+            mock_submission(
+                contest_id=100,
+                index=str(rating),
+                name=f"Problem {rating}",
+                rating=rating,
+                tags=[],
+                is_solved=True,
+            )
+            for rating in ratings
+        ]
+
+        result = DifficultyDistributionService._create_bin_distribution(submissions)
+
+        expected: dict[int, int] = {}
+        for rating in ratings:
+            rating_bin = DifficultyDistributionService._get_rating_bin(rating)
+            expected[rating_bin] = expected.get(rating_bin, 0) + 1
+        assert result == expected
@@ -0,0 +1,56 @@
+"""Tests for BaseDomainModel.to_dict()."""
+
+from dataclasses import asdict
+
+from backend.domain.models import (
+    DailyActivity,
+    DailyActivityAnalysis,
+    Problem,
+    Submission,
+    SubmissionStatus,
+)
+from backend.domain.models.tags import TagInfo, TagsAnalysis
+
+SUBMISSION = Submission(
+    id=1,
+    contest_id=1000,
+    creation_time_seconds=1609459200,
+    problem=Problem(contest_id=1000, index="A", name="P1", rating=800, tags=["math", "dp"]),
+    verdict=SubmissionStatus.OK,
+    programming_language="Python 3",
+)
+
+
+class TestToDict:
+    """to_dict must match dataclasses.asdict."""
+
+    def test_nested_model(self):
+        assert SUBMISSION.to_dict() == asdict(SUBMISSION)
+
+    def test_list_of_models(self):
+        analysis = DailyActivityAnalysis(
+            handle="user",
+            days=[DailyActivity("2024", 3, 1), DailyActivity("2025", 0, 2)],
+            total_solved=3,
+            total_attempts=3,
+            active_days=2,
+        )
+        assert analysis.to_dict() == asdict(analysis)
+
+    def test_nested_lists_of_strings(self):
+        analysis = TagsAnalysis(
+            handle="user",
+            tags=[TagInfo("dp", 1500.0, 1500.0, 2, ["A", "B"])],
+            overall_average_rating=1500.0,
+            overall_median_rating=1500.0,
+            total_solved=2,
+        )
+        assert analysis.to_dict() == asdict(analysis)
+
+    def test_containers_are_copied(self):
+        result = SUBMISSION.to_dict()
+        assert result["problem"]["tags"] == SUBMISSION.problem.tags
+        assert result["problem"]["tags"] is not SUBMISSION.problem.tags
+
+    def test_enum_kept_as_member(self):
+        assert SUBMISSION.to_dict()["verdict"] is SubmissionStatus.OK
@@ -0,0 +1,33 @@
+"""Lightweight stand-ins for the domain models used by the service test factories."""
+
+from dataclasses import dataclass, field
+
+from backend.domain.models.codeforces import SubmissionStatus
+
+
+@dataclass(slots=True, eq=False)
+class FakeProblem:
+    """Plain-attribute stand-in for Problem."""
+
+    contest_id: int
+    index: str
+    name: str
+    rating: int | None = None
+    tags: list[str] = field(default_factory=list)
+
+    @property
+    def problem_key(self) -> str:
+        """Unique identifier for a problem."""
+        return f"{self.contest_id}{self.index}"
+
+
+@dataclass(slots=True, eq=False)
+class FakeSubmission:
+    """Stand-in for Submission whose is_solved is set independently of the verdict."""
+
+    contest_id: int
+    creation_time_seconds: int
+    problem: FakeProblem
+    verdict: SubmissionStatus = SubmissionStatus.OK
+    programming_language: str = "Python 3"
+    is_solved: bool = True
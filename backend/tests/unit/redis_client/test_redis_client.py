@@ -0,0 +1,39 @@
+"""Unit tests for the shared Redis connection pool."""
+
+import pytest
+from redis.asyncio import BlockingConnectionPool
+
+from backend.infrastructure.redis_client import (
+    close_redis_pool,
+    create_redis_client,
+    get_connection_pool,
+    get_redis_client,
+)
+
+
+@pytest.fixture(autouse=True)
+async def reset_pool():
+    await close_redis_pool()
+    yield
+    await close_redis_pool()
+
+
+class TestRedisClient:
+    async def test_clients_share_one_blocking_pool(self):
+        worker_client = await create_redis_client()
+
+        assert isinstance(get_connection_pool(), BlockingConnectionPool)
+        assert worker_client.connection_pool is get_connection_pool()
+        assert get_redis_client().connection_pool is get_connection_pool()
+        assert get_connection_pool().max_connections == 50
+
+    async def test_dependency_client_is_a_singleton(self):
+        assert get_redis_client() is get_redis_client()
+
+    async def test_close_resets_pool_and_client(self):
+        pool, client = get_connection_pool(), get_redis_client()
+
+        await close_redis_pool()
+
+        assert get_connection_pool() is not pool
+        assert get_redis_client() is not client
@@ -0,0 +1,80 @@
+"""Unit tests for the cached submissions codec."""
+
+import json
+
+from backend.domain.models.codeforces import Problem, Submission, SubmissionStatus
+from backend.infrastructure.submissions_codec import (
+    SUBMISSIONS_TTL,
+    decode_submissions,
+    encode_submissions,
+    submissions_age,
+)
+
+SUBMISSIONS = [
+    Submission(
+        id=1,
+        contest_id=1000,
+        creation_time_seconds=1609459200,
+        problem=Problem(contest_id=1000, index="A", name="P1", rating=800, tags=["math", "dp"]),
+        verdict=SubmissionStatus.OK,
+        programming_language="Python 3",
+    ),
+    Submission(
+        id=2,
+        contest_id=1001,
+        creation_time_seconds=1609545600,
+        problem=Problem(contest_id=1001, index="B", name="P2"),
+        verdict=SubmissionStatus.WRONG_ANSWER,
+        programming_language="C++17",
+    ),
+]
+
+
+class TestSubmissionsCodec:
+    """Tests for encode_submissions / decode_submissions."""
+
+    def test_round_trip(self):
+        assert decode_submissions(encode_submissions(SUBMISSIONS)) == SUBMISSIONS
+
+    def test_round_trip_restores_enum_verdict(self):
+        decoded = decode_submissions(encode_submissions(SUBMISSIONS))
+        assert decoded is not None
+        assert decoded[1].verdict is SubmissionStatus.WRONG_ANSWER
+        assert decoded[0].is_solved is True
+
+    def test_tags_are_shared_between_submissions(self):
+        submissions = [SUBMISSIONS[0], SUBMISSIONS[0]]
+        first, second = decode_submissions(encode_submissions(submissions))
+        assert first.problem.tags == ["math", "dp"]
+        assert all(a is b for a, b in zip(first.problem.tags, second.problem.tags))
+
+    def test_empty_list(self):
+        assert decode_submissions(encode_submissions([])) == []
+
+    def test_payload_smaller_than_json(self):
+        legacy = json.dumps([s.to_dict() for s in SUBMISSIONS]).encode()
+        assert len(encode_submissions(SUBMISSIONS)) < len(legacy)
+
+    def test_decodes_legacy_json_payload(self):
+        legacy = json.dumps([s.to_dict() for s in SUBMISSIONS]).encode()
+        # Legacy payloads are sorted newest first on decode
+        assert decode_submissions(legacy) == SUBMISSIONS[::-1]
+
+    def test_legacy_json_payload_is_sorted_newest_first(self):
+        legacy = json.dumps([s.to_dict() for s in SUBMISSIONS]).encode()
+        decoded = decode_submissions(legacy)
+        assert [s.id for s in decoded] == [2, 1]
+
+    def test_invalid_payload_returns_none(self):
+        assert decode_submissions(b"\xc1") is None
+        assert decode_submissions(b"not a payload") is None
+
+
+class TestSubmissionsAge:
+    """Tests for submissions_age."""
+
+    def test_age_from_stored_ttl(self):
+        assert submissions_age(82800 - 60, b"82800") == 60
+
+    def test_entry_without_stored_ttl_assumes_full_ttl(self):
+        assert submissions_age(SUBMISSIONS_TTL - 60, None) == 60
@@ -0,0 +1,52 @@
+"""Tests for TagsController response builders wire format."""
+
+import json
+
+from backend.api.routes.tags import TagsController
+from backend.api.schemas.tags import SimpleTagInfoSchema
+from backend.domain.models.tags import TagInfo, TagsAnalysis
+
+ANALYSIS = TagsAnalysis(
+    handle="user",
+    tags=[
+        TagInfo("dp", 1500, 1500, 2, ["A", "B"]),
+        TagInfo("math", 1000.5, 1000, 3, ["C", "D", "E"]),
+    ],
+    overall_average_rating=1300.0,
+    overall_median_rating=1200,
+    total_solved=5,
+)
+
+
+class TestBuildResponse:
+    def test_from_domain_copies_schema_fields(self):
+        schema = SimpleTagInfoSchema.from_domain(ANALYSIS.tags[1])
+
+        assert schema.model_dump() == {
+            "tag": "math",
+            "average_rating": 1000.5,
+            "median_rating": 1000,
+            "problem_count": 3,
+        }
+
+    def test_tags_response_serializes_ratings_as_floats(self):
+        controller = TagsController.__new__(TagsController)
+
+        body = json.loads(controller._build_tags_response(ANALYSIS).model_dump_json())
+
+        assert body["tags"][0] == {
+            "tag": "dp",
+            "average_rating": 1500.0,
+            "median_rating": 1500.0,
+            "problem_count": 2,
+        }
+        assert isinstance(body["tags"][0]["average_rating"], float)
+        assert body["overall_median_rating"] == 1200.0
+
+    def test_weak_tags_response(self):
+        controller = TagsController.__new__(TagsController)
+
+        response = controller._build_weak_tags_response(ANALYSIS, threshold=200)
+
+        assert [tag.tag for tag in response.weak_tags] == ["math"]
+        assert response.threshold_used == 200
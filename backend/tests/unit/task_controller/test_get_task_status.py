@@ -0,0 +1,64 @@
+"""Unit tests for TaskController.get_task_status."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from backend.api.routes.tasks import TaskController
+from backend.infrastructure.task_queue import TaskQueue
+
+
+@pytest.fixture
+def task_queue() -> AsyncMock:
+    """Task queue mock; tests set poll_task's return value."""
+    return AsyncMock(spec=TaskQueue)
+
+
+async def _get_status(task_queue: AsyncMock):
+    controller = TaskController.__new__(TaskController)
+    return await TaskController.get_task_status.fn(controller, "task-1", task_queue)
+
+
+class TestGetTaskStatus:
+    """Tests for the task polling endpoint."""
+
+    async def test_unknown_task(self, task_queue):
+        task_queue.poll_task.return_value = None
+        response = await _get_status(task_queue)
+        assert response.status_code == 404
+
+    async def test_completed_returns_result(self, task_queue):
+        task_queue.poll_task.return_value = (
+            "completed",
+            b'{"handle": "user", "submission_count": 3}',
+        )
+        response = await _get_status(task_queue)
+        assert response.status_code == 200
+        assert response.media_type == "application/json"
+        assert response.content == b'{"handle": "user", "submission_count": 3}'
+
+    async def test_completed_without_result(self, task_queue):
+        task_queue.poll_task.return_value = ("completed", None)
+        response = await _get_status(task_queue)
+        assert response.content == {"status": "completed"}
+
+    async def test_failed_returns_error(self, task_queue):
+        task_queue.poll_task.return_value = ("failed", b"boom")
+        response = await _get_status(task_queue)
+        assert response.status_code == 500
+        assert response.content == {"error": "boom"}
+
+    async def test_completed_by_another_task(self, task_queue):
+        task_queue.poll_task.return_value = ("completed_by_another_task", b"{}")
+        response = await _get_status(task_queue)
+        assert response.status_code == 200
+        assert response.content == {
+            "status": "completed",
+            "message": "Data updated by concurrent request",
+        }
+
+    async def test_processing(self, task_queue):
+        task_queue.poll_task.return_value = ("processing", None)
+        response = await _get_status(task_queue)
+        assert response.status_code == 202
+        assert response.headers["Retry-After"] == "2"
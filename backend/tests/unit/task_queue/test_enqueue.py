@@ -0,0 +1,148 @@
+"""Unit tests for TaskQueue.enqueue."""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from backend.config import Settings
+from backend.infrastructure import task_queue
+from backend.infrastructure.task_queue import _ENQUEUE_SCRIPT, TaskQueue
+
+
+class FakeEnqueueScript:
+    """Emulates the enqueue Lua script against an in-memory pending_task map."""
+
+    def __init__(self):
+        self.pending: dict[str, bytes] = {}
+        self.calls: list[dict] = []
+        self.error: Exception | None = None
+
+    async def __call__(self, keys: list, args: list, client=None) -> bytes | None:
+        self.calls.append({"keys": keys, "args": args})
+        if self.error is not None:
+            raise self.error
+        result = self.pending.setdefault(keys[0], args[0].encode())
+        if client is None:
+            return result
+        client.results.append(result)
+
+
+class FakePipeline:
+    """Collects queued script results; execute() returns them."""
+
+    def __init__(self, redis: AsyncMock):
+        self.redis = redis
+        self.results: list = []
+
+    async def __aenter__(self) -> "FakePipeline":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        return None
+
+    async def execute(self) -> list:
+        self.redis.executed += 1
+        return self.results
+
+
+@pytest.fixture
+def script() -> FakeEnqueueScript:
+    return FakeEnqueueScript()
+
+
+@pytest.fixture
+def redis(script) -> AsyncMock:
+    """Async Redis mock whose enqueue script is the in-memory fake."""
+    redis = AsyncMock()
+    redis.register_script = Mock(
+        side_effect=lambda source: script if source == _ENQUEUE_SCRIPT else AsyncMock()
+    )
+    redis.executed = 0
+    redis.pipeline = Mock(side_effect=lambda transaction: FakePipeline(redis))
+    return redis
+
+
+class TestEnqueue:
+    """Tests for task creation and in-process coalescing."""
+
+    async def test_creates_task_in_one_script_call(self, redis, script):
+        task_id = await TaskQueue(redis).enqueue("user")
+
+        assert len(script.calls) == 1
+        assert len(task_id) == 32 and int(task_id, 16) >= 0
+        keys, args = script.calls[0]["keys"], script.calls[0]["args"]
+        assert keys == [
+            "pending_task:user",
+            "fetch_stream",
+            f"task:{task_id}:status",
+            f"task:{task_id}:handle",
+        ]
+        assert args[0] == task_id
+        assert isinstance(args[1], float)
+        assert args[2:] == ["user", 60, 300]
+        redis.get.assert_not_called()
+        redis.set.assert_not_called()
+
+    async def test_queue_key_from_settings(self, redis, script, monkeypatch):
+        settings = Settings(worker_queue_key="custom_stream")
+        monkeypatch.setattr(task_queue, "get_settings", lambda: settings)
+
+        await TaskQueue(redis).enqueue("user")
+
+        assert script.calls[0]["keys"][1] == "custom_stream"
+
+    async def test_existing_pending_task_is_reused(self, redis, script):
+        script.pending["pending_task:user"] = b"task-1"
+
+        assert await TaskQueue(redis).enqueue("user") == "task-1"
+
+    async def test_concurrent_calls_share_one_enqueue(self, redis, script):
+        task_queue = TaskQueue(redis)
+
+        first, second = await asyncio.gather(task_queue.enqueue("user"), task_queue.enqueue("user"))
+
+        assert first == second
+        assert len(script.calls) == 1
+        assert task_queue._enqueuing == {}
+
+    async def test_different_handles_enqueue_separately(self, redis, script):
+        task_queue = TaskQueue(redis)
+
+        first, second = await asyncio.gather(task_queue.enqueue("alice"), task_queue.enqueue("bob"))
+
+        assert first != second
+        assert len(script.calls) == 2
+
+    async def test_failure_reaches_every_caller(self, redis, script):
+        script.error = ConnectionError()
+        task_queue = TaskQueue(redis)
+
+        results = await asyncio.gather(
+            task_queue.enqueue("user"), task_queue.enqueue("user"), return_exceptions=True
+        )
+
+        assert all(isinstance(result, ConnectionError) for result in results)
+        assert len(script.calls) == 1
+        assert task_queue._enqueuing == {}
+
+
+class TestEnqueueMany:
+    """Tests for bulk enqueueing."""
+
+    async def test_enqueues_all_handles_in_one_pipeline(self, redis, script):
+        script.pending["pending_task:bob"] = b"task-bob"
+
+        result = await TaskQueue(redis).enqueue_many(["alice", "bob", "alice"])
+
+        assert redis.executed == 1
+        assert [call["keys"][0] for call in script.calls] == [
+            "pending_task:alice",
+            "pending_task:bob",
+        ]
+        assert result["bob"] == "task-bob"
+        assert result["alice"] == script.calls[0]["args"][0]
+
+    async def test_empty_input_skips_redis(self, redis):
+        assert await TaskQueue(redis).enqueue_many([]) == {}
+        redis.pipeline.assert_not_called()
@@ -0,0 +1,116 @@
+"""Unit tests for TaskQueue task lookups."""
+
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from backend.infrastructure.task_queue import TaskQueue
+
+
+@pytest.fixture
+def redis() -> AsyncMock:
+    """Async Redis mock (register_script is synchronous in redis-py)."""
+    redis = AsyncMock()
+    redis.register_script = Mock()
+    return redis
+
+
+class TestGetTaskInfo:
+    """Tests for TaskQueue.get_task_info / get_task_status."""
+
+    async def test_reads_all_keys_in_one_round_trip(self, redis):
+        redis.mget.return_value = [b"completed", b"user", b'{"handle": "user"}', None]
+
+        info = await TaskQueue(redis).get_task_info("task-1")
+
+        redis.mget.assert_awaited_once_with(
+            "task:task-1:status",
+            "task:task-1:handle",
+            "task:task-1:result",
+            "task:task-1:error",
+        )
+        redis.get.assert_not_called()
+        assert info == {
+            "task_id": "task-1",
+            "status": "completed",
+            "handle": "user",
+            "result": b'{"handle": "user"}',
+            "error": None,
+        }
+
+    async def test_missing_status_returns_none(self, redis):
+        redis.mget.return_value = [None, None, None, None]
+        assert await TaskQueue(redis).get_task_info("task-1") is None
+
+    async def test_status_decodes_result(self, redis):
+        redis.mget.return_value = [b"completed", b"user", b'{"handle": "user"}', None]
+        status = await TaskQueue(redis).get_task_status("task-1")
+        assert status == {"status": "completed", "result": {"handle": "user"}}
+
+    async def test_status_reports_error(self, redis):
+        redis.mget.return_value = [b"failed", b"user", None, b"boom"]
+        status = await TaskQueue(redis).get_task_status("task-1")
+        assert status == {"status": "failed", "error": "boom"}
+
+    async def test_status_not_found(self, redis):
+        redis.mget.return_value = [None, None, None, None]
+        assert await TaskQueue(redis).get_task_status("task-1") == {"status": "not_found"}
+
+
+class TestPollTask:
+    """Tests for TaskQueue.poll_task."""
+
+    @pytest.fixture
+    def redis(self) -> Mock:
+        redis = Mock()
+        redis.register_script.return_value = AsyncMock()
+        redis.mget = AsyncMock(return_value=[b"processing", b"user", None, None])
+        return redis
+
+    async def test_processing_task_runs_script_with_declared_keys(self, redis):
+        script = redis.register_script.return_value
+        script.return_value = [b"completed_by_another_task", b"{}"]
+
+        assert await TaskQueue(redis).poll_task("task-1") == ("completed_by_another_task", b"{}")
+        script.assert_awaited_once_with(
+            keys=[
+                "task:task-1:status",
+                "task:task-1:result",
+                "task:task-1:error",
+                "submissions:user",
+                "submissions_ttl:user",
+            ],
+            args=[b"user", 86400, 14400, 300],
+        )
+
+    @pytest.mark.parametrize(
+        "status, expected",
+        [(b"completed", ("completed", b"{}")), (b"failed", ("failed", b"boom"))],
+    )
+    async def test_finished_task_is_answered_without_script(self, redis, status, expected):
+        redis.mget.return_value = [status, b"user", b"{}", b"boom"]
+
+        assert await TaskQueue(redis).poll_task("task-1") == expected
+        redis.register_script.return_value.assert_not_called()
+
+    async def test_processing_without_payload(self, redis):
+        redis.register_script.return_value.return_value = [b"processing", None]
+        assert await TaskQueue(redis).poll_task("task-1") == ("processing", None)
+
+    async def test_missing_task(self, redis):
+        redis.mget.return_value = [None, None, None, None]
+        assert await TaskQueue(redis).poll_task("task-1") is None
+        redis.register_script.return_value.assert_not_called()
+
+    async def test_task_removed_before_script_runs(self, redis):
+        redis.register_script.return_value.return_value = None
+        assert await TaskQueue(redis).poll_task("task-1") is None
+
+    async def test_unknown_status_is_decoded(self, redis):
+        redis.register_script.return_value.return_value = [b"queued", None]
+        assert await TaskQueue(redis).poll_task("task-1") == ("queued", None)
+
+    async def test_task_without_handle_skips_script(self, redis):
+        redis.mget.return_value = [b"processing", None, None, None]
+        assert await TaskQueue(redis).poll_task("task-1") == ("processing", None)
+        redis.register_script.return_value.assert_not_called()
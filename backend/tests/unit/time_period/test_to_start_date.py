@@ -1,6 +1,6 @@
 """Tests for TimePeriod.to_start_date()."""
 
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 
 from backend.domain.models.time_period import TimePeriod
 
@@ -82,3 +82,26 @@ class TestToStartDate:
             result = period.to_start_date(now)
             if result is not None:
                 assert result.tzinfo == timezone.utc
+
+    def test_month_february_of_century_non_leap_year(self):
+        now = datetime(2100, 3, 31, 12, 0, 0, tzinfo=timezone.utc)
+        result = TimePeriod.MONTH.to_start_date(now)
+        assert result == datetime(2100, 2, 28, 12, 0, 0, tzinfo=timezone.utc)
+
+    def test_same_instant_in_other_zone_keeps_its_zone(self):
+        now = datetime(2025, 6, 15, 12, 0, 0, tzinfo=timezone.utc)
+        shifted = now.astimezone(timezone(timedelta(hours=3)))
+        TimePeriod.MONTH.to_start_date(now)
+
+        result = TimePeriod.MONTH.to_start_date(shifted)
+
+        assert result.tzinfo == shifted.tzinfo
+        assert result == datetime(2025, 5, 15, 15, 0, 0, tzinfo=shifted.tzinfo)
+
+    def test_same_second_requests_share_cached_result(self):
+        now = datetime(2025, 6, 15, 12, 0, 7, tzinfo=timezone.utc)
+
+        first = TimePeriod.HALF_YEAR.to_start_date(now)
+        second = TimePeriod.HALF_YEAR.to_start_date(now.replace())
+
+        assert second is first
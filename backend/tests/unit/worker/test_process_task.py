@@ -0,0 +1,189 @@
+"""Unit tests for Worker.process_task."""
+
+import json
+from unittest.mock import DEFAULT, AsyncMock, Mock
+
+import pytest
+
+from backend.domain.models.codeforces import Problem, Submission, SubmissionStatus
+from backend.infrastructure.codeforces_client import CodeforcesClient, UserNotFoundError
+from backend.infrastructure.submissions_codec import decode_submissions, encode_submissions
+from backend.worker import main
+from backend.worker.main import Worker
+
+
+@pytest.fixture
+def worker() -> Worker:
+    """Worker with mocked Redis and Codeforces client."""
+    worker = Worker()
+    worker.redis = AsyncMock()
+    worker.redis.get.return_value = b"task-1"
+    # Entries written before submissions_ttl:{handle} was stored
+    worker.redis.get.side_effect = lambda key: (
+        None if key.startswith("submissions_ttl:") else DEFAULT
+    )
+    # Nothing cached: submissions and full fetch time
+    worker.redis.mget.return_value = [None, None]
+    # Writes are queued on a pipeline (synchronous calls) and sent with execute
+    worker.pipe = Mock()
+    worker.pipe.execute = AsyncMock()
+    worker.redis.pipeline = Mock(return_value=AsyncMock())
+    worker.redis.pipeline.return_value.__aenter__.return_value = worker.pipe
+    worker.cf_client = Mock(spec=CodeforcesClient)
+    worker.cf_client.get_user_submissions = AsyncMock(return_value=[])
+    return worker
+
+
+async def test_fresh_data_skips_fetch(worker):
+    worker.redis.ttl.return_value = 86400 - 60
+
+    await worker.process_task({"task_id": "task-1", "handle": "user"})
+
+    worker.cf_client.get_user_submissions.assert_not_called()
+    worker.pipe.setex.assert_any_call("task:task-1:status", 300, "completed")
+    result = worker.pipe.setex.call_args_list[-1].args[2]
+    assert json.loads(result) == {"handle": "user", "status": "completed_by_another_task"}
+    worker.pipe.delete.assert_called_once_with("pending_task:user")
+
+
+async def test_fresh_data_keeps_other_tasks_lock(worker):
+    worker.redis.ttl.return_value = 86400 - 60
+    worker.redis.get.return_value = b"task-2"
+
+    await worker.process_task({"task_id": "task-1", "handle": "user"})
+
+    worker.pipe.delete.assert_not_called()
+
+
+@pytest.mark.parametrize("ttl", [-2, 86400 - 14400])
+async def test_missing_or_stale_data_is_fetched(worker, ttl):
+    worker.redis.ttl.return_value = ttl
+
+    await worker.process_task({"task_id": "task-1", "handle": "user"})
+
+    worker.cf_client.get_user_submissions.assert_awaited_once_with("user", None)
+    worker.pipe.setex.assert_any_call("task:task-1:status", 300, "completed")
+
+
+async def test_age_is_derived_from_stored_ttl(worker):
+    # Written with a jittered 23h TTL 14000s ago; 24h - TTL would put it at 17600s
+    stored = {"submissions_ttl:user": b"82800", "pending_task:user": b"task-1"}
+    worker.redis.ttl.return_value = 82800 - 14000
+    worker.redis.get.side_effect = stored.get
+
+    await worker.process_task({"task_id": "task-1", "handle": "user"})
+
+    worker.cf_client.get_user_submissions.assert_not_called()
+
+
+def make_submission(submission_id: int, creation_time: int) -> Submission:
+    return Submission(
+        id=submission_id,
+        contest_id=1,
+        creation_time_seconds=creation_time,
+        problem=Problem(contest_id=1, index="A", name="Problem"),
+        verdict=SubmissionStatus.OK,
+        programming_language="Python 3",
+    )
+
+
+async def test_refresh_fetches_only_submissions_newer_than_settled_cache(worker, monkeypatch):
+    now = 10_000_000
+    monkeypatch.setattr(main.time, "time", lambda: now)
+    settled = [make_submission(2, now - main.SETTLED_SUBMISSION_AGE), make_submission(1, 0)]
+    unsettled = make_submission(3, now - 60)
+    cached = encode_submissions([unsettled, *settled])
+    worker.redis.ttl.return_value = 86400 - 14400
+    full_fetched_at = now - main.FULL_FETCH_INTERVAL
+    worker.redis.mget.return_value = [cached, str(full_fetched_at).encode()]
+    fetched = [make_submission(4, now), make_submission(3, now - 60)]
+    worker.cf_client.get_user_submissions.return_value = fetched
+
+    await worker.process_task({"task_id": "task-1", "handle": "user"})
+
+    worker.cf_client.get_user_submissions.assert_awaited_once_with("user", 2)
+    key, ttl, payload = worker.pipe.setex.call_args_list[0].args
+    assert key == "submissions:user"
+    assert [submission.id for submission in decode_submissions(payload)] == [4, 3, 2, 1]
+    # The reused submissions still date from the earlier full fetch
+    worker.pipe.setex.assert_any_call("submissions_full_fetch:user", ttl, full_fetched_at)
+
+
+@pytest.mark.parametrize("full_fetched_at", [None, b"1"])
+async def test_refresh_fetches_everything_without_recent_full_fetch(
+    worker, monkeypatch, full_fetched_at
+):
+    now = 10_000_000
+    monkeypatch.setattr(main.time, "time", lambda: now)
+    cached = encode_submissions([make_submission(1, 0)])
+    worker.redis.ttl.return_value = 86400 - 14400
+    worker.redis.mget.return_value = [cached, full_fetched_at]
+
+    await worker.process_task({"task_id": "task-1", "handle": "user"})
+
+    worker.cf_client.get_user_submissions.assert_awaited_once_with("user", None)
+    key, ttl, _ = worker.pipe.setex.call_args_list[0].args
+    worker.pipe.setex.assert_any_call("submissions_full_fetch:user", ttl, now)
+
+
+async def test_stored_submissions_are_sorted_newest_first(worker):
+    worker.redis.ttl.return_value = -2
+    worker.cf_client.get_user_submissions.return_value = [
+        make_submission(1, 100),
+        make_submission(3, 300),
+        make_submission(2, 200),
+    ]
+
+    await worker.process_task({"task_id": "task-1", "handle": "user"})
+
+    key, _, payload = worker.pipe.setex.call_args_list[0].args
+    assert key == "submissions:user"
+    assert [submission.id for submission in decode_submissions(payload)] == [3, 2, 1]
+
+
+async def test_submissions_ttl_is_jittered(worker, monkeypatch):
+    worker.redis.ttl.return_value = -2
+    monkeypatch.setattr(main.random, "randint", lambda low, high: high)
+
+    await worker.process_task({"task_id": "task-1", "handle": "user"})
+
+    key, ttl, _ = worker.pipe.setex.call_args_list[0].args
+    assert key == "submissions:user"
+    assert ttl == main.SUBMISSIONS_TTL - main.SUBMISSIONS_TTL_JITTER
+    # Stored alongside so readers can derive the age from the remaining TTL
+    worker.pipe.setex.assert_any_call("submissions_ttl:user", ttl, ttl)
+
+
+async def test_user_not_found_is_remembered(worker, monkeypatch):
+    worker.redis.ttl.return_value = -2
+    worker.cf_client.get_user_submissions.side_effect = UserNotFoundError("missing")
+    monkeypatch.setattr(main.random, "randint", lambda low, high: 0)
+
+    await worker.process_task({"task_id": "task-1", "handle": "user"})
+
+    worker.pipe.setex.assert_any_call("notfound:user", main.NOT_FOUND_TTL, "1")
+    worker.pipe.setex.assert_any_call("task:task-1:status", 300, "failed")
+
+
+async def test_fetch_writes_go_out_in_one_pipeline(worker):
+    worker.redis.ttl.return_value = -2
+    worker.redis.get.side_effect = lambda key: b"task-2" if key == "pending_task:user" else None
+
+    await worker.process_task({"task_id": "task-1", "handle": "user"})
+
+    worker.redis.pipeline.assert_called_once_with(transaction=False)
+    worker.pipe.execute.assert_awaited_once()
+    worker.redis.setex.assert_not_called()
+    worker.pipe.setex.assert_any_call("task:task-2:status", 300, "completed")
+    worker.pipe.delete.assert_called_once_with("pending_task:user")
+
+
+async def test_failure_writes_go_out_in_one_pipeline(worker):
+    worker.redis.ttl.return_value = -2
+    worker.cf_client.get_user_submissions.side_effect = RuntimeError("boom")
+
+    await worker.process_task({"task_id": "task-1", "handle": "user"})
+
+    worker.pipe.execute.assert_awaited_once()
+    worker.pipe.setex.assert_any_call("task:task-1:error", 300, "boom")
+    worker.pipe.delete.assert_called_once_with("pending_task:user")
@@ -0,0 +1,39 @@
+"""Unit tests for the worker's RateLimiter."""
+
+import asyncio
+
+import pytest
+
+from backend.worker import main
+from backend.worker.main import RateLimiter
+
+
+@pytest.fixture
+async def sleeps(monkeypatch) -> list[float]:
+    """Freeze the loop clock at 100s and record requested sleeps instead of sleeping."""
+    recorded: list[float] = []
+
+    async def fake_sleep(delay):
+        recorded.append(delay)
+
+    monkeypatch.setattr(asyncio.get_running_loop(), "time", lambda: 100.0)
+    monkeypatch.setattr(main.asyncio, "sleep", fake_sleep)
+    return recorded
+
+
+async def test_full_bucket_allows_burst_without_waiting(sleeps):
+    limiter = RateLimiter(max_requests=5, time_window=1.0)
+
+    for _ in range(5):
+        await limiter.acquire()
+
+    assert sleeps == []
+
+
+async def test_requests_beyond_burst_are_spaced_by_interval(sleeps):
+    limiter = RateLimiter(max_requests=5, time_window=1.0)
+
+    for _ in range(7):
+        await limiter.acquire()
+
+    assert sleeps == pytest.approx([0.2, 0.4])
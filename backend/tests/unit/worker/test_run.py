@@ -0,0 +1,121 @@
+"""Unit tests for the worker's stream consumption."""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from redis.exceptions import ResponseError
+
+from backend.config import Settings
+from backend.worker import main
+from backend.worker.main import Worker
+
+
+@pytest.fixture
+def worker() -> Worker:
+    """Worker with mocked Redis whose process_task stops the loop after one batch."""
+    worker = Worker()
+    worker.redis = AsyncMock()
+    worker.redis.xautoclaim.return_value = [b"0-0", [], []]
+    worker.redis.xreadgroup.return_value = []
+
+    async def process_task(task_data):
+        worker.processed.append(task_data)
+        worker.running = False
+
+    worker.processed = []
+    worker.process_task = process_task
+    return worker
+
+
+async def test_reads_decodes_and_acknowledges_tasks(worker):
+    worker.redis.xreadgroup.return_value = [
+        [b"fetch_stream", [(b"1-0", {b"task_id": b"task-1", b"handle": b"user"})]]
+    ]
+
+    await worker.run()
+
+    assert worker.processed == [{"task_id": "task-1", "handle": "user"}]
+    worker.redis.xreadgroup.assert_awaited_once_with(
+        main.CONSUMER_GROUP,
+        worker.consumer,
+        {"fetch_stream": ">"},
+        count=main.READ_COUNT,
+        block=main.READ_BLOCK_MS,
+    )
+    worker.redis.xack.assert_awaited_once_with("fetch_stream", main.CONSUMER_GROUP, b"1-0")
+
+
+async def test_abandoned_tasks_are_claimed_before_reading_new_ones(worker):
+    worker.redis.xautoclaim.return_value = [
+        b"0-0",
+        [(None, None), (b"1-0", {b"task_id": b"task-1", b"handle": b"user"})],
+        [],
+    ]
+
+    await worker.run()
+
+    assert worker.processed == [{"task_id": "task-1", "handle": "user"}]
+    worker.redis.xreadgroup.assert_not_called()
+    worker.redis.xack.assert_awaited_once_with("fetch_stream", main.CONSUMER_GROUP, b"1-0")
+
+
+async def test_setup_tolerates_existing_consumer_group(monkeypatch):
+    redis = AsyncMock()
+    redis.xgroup_create.side_effect = ResponseError("BUSYGROUP Consumer Group name already exists")
+    monkeypatch.setattr(main, "create_redis_client", AsyncMock(return_value=redis))
+    monkeypatch.setattr(main, "CodeforcesClient", lambda throttle: None)
+
+    await Worker().setup()
+
+    redis.xgroup_create.assert_awaited_once_with(
+        "fetch_stream", main.CONSUMER_GROUP, id="0", mkstream=True
+    )
+
+
+async def test_setup_rate_limits_every_codeforces_request(monkeypatch):
+    monkeypatch.setattr(main, "create_redis_client", AsyncMock(return_value=AsyncMock()))
+    client = Mock()
+    monkeypatch.setattr(main, "CodeforcesClient", client)
+
+    worker = Worker()
+    await worker.setup()
+
+    client.assert_called_once_with(throttle=worker.rate_limiter.acquire)
+
+
+async def test_tasks_of_one_read_run_concurrently_and_fail_independently(worker):
+    worker.redis.xreadgroup.return_value = [
+        [
+            b"fetch_stream",
+            [
+                (b"1-0", {b"task_id": b"task-1", b"handle": b"alice"}),
+                (b"2-0", {b"task_id": b"task-2", b"handle": b"bob"}),
+            ],
+        ]
+    ]
+    started = []
+    both_started = asyncio.Event()
+
+    async def process_task(task_data):
+        started.append(task_data["task_id"])
+        if len(started) == 2:
+            both_started.set()
+        await asyncio.wait_for(both_started.wait(), timeout=1)
+        worker.running = False
+        if task_data["task_id"] == "task-1":
+            raise RuntimeError("boom")
+
+    worker.process_task = process_task
+
+    await worker.run()
+
+    assert started == ["task-1", "task-2"]
+    worker.redis.xack.assert_awaited_once_with("fetch_stream", main.CONSUMER_GROUP, b"2-0")
+
+
+def test_queue_key_from_settings(monkeypatch):
+    settings = Settings(worker_queue_key="custom_stream")
+    monkeypatch.setattr(main, "get_settings", lambda: settings)
+
+    assert Worker().queue_key == "custom_stream"
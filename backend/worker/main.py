@@ -1,17 +1,30 @@
 """Worker process for fetching Codeforces submissions with rate limiting."""
 
 import asyncio
-import json
 import logging
+import os
+import random
 import signal
+import socket
 import sys
 import time
 from typing import Optional
 
+import msgspec
 from redis.asyncio import Redis
+from redis.exceptions import ResponseError
 
+from backend.config import get_settings
+from backend.domain.models.codeforces import Submission
 from backend.infrastructure.codeforces_client import CodeforcesClient, UserNotFoundError
-from backend.infrastructure.redis_client import create_redis_client
+from backend.infrastructure.redis_client import close_redis_pool, create_redis_client
+from backend.infrastructure.submissions_codec import (
+    SUBMISSIONS_TTL,
+    decode_submissions,
+    encode_submissions,
+    sort_newest_first,
+    submissions_age,
+)
 
 # Configure logging
 logging.basicConfig(
@@ -20,12 +33,42 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Cached submissions live SUBMISSIONS_TTL (24h) minus up to 1h of random jitter,
+# spreading out the expiries of handles fetched together. The chosen TTL is stored next
+# to the payload, so readers still derive the true age and the 4h fresh/stale boundary
+# holds.
+SUBMISSIONS_TTL_JITTER = 3600
+
+# Handles Codeforces reports as missing are remembered for about 5 minutes (the API
+# answers them with 404 without enqueueing another fetch)
+NOT_FOUND_TTL = 300
+NOT_FOUND_TTL_JITTER = 30
+
+# Cached submissions older than this are kept on refresh and only newer ones are fetched
+# again; younger ones may still be retested (pretests, hacks, rejudges)
+SETTLED_SUBMISSION_AGE = 2 * 86400
+# Kept submissions are reused for at most this long after the full fetch they came from;
+# then the whole history is fetched again, picking up problem ratings and tags added
+# after a contest and rejudged verdicts
+FULL_FETCH_INTERVAL = 7 * 86400
+
+# Consumer group shared by all workers reading the fetch stream
+CONSUMER_GROUP = "fetchers"
+# Tasks read per XREADGROUP call, processed concurrently (the rate limiter still spaces
+# the Codeforces requests), and how long the call blocks when the stream is empty
+READ_COUNT = 8
+READ_BLOCK_MS = 5000
+# Tasks left unacknowledged this long (their worker died) are claimed by another worker
+CLAIM_IDLE_MS = 5 * 60 * 1000
+
 
 class RateLimiter:
     """
     Token bucket rate limiter.
 
-    Allows max 5 requests per second to Codeforces API.
+    Allows max 5 requests per second to Codeforces API. Implemented as a generic
+    cell rate algorithm: a single theoretical arrival time replaces the token count,
+    so acquiring is plain arithmetic on the event loop's monotonic clock.
     """
 
     def __init__(self, max_requests: int = 5, time_window: float = 1.0):
@@ -38,37 +81,28 @@ class RateLimiter:
         """
         self.max_requests = max_requests
         self.time_window = time_window
-        self.tokens = max_requests
-        self.last_update = time.time()
-        self.lock = asyncio.Lock()
+        self.interval = time_window / max_requests
+        # A full bucket lets max_requests through back to back
+        self.burst_tolerance = (max_requests - 1) * self.interval
+        self._theoretical_arrival = 0.0
 
     async def acquire(self) -> None:
         """
         Acquire a token, blocking if necessary.
 
-        This method will block until a token is available.
+        This method will block until a token is available. The slot is reserved
+        before sleeping; the event loop runs one coroutine at a time, so the
+        read-modify-write of the arrival time needs no lock.
         """
-        async with self.lock:
-            while True:
-                now = time.time()
-                elapsed = now - self.last_update
-
-                # Refill tokens based on elapsed time
-                self.tokens = min(
-                    self.max_requests,
-                    self.tokens + (elapsed * self.max_requests / self.time_window),
-                )
-                self.last_update = now
+        now = asyncio.get_running_loop().time()
+        arrival = max(self._theoretical_arrival, now)
+        self._theoretical_arrival = arrival + self.interval
 
-                if self.tokens >= 1:
-                    self.tokens -= 1
-                    logger.debug(f"Token acquired. Remaining tokens: {self.tokens:.2f}")
-                    return
-
-                # Wait for next token
-                wait_time = (1 - self.tokens) * self.time_window / self.max_requests
-                logger.debug(f"Rate limit reached. Waiting {wait_time:.2f}s")
-                await asyncio.sleep(wait_time)
+        wait_time = arrival - self.burst_tolerance - now
+        # Rounding of the summed intervals can leave a wait of a few ulps; not a real wait
+        if wait_time > 1e-9:
+            logger.debug(f"Rate limit reached. Waiting {wait_time:.2f}s")
+            await asyncio.sleep(wait_time)
 
 
 class Worker:
@@ -83,15 +117,23 @@ class Worker:
         self.redis: Optional[Redis] = None
         self.cf_client: Optional[CodeforcesClient] = None
         self.rate_limiter: Optional[RateLimiter] = None
-        self.queue_key = "fetch_queue"
+        self.queue_key = get_settings().worker_queue_key
+        self.consumer = f"{socket.gethostname()}-{os.getpid()}"
         self.running = True
 
     async def setup(self) -> None:
         """Initialize Redis client, CF client, and rate limiter."""
         logger.info("Setting up worker...")
         self.redis = await create_redis_client()
-        self.cf_client = CodeforcesClient()
         self.rate_limiter = RateLimiter(max_requests=5, time_window=1.0)
+        # Every user.status request takes a token, including a delta's full-fetch fallback
+        self.cf_client = CodeforcesClient(throttle=self.rate_limiter.acquire)
+        try:
+            await self.redis.xgroup_create(self.queue_key, CONSUMER_GROUP, id="0", mkstream=True)
+        except ResponseError as e:
+            # Created by another worker or an earlier run
+            if "BUSYGROUP" not in str(e):
+                raise
         logger.info("Worker setup complete")
 
     async def cleanup(self) -> None:
@@ -100,7 +142,8 @@ class Worker:
         if self.cf_client:
             await self.cf_client.close()
         if self.redis:
-            await self.redis.close()
+            await self.redis.aclose()
+            await close_redis_pool()
         logger.info("Worker cleanup complete")
 
     async def process_task(self, task_data: dict) -> None:
@@ -112,7 +155,6 @@ class Worker:
         """
         assert self.redis is not None, "Redis client not initialized"
         assert self.cf_client is not None, "Codeforces client not initialized"
-        assert self.rate_limiter is not None, "Rate limiter not initialized"
 
         task_id = task_data.get("task_id")
         handle = task_data.get("handle")
@@ -123,71 +165,150 @@ class Worker:
 
         logger.info(f"Processing task {task_id} for handle: {handle}")
 
-        try:
-            # Rate limiting
-            await self.rate_limiter.acquire()
-
-            # Fetch from CF API
-            logger.info(f"Fetching submissions for {handle}")
-            submissions = await self.cf_client.get_user_submissions(handle)
-            logger.info(f"Fetched {len(submissions)} submissions for {handle}")
-
-            # Store in cache (24h TTL)
-            submissions_json = json.dumps([s.to_dict() for s in submissions])
-            await self.redis.setex(f"submissions:{handle}", 86400, submissions_json)
-            logger.info(f"Cached submissions for {handle} (24h TTL)")
-
-            # Update THIS task
-            await self.redis.setex(f"task:{task_id}:status", 300, "completed")
-            await self.redis.setex(
-                f"task:{task_id}:result",
-                300,
-                json.dumps({"handle": handle, "submission_count": len(submissions)}),
-            )
-            logger.info(f"Task {task_id} marked as completed")
+        # Jobs are only enqueued for missing or stale data, so fresh data means a duplicate
+        # job (e.g. one enqueued after the pending_task lock expired) already refreshed it
+        ttl = await self.redis.ttl(f"submissions:{handle}")
+        full_ttl = await self.redis.get(f"submissions_ttl:{handle}") if ttl > 0 else None
+        if ttl > 0 and submissions_age(ttl, full_ttl) < 14400:
+            logger.info(f"Submissions for {handle} already fresh, skipping fetch")
+            current_pending = await self.redis.get(f"pending_task:{handle}")
+            async with self.redis.pipeline(transaction=False) as pipe:
+                pipe.setex(f"task:{task_id}:status", 300, "completed")
+                pipe.setex(
+                    f"task:{task_id}:result",
+                    300,
+                    msgspec.json.encode({"handle": handle, "status": "completed_by_another_task"}),
+                )
+                if current_pending and current_pending.decode() == task_id:
+                    pipe.delete(f"pending_task:{handle}")
+                await pipe.execute()
+            return
 
-            # Check for other pending tasks (deduplication level 3)
+        try:
+            settled, full_fetched_at = await self._load_settled_submissions(handle)
+            since_id = max((submission.id for submission in settled), default=None)
+            if full_fetched_at is None:
+                full_fetched_at = int(time.time())
+
+            # Fetch from CF API only what is newer than the settled cached submissions;
+            # the client's throttle rate limits each request
+            logger.info(f"Fetching submissions for {handle} (since id {since_id})")
+            fetched = await self.cf_client.get_user_submissions(handle, since_id)
+            submissions = fetched + settled
+            # The API's date filter bisects on this order, so it is enforced here
+            sort_newest_first(submissions)
+            logger.info(f"Fetched {len(fetched)} submissions for {handle}")
+
+            # Check for other pending tasks (deduplication level 3); the only read, so
+            # every write below goes out in one round trip
             current_pending = await self.redis.get(f"pending_task:{handle}")
-            if current_pending and current_pending.decode() != task_id:
-                # Update related task
-                other_task_id = current_pending.decode()
-                await self.redis.setex(f"task:{other_task_id}:status", 300, "completed")
-                await self.redis.setex(
-                    f"task:{other_task_id}:result",
+
+            async with self.redis.pipeline(transaction=False) as pipe:
+                # Store in cache (24h TTL, jittered)
+                ttl = SUBMISSIONS_TTL - random.randint(0, SUBMISSIONS_TTL_JITTER)
+                pipe.setex(f"submissions:{handle}", ttl, encode_submissions(submissions))
+                pipe.setex(f"submissions_ttl:{handle}", ttl, ttl)
+                pipe.setex(f"submissions_full_fetch:{handle}", ttl, full_fetched_at)
+
+                # Update THIS task
+                pipe.setex(f"task:{task_id}:status", 300, "completed")
+                pipe.setex(
+                    f"task:{task_id}:result",
                     300,
-                    json.dumps(
-                        {
-                            "handle": handle,
-                            "submission_count": len(submissions),
-                            "completed_by": task_id,
-                        }
-                    ),
+                    msgspec.json.encode({"handle": handle, "submission_count": len(submissions)}),
                 )
-                logger.info(f"Related task {other_task_id} marked as completed")
 
-            # Remove pending_task lock
-            await self.redis.delete(f"pending_task:{handle}")
+                other_task_id = None
+                if current_pending and current_pending.decode() != task_id:
+                    # Update related task
+                    other_task_id = current_pending.decode()
+                    pipe.setex(f"task:{other_task_id}:status", 300, "completed")
+                    pipe.setex(
+                        f"task:{other_task_id}:result",
+                        300,
+                        msgspec.json.encode(
+                            {
+                                "handle": handle,
+                                "submission_count": len(submissions),
+                                "completed_by": task_id,
+                            }
+                        ),
+                    )
+
+                # Remove pending_task lock
+                pipe.delete(f"pending_task:{handle}")
+                await pipe.execute()
+
+            logger.info(f"Cached submissions for {handle} ({ttl}s TTL)")
+            logger.info(f"Task {task_id} marked as completed")
+            if other_task_id:
+                logger.info(f"Related task {other_task_id} marked as completed")
             logger.info(f"Removed pending_task lock for {handle}")
 
         except UserNotFoundError:
             logger.warning(f"User not found: {handle}")
-            await self.redis.setex(f"task:{task_id}:status", 300, "failed")
-            await self.redis.setex(
-                f"task:{task_id}:error", 300, f"User '{handle}' not found on Codeforces"
-            )
-            await self.redis.delete(f"pending_task:{handle}")
+            async with self.redis.pipeline(transaction=False) as pipe:
+                pipe.setex(
+                    f"notfound:{handle}",
+                    NOT_FOUND_TTL + random.randint(-NOT_FOUND_TTL_JITTER, NOT_FOUND_TTL_JITTER),
+                    "1",
+                )
+                pipe.setex(f"task:{task_id}:status", 300, "failed")
+                pipe.setex(f"task:{task_id}:error", 300, f"User '{handle}' not found on Codeforces")
+                pipe.delete(f"pending_task:{handle}")
+                await pipe.execute()
 
         except Exception as e:
             logger.error(f"Error processing task {task_id}: {e}", exc_info=True)
-            await self.redis.setex(f"task:{task_id}:status", 300, "failed")
-            await self.redis.setex(f"task:{task_id}:error", 300, str(e))
-            await self.redis.delete(f"pending_task:{handle}")
+            async with self.redis.pipeline(transaction=False) as pipe:
+                pipe.setex(f"task:{task_id}:status", 300, "failed")
+                pipe.setex(f"task:{task_id}:error", 300, str(e))
+                pipe.delete(f"pending_task:{handle}")
+                await pipe.execute()
+
+    async def _load_settled_submissions(self, handle: str) -> tuple[list[Submission], int | None]:
+        """
+        Load the cached submissions of handle whose verdicts are settled.
+
+        Nothing is reused once the full fetch the cache goes back to is older than
+        FULL_FETCH_INTERVAL, so the next fetch is a full one.
+
+        Args:
+            handle: Codeforces handle
+
+        Returns:
+            Tuple of (cached submissions older than SETTLED_SUBMISSION_AGE, newest
+            first; time of the full fetch they come from), or ([], None) if nothing
+            usable is cached
+        """
+        assert self.redis is not None, "Redis client not initialized"
+
+        payload, full_fetched_at = await self.redis.mget(
+            f"submissions:{handle}", f"submissions_full_fetch:{handle}"
+        )
+        now = time.time()
+        # Entries written before the full fetch time was stored are fetched in full
+        if not payload or not full_fetched_at:
+            return [], None
+        if now - int(full_fetched_at) > FULL_FETCH_INTERVAL:
+            return [], None
+
+        submissions = decode_submissions(payload)
+        if not submissions:
+            return [], None
+
+        cutoff = now - SETTLED_SUBMISSION_AGE
+        settled = [s for s in submissions if s.creation_time_seconds <= cutoff]
+        return settled, int(full_fetched_at) if settled else None
 
     async def run(self) -> None:
         """
         Main worker loop.
 
-        Continuously polls Redis queue for tasks.
+        Reads tasks from the fetch stream through the consumer group, processes the
+        tasks of one read concurrently and acknowledges each one once processed.
+        The next read starts only once the whole batch is done. Tasks a crashed
+        worker left unacknowledged are claimed again after CLAIM_IDLE_MS.
         """
         assert self.redis is not None, "Redis client not initialized"
 
@@ -195,17 +316,32 @@ class Worker:
 
         while self.running:
             try:
-                # BLPOP: blocking left pop with timeout
-                result = await self.redis.blpop([self.queue_key], timeout=5)  # type: ignore[misc]
-
-                if result:
-                    _, task_json = result
-                    task_data = json.loads(task_json)
-                    await self.process_task(task_data)
-                else:
+                entries = await self._claim_abandoned_tasks()
+                if not entries:
+                    # XREADGROUP: blocking read of tasks never delivered to a worker
+                    reply = await self.redis.xreadgroup(
+                        CONSUMER_GROUP,
+                        self.consumer,
+                        {self.queue_key: ">"},
+                        count=READ_COUNT,
+                        block=READ_BLOCK_MS,
+                    )
+                    entries = reply[0][1] if reply else []
+
+                if not entries:
                     # Timeout - continue loop
                     logger.debug("No tasks in queue, waiting...")
 
+                # Redis round trips of one task overlap with another's fetch
+                results = await asyncio.gather(
+                    *(self._process_entry(entry_id, fields) for entry_id, fields in entries),
+                    return_exceptions=True,
+                )
+                for error in results:
+                    if isinstance(error, Exception):
+                        # Left unacknowledged, so it is claimed again after CLAIM_IDLE_MS
+                        logger.error(f"Error in worker loop: {error}", exc_info=error)
+
             except asyncio.CancelledError:
                 logger.info("Worker cancelled")
                 break
@@ -215,6 +351,40 @@ class Worker:
 
         logger.info("Worker stopped")
 
+    async def _process_entry(self, entry_id: bytes, fields: dict[bytes, bytes]) -> None:
+        """
+        Process one stream entry and acknowledge it.
+
+        Args:
+            entry_id: Stream entry ID
+            fields: Raw task fields
+        """
+        assert self.redis is not None, "Redis client not initialized"
+
+        task_data = {key.decode(): value.decode() for key, value in fields.items()}
+        await self.process_task(task_data)
+        await self.redis.xack(self.queue_key, CONSUMER_GROUP, entry_id)
+
+    async def _claim_abandoned_tasks(self) -> list:
+        """
+        Claim tasks that stayed unacknowledged for CLAIM_IDLE_MS.
+
+        Returns:
+            Claimed stream entries as (entry_id, fields) pairs
+        """
+        assert self.redis is not None, "Redis client not initialized"
+
+        reply = await self.redis.xautoclaim(
+            self.queue_key,
+            CONSUMER_GROUP,
+            self.consumer,
+            min_idle_time=CLAIM_IDLE_MS,
+            start_id="0-0",
+            count=READ_COUNT,
+        )
+        # Entries deleted from the stream meanwhile are returned as None
+        return [entry for entry in reply[1] if entry[1]]
+
     def stop(self) -> None:
         """Signal worker to stop."""
         logger.info("Stop signal received")
@@ -248,4 +418,10 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    try:
+        # Installed with uvicorn[standard] except on Windows
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        asyncio.run(main(), loop_factory=uvloop.new_event_loop)